@@ -0,0 +1,173 @@
+"""
+Startup import budget.
+
+Imports script.py in fresh interpreters under `python -X importtime` and
+reports how many modules get loaded and how long that takes, compared
+against a stored JSON baseline. Fails when startup imports grow: more
+modules than the baseline, a slower median import, or any module that
+should only be loaded on demand (pygame, the Pi's hardware libraries, the
+minigames).
+
+usage: python -m benchmarks.imports [--runs 5] [--target script] [--save]
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline_imports.json")
+DEFAULT_RUNS = 5
+DEFAULT_TARGET = "script"
+DEFAULT_TOLERANCE = 0.25   # relative slowdown that counts as a regression
+MIN_SLACK_MS = 10.0        # ignore timing noise below this many ms
+TOP_MODULES = 10
+
+# Loaded when a backend or screen needs them, never at startup
+LAZY_PREFIXES = ("pygame", "pygamestuff", "RPi", "rgbmatrix", "RGBMatrixEmulator", "gpiozero",
+                 "core.minigames.")
+LAZY_EXCEPTIONS = ("core.minigames.registry",)
+FIRST_PARTY = ("script", "core", "utils", "pygamestuff")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def measure_once(target):
+    """
+    Import target in a fresh interpreter.
+
+    Returns:
+        list: (module, self_us, cumulative_us) for every module imported, in order.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True,
+    ).stderr
+    modules = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def is_lazy(name):
+    # "pkg" covers the package and its submodules, "pkg." only the submodules.
+    if name in LAZY_EXCEPTIONS:
+        return False
+    return any(name.startswith(prefix) if prefix.endswith(".") else name == prefix or name.startswith(prefix + ".")
+               for prefix in LAZY_PREFIXES)
+
+
+def benchmark(target, runs):
+    """
+    Median import cost of target over several fresh interpreters.
+    """
+    measure_once(target)  # Fill __pycache__ so compiling does not count
+    samples = [measure_once(target) for _ in range(runs)]
+
+    totals = [sum(self_us for _, self_us, _ in modules) / 1000 for modules in samples]
+    first_party = [
+        sum(self_us for name, self_us, _ in modules if name.split(".")[0] in FIRST_PARTY) / 1000
+        for modules in samples
+    ]
+    cumulative = {}
+    for modules in samples:
+        for name, _, cumulative_us in modules:
+            cumulative.setdefault(name, []).append(cumulative_us / 1000)
+    names = [name for name, _, _ in samples[-1]]
+    heaviest = sorted(
+        ((name, round(float(np.median(times)), 2)) for name, times in cumulative.items()
+         if name.split(".")[0] in FIRST_PARTY and len(times) == runs),
+        key=lambda item: -item[1],
+    )[:TOP_MODULES]
+
+    return {
+        "target": target,
+        "runs": runs,
+        "modules": len(names),
+        "total_ms": round(float(np.median(totals)), 2),
+        "first_party_ms": round(float(np.median(first_party)), 2),
+        "lazy_loaded": sorted(name for name in names if is_lazy(name)),
+        "heaviest": heaviest,
+    }
+
+
+def compare(result, baseline, tolerance):
+    """
+    Compare a result against the baseline, and check nothing lazy was imported.
+
+    Returns:
+        list: Human-readable descriptions of every regression found.
+    """
+    regressions = [f"{name} imported at startup" for name in result["lazy_loaded"]]
+    if baseline.get("target") != result["target"]:
+        return regressions
+    if result["modules"] > baseline["modules"]:
+        regressions.append(f"modules {result['modules']} > {baseline['modules']}")
+    limit = max(baseline["total_ms"] * (1 + tolerance), baseline["total_ms"] + MIN_SLACK_MS)
+    if result["total_ms"] > limit:
+        regressions.append(f"total_ms {result['total_ms']:.1f} > {baseline['total_ms']:.1f}")
+    return regressions
+
+
+def print_report(result, baseline):
+    def with_base(key, fmt):
+        cell = format(result[key], fmt)
+        if key in baseline:
+            cell += f" ({format(baseline[key], fmt)})"
+        return cell
+
+    print(f"import {result['target']}: median of {result['runs']} fresh interpreters")
+    print(f"  modules         {with_base('modules', 'd')}")
+    print(f"  total_ms        {with_base('total_ms', '.1f')}")
+    print(f"  first_party_ms  {with_base('first_party_ms', '.1f')}")
+    print("  heaviest first-party imports (cumulative ms):")
+    for name, ms in result["heaviest"]:
+        print(f"    {name:<32}{ms:>8.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup import budget.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Fresh interpreters to take the median of.")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="Module to import.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file.")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before the import counts as regressed.")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    result = benchmark(args.target, args.runs)
+    print_report(result, baseline)
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "machine": platform.machine(),
+                "python": platform.python_version(),
+                **result,
+            }, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(result, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
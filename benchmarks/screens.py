@@ -0,0 +1,349 @@
+"""
+Per-screen frame-cost benchmark.
+
+Drives every screen of script.py for N frames on the headless backend with
+scripted button presses and a virtual clock, then reports ms/frame
+percentiles, allocations per frame and PIL calls per frame, compared against
+a stored JSON baseline.
+
+With --backend emulator the frames go through script.get_matrix() and the
+threaded presenter into the rgbmatrix emulator instead, i.e. the exact
+production presentation path, and the emulated panel's throughput is
+reported too.
+
+usage: python -m benchmarks.screens [--frames 200] [--screens home,job] [--backend emulator] [--save]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PIL
+from core.graphics import Graphics
+from core.headless import NullMatrix, ScriptedControls, NullAudio
+from core.states import States
+from core.stats import Stats
+from utils.constants import HEADLESS, RASPBERRYPI
+from utils.logger import logger, WARNING
+import script
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATHS = {
+    "headless": os.path.join(BENCHMARK_DIR, "baseline.json"),
+    "emulator": os.path.join(BENCHMARK_DIR, "baseline_emulator.json"),
+}
+DEFAULT_FRAMES = 200
+WARMUP_FRAMES = 10
+DEFAULT_TOLERANCE = 0.25   # relative slowdown that counts as a regression
+MIN_SLACK_MS = 0.2         # ignore timing noise below this many ms
+PIL_DIR = os.path.dirname(PIL.__file__)
+
+
+def every(period, button, offset=0):
+    """Script that presses a button once every `period` frames."""
+    return lambda frame: (button,) if frame % period == offset else ()
+
+
+def cycle(period, buttons):
+    """Script that presses each of the buttons in turn, one every `period` frames."""
+    return lambda frame: (buttons[(frame // period) % len(buttons)],) if frame % period == 0 else ()
+
+
+def combine(*scripts):
+    return lambda frame: tuple(button for s in scripts for button in s(frame))
+
+
+def enter(screen):
+    def setup(graphics, states, stats):
+        states.transition_to_screen(screen)
+    return setup
+
+
+def enter_end(graphics, states, stats):
+    states.transition_to_screen("end_screen")
+    states.transition_to_life_stage("dead")
+    graphics.start_end_animation("lose", "food", states.get_sprite_folder())
+    graphics.end_baker.join()  # measure playback of the prerendered clip, not the live fallback
+
+
+# name -> (screen to hold, setup, scripted input)
+SCENARIOS = {
+    "home": ("home_screen", enter("home_screen"), every(10, "right")),
+    "stats": ("stats_screen", enter("stats_screen"), lambda frame: ()),
+    "education": ("education_screen", enter("education_screen"),
+                  combine(every(10, "right"), lambda frame: ("center",) if frame == 45 else ())),
+    "social": ("socialize_screen", enter("socialize_screen"), combine(every(15, "right"), every(30, "center", 7))),
+    "food": ("food_screen", enter("food_screen"), combine(every(3, "right"), every(20, "center", 1))),
+    "hobby": ("hobby_screen", enter("hobby_screen"), cycle(5, ["center", "right"])),
+    "job": ("job_screen", enter("job_screen"), cycle(12, ["left", "center", "right"])),
+    "housing": ("housing_screen", enter("housing_screen"), combine(every(20, "right"), every(50, "center", 3))),
+    "end": ("end_screen", enter_end, lambda frame: ()),
+}
+
+
+class VirtualClock:
+    """
+    Replaces time.time so every benchmark run sees the same timeline,
+    advancing one game tick per frame regardless of how long frames take.
+    """
+
+    def __init__(self, start=1_000_000.0, step=1.0 / script.FPS):
+        self.now = start
+        self.step = step
+        self.real_time = time.time
+
+    def __call__(self):
+        return self.now
+
+    def tick(self):
+        self.now += self.step
+
+    def __enter__(self):
+        time.time = self
+        return self
+
+    def __exit__(self, *exc):
+        time.time = self.real_time
+
+
+class PILCallCounter:
+    """
+    Counts calls into PIL made from outside PIL (nested PIL internals are not counted).
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def _profile(self, frame, event, arg):
+        if event == "call" and frame.f_code.co_filename.startswith(PIL_DIR):
+            caller = frame.f_back
+            if caller is None or not caller.f_code.co_filename.startswith(PIL_DIR):
+                self.calls += 1
+
+    def __enter__(self):
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(None)
+
+
+def new_game(name, backend):
+    """
+    Build a game on the given backend, positioned on the scenario's screen.
+    """
+    screen, setup, inputs = SCENARIOS[name]
+    random.seed(name)
+    if backend == "emulator":
+        os.environ["RGBMATRIX_EMULATOR"] = "1"  # script.get_matrix() then builds the emulated panel
+        graphics = Graphics(script.get_matrix(), script.MATRIX_WIDTH, script.MATRIX_HEIGHT, 1, platform=RASPBERRYPI)
+    else:
+        graphics = Graphics(NullMatrix(script.MATRIX_WIDTH, script.MATRIX_HEIGHT),
+                            script.MATRIX_WIDTH, script.MATRIX_HEIGHT, 1, platform=HEADLESS)
+    states = States()
+    stats = Stats()
+    states.transition_to_life_stage("adult")
+    graphics.set_sprites(graphics.load_sprites(states.get_sprite_folder()))
+    setup(graphics, states, stats)
+    return graphics, states, stats, ScriptedControls(inputs), NullAudio()
+
+
+def run_scenario(name, frames, measure, backend="headless"):
+    """
+    Run one scenario for `frames` frames, calling measure(step) around each frame.
+
+    The game is set up again whenever it leaves the screen under test, so every
+    measured frame belongs to that screen.
+
+    Returns:
+        list: The matrix of every game that was played.
+    """
+    screen = SCENARIOS[name][0]
+    matrices = []
+    with VirtualClock() as clock:
+        game = new_game(name, backend)
+        matrices.append(game[0].matrix)
+        for frame in range(WARMUP_FRAMES + frames):
+            graphics, states, stats, controls, audio = game
+
+            def step():
+                result = script.run_frame(graphics, states, stats, controls, audio)
+                graphics.render_to_matrix()
+                return result
+
+            measured = frame >= WARMUP_FRAMES
+            result = measure(step) if measured else step()
+            clock.tick()
+            if result == "dead" or states.current_screen != screen:
+                graphics.shutdown()
+                game = new_game(name, backend)
+                matrices.append(game[0].matrix)
+                # Keep the input script running from where it was.
+                game[3].frame = controls.frame
+        game[0].shutdown()
+    return matrices
+
+
+def benchmark(name, frames, backend="headless"):
+    """
+    Measure one screen: a timing pass, then an instrumented pass for
+    allocations and PIL calls so the instrumentation does not skew timings.
+    """
+    timings = []
+
+    def timed(step):
+        start = time.perf_counter()
+        result = step()
+        timings.append((time.perf_counter() - start) * 1000)
+        return result
+
+    matrices = run_scenario(name, frames, timed, backend)
+
+    allocations = []
+    counter = PILCallCounter()
+    pil_calls = []
+
+    def instrumented(step):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        calls = counter.calls
+        with counter:
+            result = step()
+        pil_calls.append(counter.calls - calls)
+        allocations.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+        return result
+
+    tracemalloc.start()
+    try:
+        run_scenario(name, frames, instrumented, backend)
+    finally:
+        tracemalloc.stop()
+
+    timings = np.array(timings)
+    result = {
+        "frames": frames,
+        "mean_ms": round(float(timings.mean()), 3),
+        "p50_ms": round(float(np.percentile(timings, 50)), 3),
+        "p95_ms": round(float(np.percentile(timings, 95)), 3),
+        "p99_ms": round(float(np.percentile(timings, 99)), 3),
+        "max_ms": round(float(timings.max()), 3),
+        "alloc_kb_per_frame": round(float(np.mean(allocations)), 2),
+        "pil_calls_per_frame": round(float(np.mean(pil_calls)), 2),
+    }
+    if backend == "emulator":
+        panel = [matrix.stats() for matrix in matrices]
+        pushes = sum(stats["pushes"] for stats in panel)
+        result["panel_pushes_per_frame"] = round(pushes / frames, 3)
+        result["panel_push_ms"] = round(
+            sum(stats["mean_push_ms"] * stats["pushes"] for stats in panel) / pushes if pushes else 0.0, 4
+        )
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results against a baseline.
+
+    Returns:
+        list: Human-readable descriptions of every regression found.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("screens", {}).get(name)
+        if base is None or base["frames"] != result["frames"]:
+            # Scripted inputs make runs of different lengths cover different frames.
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            limit = max(base[key] * (1 + tolerance), base[key] + MIN_SLACK_MS)
+            if result[key] > limit:
+                regressions.append(f"{name}: {key} {result[key]:.3f} > {base[key]:.3f}")
+        for key in ("alloc_kb_per_frame", "pil_calls_per_frame"):
+            if result[key] > base[key] * (1 + tolerance) + 0.5:
+                regressions.append(f"{name}: {key} {result[key]:.2f} > {base[key]:.2f}")
+    return regressions
+
+
+def print_table(results, baseline):
+    columns = ("p50_ms", "p95_ms", "p99_ms", "alloc_kb_per_frame", "pil_calls_per_frame")
+    if any("panel_push_ms" in result for result in results.values()):
+        columns += ("panel_pushes_per_frame", "panel_push_ms")
+    print(f"{'screen':<10}" + "".join(f"{c:>24}" for c in columns))
+    for name, result in results.items():
+        base = baseline.get("screens", {}).get(name, {})
+        row = f"{name:<10}"
+        for column in columns:
+            cell = f"{result[column]:.2f}"
+            if column in base:
+                cell += f" ({base[column]:.2f})"
+            row += f"{cell:>24}"
+        print(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-screen frame-cost benchmark.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Measured frames per screen.")
+    parser.add_argument("--screens", default=",".join(SCENARIOS), help="Comma-separated screens to run.")
+    parser.add_argument("--backend", choices=sorted(BASELINE_PATHS), default="headless",
+                        help="Render into memory, or through get_matrix() into the rgbmatrix emulator.")
+    parser.add_argument("--baseline", help="Baseline JSON file (defaults to one per backend).")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before a screen counts as regressed.")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.screens.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown screens: {', '.join(unknown)}")
+
+    baseline_path = args.baseline or BASELINE_PATHS[args.backend]
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        if baseline.get("backend", "headless") != args.backend:
+            print(f"Ignoring {baseline_path}: it was recorded on the {baseline.get('backend')} backend")
+            baseline = {}
+
+    # Keep the report readable: game logging is flushed in the background, and a few prints remain.
+    logger.set_level(WARNING)
+    results = {}
+    real_stdout = sys.stdout
+    for name in names:
+        sys.stdout = open(os.devnull, "w")
+        try:
+            results[name] = benchmark(name, args.frames, args.backend)
+        finally:
+            sys.stdout.close()
+            sys.stdout = real_stdout
+
+    print_table(results, baseline)
+
+    if args.save:
+        with open(baseline_path, "w") as f:
+            json.dump({
+                "backend": args.backend,
+                "machine": platform.machine(),
+                "python": platform.python_version(),
+                "screens": results,
+            }, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,174 @@
 import RPi.GPIO as GPIO
 import threading
 import time
+from collections import deque
+from utils.constants import SOUND_MAP
+from utils.logger import get_logger
+
+log = get_logger("audio")
+
+# Feedback for a single action < results < end of the game
+UI, RESULT, GAME = 0, 1, 2
+SOUND_PRIORITIES = {
+    'click': UI,
+    'noteHit': UI,
+    'noteMiss': UI,
+    'jump': UI,
+    'workElement': UI,
+    'statLow': RESULT,
+    'success': RESULT,
+    'failure': RESULT,
+    'suitcaseOpen': RESULT,
+    'happy': RESULT,
+    'sad': RESULT,
+    'gameWin': GAME,
+    'gameLose': GAME,
+}
+
+NOTE_DURATION = 0.15
+QUEUE_SIZE = 4              # sounds waiting behind the one playing
+MAX_WAIT_SECONDS = 0.3      # UI feedback older than this is no longer worth playing
+LATENCY_SAMPLES = 256       # recent queue waits kept for the metrics
+
 
 class AudioManager:
+    """
+    Buzzer sounds played by a single sequencer thread.
+
+    play_sound() only queues the sound and returns. One long-lived thread
+    plays the queue on the PWM pin, highest priority first, then oldest
+    first. A sound of higher priority interrupts a lower one that is playing
+    and drops the lower ones still queued (a click is stale once gameLose
+    starts). When the queue is full, the oldest sound of the lowest priority
+    makes room, unless the new sound ranks below everything queued. UI
+    sounds that waited longer than MAX_WAIT_SECONDS are skipped. stats()
+    reports queue depth, waits and what was dropped.
+    """
+
     def __init__(self, buzzer_pin=2):
         self.buzzer_pin = buzzer_pin
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self.buzzer_pin, GPIO.OUT)
         self.pwm = GPIO.PWM(self.buzzer_pin, 440)
-        self.lock = threading.Lock()
 
-    def _play_notes(self, frequencies, duration=0.15):
-        with self.lock:
-            self.pwm.start(50)
+        self.condition = threading.Condition()
+        self.queue = []               # (priority, enqueued_at, sound_type, notes)
+        self.playing_priority = None  # Priority of the sound on the buzzer, if any
+        self.interrupt = False
+        self.running = True
+
+        self.enqueued = 0
+        self.played = 0
+        self.interrupted = 0
+        self.dropped = {"full": 0, "superseded": 0, "stale": 0}
+        self.max_depth = 0
+        self.waits = deque(maxlen=LATENCY_SAMPLES)
+
+        self.thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self.thread.start()
+
+    def play_sound(self, sound_type):
+        """
+        Queue a sound; never blocks on the buzzer.
+
+        Args:
+            sound_type (str): A key of SOUND_MAP.
+        """
+        notes = SOUND_MAP.get(sound_type)
+        if notes is None:
+            log.warning("Unknown sound type: %s", sound_type)
+            return
+        priority = SOUND_PRIORITIES.get(sound_type, UI)
+        with self.condition:
+            self.enqueued += 1
+            # Lower-priority sounds would only play after this one, when they are stale.
+            kept = [entry for entry in self.queue if entry[0] >= priority]
+            self.dropped["superseded"] += len(self.queue) - len(kept)
+            self.queue = kept
+            if self.playing_priority is not None and self.playing_priority < priority:
+                self.interrupt = True
+
+            if len(self.queue) >= QUEUE_SIZE:
+                victim = min(self.queue, key=lambda entry: (entry[0], entry[1]))
+                self.dropped["full"] += 1
+                if victim[0] > priority:
+                    return  # Everything queued matters more; drop the new sound
+                self.queue.remove(victim)
+
+            self.queue.append((priority, time.monotonic(), sound_type, notes))
+            self.max_depth = max(self.max_depth, len(self.queue))
+            self.condition.notify()
+
+    def _next(self):
+        # Called with the condition held: highest priority, then oldest.
+        while self.running:
+            while self.queue:
+                entry = max(self.queue, key=lambda entry: (entry[0], -entry[1]))
+                self.queue.remove(entry)
+                priority, enqueued_at, sound_type, notes = entry
+                wait = time.monotonic() - enqueued_at
+                if priority == UI and wait > MAX_WAIT_SECONDS:
+                    self.dropped["stale"] += 1
+                    continue
+                self.waits.append(wait)
+                self.playing_priority = priority
+                self.interrupt = False
+                return notes
+            self.condition.wait()
+        return None
+
+    def _run(self):
+        while True:
+            with self.condition:
+                notes = self._next()
+            if notes is None:
+                return
+            completed = self._play_notes(notes)
+            with self.condition:
+                self.playing_priority = None
+                if completed:
+                    self.played += 1
+
+    def _play_notes(self, frequencies, duration=NOTE_DURATION):
+        self.pwm.start(50)
+        try:
             for freq in frequencies:
                 self.pwm.ChangeFrequency(freq)
-                time.sleep(duration)
+                with self.condition:
+                    # Waiting on the condition lets a more important sound cut the note short.
+                    if self.condition.wait_for(lambda: self.interrupt or not self.running, timeout=duration):
+                        self.interrupted += 1
+                        return False
+            return True
+        finally:
             self.pwm.stop()
 
-    def play_sound(self, sound_type):
-        sound_map = {
-            'click': [600],
-            'noteHit': [800],
-            'noteMiss': [400],
-            'jump': [400, 700],
-            'workElement': [300, 500],
-            'statLow': [330, 250],
-            'success': [600, 800, 1000],
-            'failure': [400, 300, 200],
-            'gameWin': [523, 587, 659, 784],
-            'gameLose': [659, 587, 523, 400],
-            'suitcaseOpen': [300, 600, 300, 600],
-            'happy': [523, 659, 784],
-            'sad': [784, 659, 523]
-        }
-
-        if sound_type in sound_map:
-            threading.Thread(target=self._play_notes, args=(sound_map[sound_type],)).start()
+    def stats(self):
+        """
+        Queue and playback metrics.
+
+        Returns:
+            dict: Counts of queued, played, interrupted and dropped sounds, the current and
+                deepest queue, and the wait before playback in ms over the last LATENCY_SAMPLES.
+        """
+        with self.condition:
+            waits = sorted(self.waits)
+            return {
+                "enqueued": self.enqueued,
+                "played": self.played,
+                "interrupted": self.interrupted,
+                "dropped": dict(self.dropped),
+                "depth": len(self.queue),
+                "max_depth": self.max_depth,
+                "mean_wait_ms": round(sum(waits) * 1000 / len(waits), 1) if waits else 0.0,
+                "p95_wait_ms": round(waits[int(len(waits) * 0.95)] * 1000, 1) if waits else 0.0,
+                "max_wait_ms": round(waits[-1] * 1000, 1) if waits else 0.0,
+            }
 
     def cleanup(self):
+        with self.condition:
+            self.running = False
+            self.queue = []
+            self.condition.notify_all()
+        self.thread.join(timeout=1.0)
         GPIO.cleanup()
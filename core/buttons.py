@@ -0,0 +1,7 @@
+from collections import namedtuple
+
+# One edge seen on a button, stamped with time.monotonic_ns() when it happened.
+ButtonEvent = namedtuple("ButtonEvent", ["button", "edge", "timestamp_ns"])
+PRESS = "press"
+RELEASE = "release"
+BUTTONS = ("left", "center", "right")
@@ -0,0 +1,62 @@
+import numpy as np
+
+
+class AnimationClip:
+    """
+    A prerendered animation: the distinct frames plus, for every tick, which
+    of them to show.
+
+    Identical frames (e.g. a caption held for seconds) are stored once, so a
+    clip costs one frame of memory per distinct image rather than per tick.
+    """
+
+    def __init__(self, frames, index, fps):
+        self.frames = frames  # N x H x W x 3 uint8, distinct frames only
+        self.index = index    # uint16 frame number for every tick
+        self.fps = fps
+
+    @classmethod
+    def bake(cls, render, capture, duration, fps):
+        """
+        Render an animation tick by tick.
+
+        Args:
+            render (callable): render(elapsed) draws the frame for that time.
+            capture (callable): Returns the HxWx3 array render() drew into.
+            duration (float): Length of the animation in seconds.
+            fps (int): Ticks per second to sample at.
+        """
+        frames = []
+        seen = {}
+        index = []
+        for tick in range(int(duration * fps) + 1):
+            render(tick / fps)
+            pixels = capture()
+            key = pixels.tobytes()
+            frame_number = seen.get(key)
+            if frame_number is None:
+                frame_number = len(frames)
+                seen[key] = frame_number
+                frames.append(pixels.copy())
+            index.append(frame_number)
+        return cls(np.stack(frames), np.array(index, dtype=np.uint16), fps)
+
+    def frame_at(self, elapsed):
+        """
+        The frame to show after elapsed seconds, or None once the clip is over.
+        """
+        tick = int(elapsed * self.fps)
+        if tick < 0 or tick >= len(self.index):
+            return None
+        return self.frames[self.index[tick]]
+
+    @property
+    def nbytes(self):
+        return self.frames.nbytes + self.index.nbytes
+
+    def stats(self):
+        return {
+            "ticks": len(self.index),
+            "frames": len(self.frames),
+            "bytes": self.nbytes,
+        }
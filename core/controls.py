@@ -1,63 +1,138 @@
 import RPi.GPIO as GPIO
 import time
+from collections import deque
+from core.buttons import ButtonEvent, PRESS, RELEASE
+from utils.logger import get_logger
+
+log = get_logger("controls")
+
+EVENT_QUEUE_SIZE = 64   # edges buffered between two frames
+EDGE_BOUNCE_MS = 5      # hardware debounce applied by RPi.GPIO to each edge
+TAP_GAP_MS = 30         # a lone release this soon after the previous one is contact bounce, not a tap
+
 
 class Controls:
+    """
+    Edge-triggered button input.
+
+    GPIO.add_event_detect callbacks run on RPi.GPIO's own thread and append
+    (button, edge, monotonic_ns) events to a deque; appends and pops on a
+    deque are atomic, so no lock is needed. handle_input() drains the queue
+    once per frame, so a press is never lost even if it started and ended
+    between two frames. left_button/center_button/right_button keep their
+    per-frame meaning, and held buttons still repeat every debounce_interval
+    like the old polling loop did. The exact press times of the frame are in
+    `events` and pressed_at().
+
+    RPi.GPIO allows one callback per pin, so the edge direction is read
+    from the pin inside the callback. A tap shorter than the callback
+    latency therefore arrives as a lone release; handle_input() counts that
+    as a press followed by a release, stamped at the release.
+    """
+
     def __init__(self):
         GPIO.cleanup()  # clear any previous pin state
-        print("Initializing GPIO for Controls...")
+        log.info("Initializing GPIO for Controls...")
         GPIO.setmode(GPIO.BCM)
         GPIO.setwarnings(False)
 
         self.left_pin = 24
         self.center_pin = 19
         self.right_pin = 25
-
-        GPIO.setup(self.left_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-        GPIO.setup(self.right_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-        GPIO.setup(self.center_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        self.pins = {self.left_pin: "left", self.center_pin: "center", self.right_pin: "right"}
 
         self.left_button = False
         self.right_button = False
         self.center_button = False
 
-        self.debounce_interval = 0.2  # seconds
-        self.last_press_left = 0
-        self.last_press_right = 0
-        self.last_press_center = 0
+        self.debounce_interval = 0.2  # seconds between repeats while a button is held
+        self.queue = deque(maxlen=EVENT_QUEUE_SIZE)
+        self.events = []  # Events handled on the current frame
+        self.held = {button: False for button in self.pins.values()}
+        self.last_press_ns = {button: 0 for button in self.pins.values()}
+        self.last_release_ns = {button: 0 for button in self.pins.values()}
+
+        for pin in self.pins:
+            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            GPIO.add_event_detect(pin, GPIO.BOTH, callback=self._on_edge, bouncetime=EDGE_BOUNCE_MS)
+
+        log.info("GPIO fully initialized from Controls.")
 
-        print("GPIO fully initialized from Controls.")
+    def _on_edge(self, channel):
+        # Runs on the GPIO thread: stamp the edge and hand it over, nothing else.
+        edge = PRESS if GPIO.input(channel) == GPIO.LOW else RELEASE
+        self.queue.append(ButtonEvent(self.pins[channel], edge, time.monotonic_ns()))
 
     def handle_input(self):
-        now = time.time()
-
-        left_state = GPIO.input(self.left_pin)
-        right_state = GPIO.input(self.right_pin)
-        center_state = GPIO.input(self.center_pin)
-
-        # print(f"RAW STATES: LEFT={left_state}, RIGHT={right_state}, CENTER={center_state}")
-        print(f"RAW STATES: LEFT={GPIO.input(24)}, CENTER={GPIO.input(19)}, RIGHT={GPIO.input(25)}")
-    
-
-        # LEFT
-        if left_state == GPIO.LOW and (now - self.last_press_left > self.debounce_interval):
-            self.left_button = True
-            self.last_press_left = now
-            print("LEFT pressed")
-        else:
-            self.left_button = False
-
-        # RIGHT
-        if right_state == GPIO.LOW and (now - self.last_press_right > self.debounce_interval):
-            self.right_button = True
-            self.last_press_right = now
-            print("RIGHT pressed")
-        else:
-            self.right_button = False
-
-        # CENTER
-        if center_state == GPIO.LOW and (now - self.last_press_center > self.debounce_interval):
-            self.center_button = True
-            self.last_press_center = now
-            print("CENTER pressed")
-        else:
-            self.center_button = False
+        """
+        Drain the edges queued since the last frame and update the button flags.
+        """
+        now_ns = time.monotonic_ns()
+        pressed = {button: False for button in self.held}
+        self.events = []
+
+        while self.queue:
+            event = self.queue.popleft()
+            button = event.button
+            if event.edge == PRESS:
+                if self.held[button]:
+                    continue  # Repeated edge without a release in between
+                self.held[button] = True
+                self.last_press_ns[button] = event.timestamp_ns
+                pressed[button] = True
+                log.debug("%s pressed", button.upper())
+            else:
+                if not self.held[button]:
+                    # The pin was already high when the callback read it: a short tap, unless it is bounce.
+                    if event.timestamp_ns - self.last_release_ns[button] < TAP_GAP_MS * 1_000_000:
+                        continue
+                    if not pressed[button]:
+                        pressed[button] = True
+                        self.last_press_ns[button] = event.timestamp_ns
+                        self.events.append(ButtonEvent(button, PRESS, event.timestamp_ns))
+                        log.debug("%s tapped", button.upper())
+                self.held[button] = False
+                self.last_release_ns[button] = event.timestamp_ns
+            self.events.append(event)
+
+        # Auto-repeat held buttons, checking the pin in case a release edge was missed.
+        repeat_ns = int(self.debounce_interval * 1_000_000_000)
+        for pin, button in self.pins.items():
+            if pressed[button] or not self.held[button]:
+                continue
+            if GPIO.input(pin) != GPIO.LOW:
+                self.held[button] = False
+            elif now_ns - self.last_press_ns[button] > repeat_ns:
+                self.last_press_ns[button] = now_ns
+                pressed[button] = True
+                self.events.append(ButtonEvent(button, PRESS, now_ns))
+
+        self.left_button = pressed["left"]
+        self.right_button = pressed["right"]
+        self.center_button = pressed["center"]
+
+    def pending(self):
+        """
+        Whether edges arrived since the last handle_input(), e.g. to cut a sleep short.
+        """
+        return bool(self.queue)
+
+    def pressed_at(self, button):
+        """
+        Exact time of the first press of a button handled this frame.
+
+        Args:
+            button (str): "left", "center" or "right".
+
+        Returns:
+            int or None: time.monotonic_ns() of the press, or None if it was not pressed.
+        """
+        for event in self.events:
+            if event.button == button and event.edge == PRESS:
+                return event.timestamp_ns
+        return None
+
+    def cleanup(self):
+        """Stop edge detection; call before GPIO.cleanup()."""
+        for pin in self.pins:
+            GPIO.remove_event_detect(pin)
@@ -1,5 +1,8 @@
 import time
 import random
+from utils.logger import get_logger
+
+log = get_logger("controls")
 
 class FakeControls:
     def __init__(self):
@@ -13,7 +16,7 @@ class FakeControls:
         if now - self.last_action > random.uniform(0.5, 2):  # simulate delay
             direction = random.choice(['left', 'center', 'right'])
             setattr(self, f"{direction}_button", True)
-            print(f"FAKE PRESS: {direction.upper()}")
+            log.debug("FAKE PRESS: %s", direction.upper())
             self.last_action = now
         else:
             self.left_button = False
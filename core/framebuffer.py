@@ -0,0 +1,133 @@
+import numpy as np
+from PIL import Image, ImageColor
+from utils.rgb_image import RGBImage
+
+
+def to_rgb(color):
+    """
+    Normalise a colour given as an RGB(A) tuple or a PIL colour name.
+    """
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)[:3]
+    return tuple(color[:3])
+
+
+def to_array(matrix):
+    """
+    Convert an RGBImage, or an RGB matrix (list of rows of (r, g, b) tuples), into arrays.
+
+    Returns:
+        tuple: (HxWx3 uint8 pixels, HxW bool mask of non-black pixels).
+    """
+    if isinstance(matrix, RGBImage):
+        return matrix.pixels, matrix.mask  # Already arrays, nothing to convert
+    pixels = np.asarray(matrix, dtype=np.uint8)
+    if pixels.ndim != 3:
+        pixels = pixels.reshape((len(matrix), 0, 3))
+    return pixels, pixels.any(axis=2)
+
+
+class FrameBuffer:
+    """
+    A whole frame held as one HxWx3 uint8 array.
+
+    Coordinates are in matrix pixels. Every primitive clips against the frame,
+    so callers can draw partially off-screen the same way they could with
+    ImageDraw.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+
+    def clear(self, color=(0, 0, 0)):
+        self.pixels[:] = to_rgb(color)
+
+    def _clip(self, x, y, w, h):
+        """
+        Clip a rectangle to the frame.
+
+        Returns:
+            tuple or None: (x0, y0, x1, y1) frame bounds plus the (sx, sy)
+            offset into the source, or None if nothing is visible.
+        """
+        x, y = int(x), int(y)
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1, x0 - x, y0 - y
+
+    def fill_rect(self, x, y, w, h, color):
+        """
+        Fill a w x h rectangle whose top-left corner is (x, y).
+        """
+        clipped = self._clip(x, y, int(w), int(h))
+        if clipped is None:
+            return
+        x0, y0, x1, y1, _, _ = clipped
+        self.pixels[y0:y1, x0:x1] = to_rgb(color)
+
+    def rectangle(self, coords, fill):
+        """
+        ImageDraw-compatible rectangle: both corners are inclusive.
+        """
+        x1, y1, x2, y2 = (int(c) for c in coords)
+        # ImageDraw rejects inverted boxes; treat them as a single pixel row/column.
+        x2, y2 = max(x1, x2), max(y1, y2)
+        self.fill_rect(x1, y1, x2 - x1 + 1, y2 - y1 + 1, fill)
+
+    def blit(self, src, x, y, mask=None):
+        """
+        Copy an HxWx3 array onto the frame, optionally only where mask is set.
+        """
+        h, w = src.shape[:2]
+        clipped = self._clip(x, y, w, h)
+        if clipped is None:
+            return
+        x0, y0, x1, y1, sx, sy = clipped
+        src = src[sy:sy + (y1 - y0), sx:sx + (x1 - x0)]
+        target = self.pixels[y0:y1, x0:x1]
+        if mask is None:
+            target[:] = src
+        else:
+            mask = mask[sy:sy + (y1 - y0), sx:sx + (x1 - x0)]
+            target[mask] = src[mask]
+
+    def composite(self, mask, x, y, color):
+        """
+        Paint a single colour wherever mask is non-zero, e.g. a rendered text line.
+        """
+        h, w = mask.shape
+        clipped = self._clip(x, y, w, h)
+        if clipped is None:
+            return
+        x0, y0, x1, y1, sx, sy = clipped
+        mask = mask[sy:sy + (y1 - y0), sx:sx + (x1 - x0)] != 0
+        self.pixels[y0:y1, x0:x1][mask] = to_rgb(color)
+
+    def blit_mask(self, mask, x, y):
+        """
+        Draw a coverage mask as grey levels (white text on black), skipping zeros.
+        """
+        h, w = mask.shape
+        clipped = self._clip(x, y, w, h)
+        if clipped is None:
+            return
+        x0, y0, x1, y1, sx, sy = clipped
+        mask = mask[sy:sy + (y1 - y0), sx:sx + (x1 - x0)]
+        lit = mask != 0
+        self.pixels[y0:y1, x0:x1][lit] = mask[lit][:, None]
+
+    def snapshot(self):
+        """Copy of the current frame, e.g. to cache a static background layer."""
+        return self.pixels.copy()
+
+    def restore(self, layer):
+        """Replace the whole frame with a previously taken snapshot."""
+        self.pixels[:] = layer
+
+    def to_image(self):
+        """Wrap the frame as a PIL RGB image (e.g. for matrix.SetImage)."""
+        return Image.fromarray(self.pixels, "RGB")
@@ -2,54 +2,49 @@ import sys
 import time
 import math
 import random
-from PIL import Image, ImageDraw, ImageEnhance
-import os
-from utils.text_utils import text_to_matrix, split_text_to_lines
-from core.minigames.hobby import HIT_ZONE_Y, BEAT_POSITIONS, NOTE_WIDTH
+import threading
+from utils.text_utils import text_to_mask, split_text_to_lines
+from utils.sprite_cache import sprite_cache
+from utils.sprite_variants import sprite_variants, scaled_size
+from utils.sprite_sets import sprite_sets
+from core.framebuffer import FrameBuffer, to_array
+from core.presenter import FramePresenter, ThreadedPresenter
+from core.clips import AnimationClip
+from core.headless import NullMatrix
 from utils.constants import (
-    PYGAME, RASPBERRYPI
+    PYGAME, RASPBERRYPI, HEADLESS, HIT_ZONE_Y, BEAT_POSITIONS, NOTE_WIDTH
 )
+from utils.logger import get_logger
 
-HOUSE_MONEY_THRESHOLDS = [10, 25, 50, 75]
+log = get_logger("graphics")
 
-class DrawPlatformHelper:
-    def __init__(self, graphics):
-        self.graphics = graphics
-
-    def rectangle(self, coords, fill):
-        # Initialize pygame if running in debug mode
-        if self.graphics.platform == PYGAME:
-            import pygame
-
-        platform_x = coords[0] / self.graphics.pixel_size
-        platform_y = coords[1] / self.graphics.pixel_size
-        platform_width = (coords[2] / self.graphics.pixel_size) - platform_x
-        pygame.draw.rect(
-            self.graphics.screen,
-            fill,
-            (
-                platform_x * self.graphics.pixel_size,
-                platform_y * self.graphics.pixel_size,
-                platform_width * self.graphics.pixel_size,
-                self.graphics.pixel_size,
-            )
-        )
+HOUSE_MONEY_THRESHOLDS = [10, 25, 50, 75]
+END_ANIMATION_DURATION = 6  # seconds before the end screen returns home
+END_ANIMATION_FPS = 25      # tick rate the end animations are prerendered at
 
 class DrawHelper:
+    """
+    ImageDraw-style adapter over the frame buffer.
+
+    Coordinates are screen pixels (matrix pixels * pixel_size), which is what
+    callers outside Graphics such as draw_money_signal and draw_platformer pass.
+    """
     def __init__(self, graphics):
         self.graphics = graphics
 
     def rectangle(self, coords, fill):
-        x1, y1, x2, y2 = coords
-        width = x2 - x1 + 1
-        height = y2 - y1 + 1
-        self.graphics.screen.fill(fill, (x1, y1, width, height))
-        
+        pixel_size = self.graphics.pixel_size
+        x1, y1, x2, y2 = (int(c // pixel_size) for c in coords)
+        self.graphics.framebuffer.rectangle([x1, y1, x2, y2], fill=fill)
+
 class Graphics:
-    def __init__(self, matrix, matrix_width, matrix_height, pixel_size):
+    def __init__(self, matrix, matrix_width, matrix_height, pixel_size, platform=None):
         # 'matrix' is the LED matrix instance you use to push images (via SwapOnVSync or SetImage)
+        # For HEADLESS it is a core.headless.NullMatrix that keeps frames in memory.
         self.debug = any("debug=true" in arg.lower() for arg in sys.argv)
-        self.platform = PYGAME if self.debug else RASPBERRYPI
+        if platform is None:
+            platform = PYGAME if self.debug else RASPBERRYPI
+        self.platform = platform
         self.matrix = matrix
         self.screen = matrix
         self.matrix_width = matrix_width
@@ -72,42 +67,78 @@ class Graphics:
         self.death_cause = None
         self.death_sprite_folder = None
         self.in_death_animation = False
-        # Create a canvas image for drawing (width = matrix_width * pixel_size, etc.)
-        self.canvas = Image.new("RGB", (matrix_width * pixel_size, matrix_height * pixel_size))
-        # based on whether debug is true or false, use the appropriate drawing method
-        self.draw = self.debug and DrawHelper(self) or ImageDraw.Draw(self.canvas)
-        self.drawplatform = self.debug and DrawPlatformHelper(self) or ImageDraw.Draw(self.canvas)
+        self.end_clip = None
+        self.end_baker = None   # Thread prerendering end_clip
+        # Every draw call lands in one array of matrix pixels; it is only scaled
+        # up by pixel_size when presented to the pygame window.
+        self.framebuffer = FrameBuffer(matrix_width, matrix_height)
+        self.draw = DrawHelper(self)
+        self.drawplatform = self.draw
+        # Home screen background layers, keyed by blink phase (see draw_home_background).
+        self.home_layer_key = None
+        self.home_layers = {}
+        # Skips unchanged frames and only pushes dirty rows to the LED matrix,
+        # double-buffered on its own thread when the matrix supports FrameCanvas.
+        self.presenter = None
+        if self.platform in (RASPBERRYPI, HEADLESS):
+            if hasattr(matrix, "CreateFrameCanvas"):
+                self.presenter = ThreadedPresenter(matrix)
+            else:
+                self.presenter = FramePresenter(matrix)
+
+    def reset(self):
+        """
+        Forget the previous pet (position, sprite animation, end screen) for a
+        new life, keeping the presenter, the frame buffer and every cache.
+        """
+        now = time.time()
+        self.position = [self.matrix_width // 2, self.matrix_height // 2]
+        self.last_move_time = now
+        self.last_switch_time = now
+        self.switch_interval = random.uniform(0.5, 2.0)
+        self.pause_duration = random.uniform(1, 3)
+        self.current_sprite_index = 0
+        self.in_death_animation = False
+        self.stop_end_animation()
+        self.clear_screen()
 
     def clear_screen(self):
         """Clear the screen by filling it with black."""
-        if self.platform == PYGAME:
-            self.screen.fill(self.black)
-        else:
-            self.draw.rectangle([0, 0, self.canvas.width, self.canvas.height], fill=self.black)
+        self.framebuffer.clear(self.black)
 
-    def render_to_matrix(self):
-        """Push the canvas image to the LED matrix."""
-        # If you draw using pixel_size > 1, resize to matrix size
-        display_image = self.canvas.resize((self.matrix.width, self.matrix.height), Image.NEAREST)
-        self.matrix.SetImage(display_image.convert("RGB"))
+    def render_to_matrix(self, token=None):
+        """
+        Hand the frame buffer to the presenter, which pushes it if it changed.
+        The optional token (e.g. latency stamps) is passed to the presenter's listener.
+        """
+        return self.presenter.present(self.framebuffer.pixels, token)
+
+    def set_brightness(self, brightness):
+        """
+        Change the LED panel brightness (0-100). The pygame window is not dimmed.
+        """
+        if self.presenter:
+            self.presenter.set_brightness(brightness)
 
+    def shutdown(self):
+        """Stop the presenter thread, if any."""
+        if self.presenter:
+            self.presenter.stop()
+
+    def render_to_screen(self):
+        """Blit the frame buffer, scaled by pixel_size, onto the pygame window."""
+        import pygame
+
+        scaled = self.framebuffer.pixels.repeat(self.pixel_size, axis=0).repeat(self.pixel_size, axis=1)
+        pygame.surfarray.blit_array(self.screen, scaled.swapaxes(0, 1))
 
     def draw_rect(self, x, y, w, h, fill):
-        # Helper method: draw a rectangle on the canvas.
+        # Helper method: draw a rectangle on the frame buffer.
         self.draw.rectangle([x, y, x + w, y + h], fill=fill)
 
     def load_sprites(self, folder_path):
-        sprites = []
-        for filename in sorted(os.listdir(folder_path)):
-            if filename.endswith(".png"):
-                filepath = os.path.join(folder_path, filename)
-                img = Image.open(filepath).convert("RGB")
-                img = img.resize((10, 10))
-                sprite_matrix = [[img.getpixel((x, y)) for x in range(10)] for y in range(10)]
-                sprites.append(sprite_matrix)
-        if not sprites:
-            raise ValueError(f"No sprites found in {folder_path}")
-        return sprites
+        # Decoded once per folder for the whole process, see utils/sprite_sets.py.
+        return sprite_sets.load(folder_path)
 
     def set_sprites(self, new_sprites):
         # Update sprites and reset the sprite index.
@@ -122,9 +153,8 @@ class Graphics:
             self.switch_interval = random.uniform(0.5, 2.0)
 
     def update_sprites(self, states):
-        # Update sprites based on the current state of life.
-        sprite_folder = states.get_sprite_folder()
-        self.set_sprites(self.load_sprites(sprite_folder))
+        # Update sprites based on the current state of life: the stage's frames are resident, nothing is read from disk.
+        self.set_sprites(sprite_sets.get(states.character, states.stage_of_life))
 
     def move_sprite(self):
         current_time = time.time()
@@ -142,23 +172,17 @@ class Graphics:
             self.pause_duration = random.uniform(1, 3)
             
     def draw_frame(self):
-        # Draw the frame with outlined pixels.
-        for x in range(self.frame_x, self.frame_x + self.frame_width):
-            # Top line: black outline then white inner pixel.
-            self.draw_rect(x * self.pixel_size, self.frame_y * self.pixel_size,
-                           self.pixel_size - 2, self.pixel_size - 2, fill=(255, 255, 255))
-            # Bottom line.
-            self.draw_rect(x * self.pixel_size, (self.frame_y + self.frame_height - 1) * self.pixel_size,
-                           self.pixel_size - 2, self.pixel_size - 2, fill=(255, 255, 255))
-        for y in range(self.frame_y, self.frame_y + self.frame_height):
-            # Left line.
-            self.draw_rect(self.frame_x * self.pixel_size, y * self.pixel_size,
-                           self.pixel_size - 2, self.pixel_size - 2, fill=(255, 255, 255))
-            # Right line.
-            self.draw_rect((self.frame_x + self.frame_width - 1) * self.pixel_size, y * self.pixel_size,
-                           self.pixel_size - 2, self.pixel_size - 2, fill=(255, 255, 255))
-
-    def draw_sprite_at(self, x, y, sprite_path, sprite_width=10, sprite_height=10, opacity=1.0):
+        # Draw the frame border as four one-pixel lines.
+        fb = self.framebuffer
+        right_x = self.frame_x + self.frame_width - 1
+        bottom_y = self.frame_y + self.frame_height - 1
+        fb.fill_rect(self.frame_x, self.frame_y, self.frame_width, 1, self.white)  # Top
+        fb.fill_rect(self.frame_x, bottom_y, self.frame_width, 1, self.white)      # Bottom
+        fb.fill_rect(self.frame_x, self.frame_y, 1, self.frame_height, self.white)  # Left
+        fb.fill_rect(right_x, self.frame_y, 1, self.frame_height, self.white)       # Right
+
+    def draw_sprite_at(self, x, y, sprite_path, sprite_width=10, sprite_height=10, opacity=1.0,
+                       scale_x=1.0, scale_y=1.0, flip_x=False, flip_y=False, tint=None):
         """
         Draw a single sprite at a specific position.
         
@@ -169,42 +193,29 @@ class Graphics:
             sprite_width (int): Width of the sprite in pixels.
             sprite_height (int): Height of the sprite in pixels.
             opacity (float): Opacity multiplier (1.0 = full opacity, 0.0 = fully dark).
+            scale_x (float): Horizontal scale factor applied to sprite_width.
+            scale_y (float): Vertical scale factor applied to sprite_height.
+            flip_x (bool): Mirror the sprite left to right.
+            flip_y (bool): Mirror the sprite top to bottom.
+            tint (tuple): RGB colour to multiply the sprite by, or None.
         """
-        # Initialize pygame if running in debug mode
-        if self.platform == PYGAME:
-            import pygame
+        if (opacity, scale_x, scale_y, flip_x, flip_y, tint) == (1.0, 1.0, 1.0, False, False, None):
+            # Decoded pixels come from the shared cache; only the first draw of a
+            # given (path, size) decodes the PNG.
+            pixels, mask = sprite_cache.get(sprite_path, sprite_width, sprite_height)
+        else:
+            # Transformed sprites snap to the nearest precomputed variant.
+            pixels, mask = sprite_variants.get(
+                sprite_path, sprite_width, sprite_height, scale_x, scale_y, opacity, flip_x, flip_y, tint
+            )
+        self.framebuffer.blit(pixels, x, y, mask)
 
-        # Open the image with alpha channel
-        img = Image.open(sprite_path).convert("RGBA")
-        img = img.resize((sprite_width, sprite_height))
-        
-        # If opacity is less than 1.0, blend with a black image.
-        if opacity < 1.0:
-            # Create a black image of the same size
-            black_img = Image.new("RGBA", img.size, (0, 0, 0, 255))
-            img = Image.blend(black_img, img, opacity)
-        
-        # Convert back to RGB for drawing
-        img = img.convert("RGB")
-        sprite_matrix = [[img.getpixel((col, row)) for col in range(sprite_width)] for row in range(sprite_height)]
-        for row_idx, row in enumerate(sprite_matrix):
-            for col_idx, pixel in enumerate(row):
-                if pixel != (0, 0, 0):  # Skip pure black pixels
-                    screen_x = (x + col_idx) * self.pixel_size
-                    screen_y = (y + row_idx) * self.pixel_size
-                    if self.platform == RASPBERRYPI:
-                        self.draw_rect(screen_x, screen_y, self.pixel_size - 1, self.pixel_size - 1, fill=pixel)
-                    elif self.platform == PYGAME:
-                        pygame.draw.rect(
-                            self.screen,
-                            pixel,
-                            (screen_x, screen_y, self.pixel_size - 1, self.pixel_size - 1),
-                        )
-
-
-    def draw_frame_and_points(self, selected_point_index, states):
+
+    def draw_frame_and_points(self, selected_point_index, states, blink_on=None):
         """
         Draw the frame and points, with unavailable points greyed out.
+        While blink_on is true the selected point is drawn dark; by default
+        the blink phase follows the clock.
         """
         self.draw_frame()
 
@@ -224,12 +235,13 @@ class Graphics:
         point_screens = ["education_screen", "hobby_screen", "food_screen",  # Top row
                         "socialize_screen", "job_screen", "housing_screen"]    # Bottom row
 
-        current_time = time.time()
+        if blink_on is None:
+            blink_on = int(time.time() * 2) % 2 == 0
         for i, (x, y) in enumerate(all_points):
             screen_name = point_screens[i]
             if states.is_screen_available(screen_name):
                 # Blink the selected point if it's active; otherwise red.
-                color = (255, 0, 0) if not (i == selected_point_index and int(current_time * 2) % 2 == 0) else (0, 0, 0)
+                color = (255, 0, 0) if not (i == selected_point_index and blink_on) else (0, 0, 0)
             else:
                 # Unavailable screen – greyed out.
                 color = (100, 100, 100)
@@ -238,39 +250,38 @@ class Graphics:
 
     def draw_matrix(self, matrix, start_x, start_y):
         """
-        Draw an RGB matrix at the given starting position on the canvas.
+        Draw an RGB matrix at the given starting position on the frame buffer.
         
         Args:
-            matrix (list): RGB matrix to render.
+            matrix (RGBImage or list): Image, or RGB matrix, to render.
             start_x (int): X coordinate (in matrix pixels) for the top-left corner.
             start_y (int): Y coordinate (in matrix pixels) for the top-left corner.
         """
-        for y, row in enumerate(matrix):
-            for x, pixel in enumerate(row):
-                if pixel != (0, 0, 0):  # Skip black pixels.
-                    screen_x = (start_x + x) * self.pixel_size
-                    screen_y = (start_y + y) * self.pixel_size
-                    self.draw_rect(screen_x, screen_y, self.pixel_size - 1, self.pixel_size - 1, fill=pixel)
+        pixels, mask = to_array(matrix)  # Black pixels are skipped via the mask.
+        self.framebuffer.blit(pixels, start_x, start_y, mask)
+
+
+    def draw_mask(self, mask, start_x, start_y, color=None):
+        """
+        Draw a text coverage mask (see utils.text_utils.text_to_mask).
+
+        Args:
+            mask (numpy.ndarray): HxW uint8 coverage mask.
+            start_x (int): X coordinate (in matrix pixels) for the top-left corner.
+            start_y (int): Y coordinate (in matrix pixels) for the top-left corner.
+            color (tuple or str): Solid colour for every lit pixel; by default
+                pixels keep their grey level, like draw_matrix on text.
+        """
+        if color is None:
+            self.framebuffer.blit_mask(mask, start_x, start_y)
+        else:
+            self.framebuffer.composite(mask, start_x, start_y, color)
 
 
     def draw_sprite(self):
-        # Initialize pygame if running in debug mode
-        if self.platform == PYGAME:
-            import pygame
-
-        sprite_matrix = self.sprites[self.current_sprite_index]
-        for y, row in enumerate(sprite_matrix):
-            for x, pixel in enumerate(row):
-                screen_x = (self.position[0] + x) * self.pixel_size
-                screen_y = (self.position[1] + y) * self.pixel_size
-                if self.platform == RASPBERRYPI:
-                    self.draw_rect(screen_x, screen_y, self.pixel_size - 1, self.pixel_size - 1, fill=pixel)
-                elif self.platform == PYGAME:
-                    pygame.draw.rect(
-                        self.screen,
-                        pixel,
-                        (screen_x, screen_y, self.pixel_size - 1, self.pixel_size - 1),
-                    )
+        # The pet sprite is drawn opaque, black pixels included.
+        pixels, _ = to_array(self.sprites[self.current_sprite_index])
+        self.framebuffer.blit(pixels, self.position[0], self.position[1])
 
     def draw_text_centered(self, text, font_path="assets/fonts/tamzen.ttf", font_size=10, color="white"):
         """
@@ -284,36 +295,26 @@ class Graphics:
         """
         lines = split_text_to_lines(text, max_chars_per_line=12)
 
-        line_matrices = []
+        line_masks = []
         line_heights = []
         for line in lines:
-            matrix = text_to_matrix(line, font_path, font_size, self.matrix_width, self.matrix_height, color)
-            # Only count rows that actually have pixels
-            non_empty_rows = [row for row in matrix if any(pixel != (0, 0, 0) for pixel in row)]
-            line_matrices.append(non_empty_rows)
-            line_heights.append(len(non_empty_rows))
+            mask = text_to_mask(line, font_path, font_size, self.matrix_width, self.matrix_height)
+            # Only keep rows that actually have pixels
+            non_empty_rows = mask.any(axis=1)
+            line_masks.append(mask[non_empty_rows])
+            line_heights.append(int(non_empty_rows.sum()))
 
         # Total height with 1px spacing between lines
         total_height = sum(line_heights) + (len(lines) - 1)
 
         offset_y = max((self.matrix_height - total_height) // 2, 0)
 
-        for idx, matrix in enumerate(line_matrices):
+        for idx, mask in enumerate(line_masks):
             # Determine content width for centering
-            non_empty_cols = list(zip(*matrix))
-            non_empty_cols = [col for col in non_empty_cols if any(pixel != (0, 0, 0) for pixel in col)]
-            content_width = len(non_empty_cols)
+            content_width = int(mask.any(axis=0).sum())
             offset_x = max((self.matrix_width - content_width) // 4, 0)
 
-            for y, row in enumerate(matrix):
-                for x, pixel in enumerate(row):
-                    if pixel != (0, 0, 0):
-                        screen_x = (offset_x + x) * self.pixel_size
-                        screen_y = (offset_y + y) * self.pixel_size
-                        self.draw.rectangle(
-                            [screen_x, screen_y, screen_x + self.pixel_size - 1, screen_y + self.pixel_size - 1],
-                            fill=color if isinstance(color, tuple) else pixel
-                        )
+            self.draw_mask(mask, offset_x, offset_y, color if isinstance(color, tuple) else None)
             offset_y += line_heights[idx] + 1  # Add 1 line of spacing
 
 
@@ -322,29 +323,45 @@ class Graphics:
         Draw the home screen, including the frame and flashing points.
         Unavailable games are greyed out.
         """
-        self.clear_screen()
-        self.draw_frame_and_points(selected_point_index, states)
+        self.draw_home_background(selected_point_index, states)
         self.switch_sprite()
         self.move_sprite()
         self.draw_sprite()
 
+    def draw_home_background(self, selected_point_index, states):
+        """
+        Draw the frame and points from a cached background layer.
+
+        The layer depends only on the life stage, the selected point and the
+        blink phase. Each blink phase is rendered once, and the cached layers
+        are dropped when the stage or the selection changes.
+        """
+        blink_on = int(time.time() * 2) % 2 == 0
+        key = (states.stage_of_life, selected_point_index)
+        if key != self.home_layer_key:
+            self.home_layer_key = key
+            self.home_layers = {}
+
+        layer = self.home_layers.get(blink_on)
+        if layer is None:
+            self.clear_screen()
+            self.draw_frame_and_points(selected_point_index, states, blink_on)
+            self.home_layers[blink_on] = self.framebuffer.snapshot()
+        else:
+            self.framebuffer.restore(layer)
+
     def render_individual_screen(self, screen_name):
         """
         Render the individual game or activity screen based on the screen name.
         """
         self.clear_screen()
         text = screen_name.replace('_', '\n').capitalize()
-        text_matrix = text_to_matrix(
+        text_mask = text_to_mask(
             text, "assets/fonts/tamzen.ttf", 11, self.matrix_width, self.matrix_height
         )
 
-        # Draw the text in the center of the screen using the canvas.
-        for y, row in enumerate(text_matrix):
-            for x, pixel in enumerate(row):
-                if pixel != (0, 0, 0):
-                    screen_x = x * self.pixel_size
-                    screen_y = y * self.pixel_size
-                    self.draw_rect(screen_x, screen_y, self.pixel_size - 1, self.pixel_size - 1, fill=pixel)
+        # Draw the text at the top-left of the frame.
+        self.draw_mask(text_mask, 0, 0)
 
 
     def draw_education_screen(self, selected_suitcase):
@@ -412,12 +429,12 @@ class Graphics:
             font_size = 12
 
             # Level text
-            level_matrix = text_to_matrix(f"{level}", font_path, font_size, self.matrix_width, 10)
-            self.draw_matrix(level_matrix, center_x - self.matrix_width // 4, center_y - 12)
+            level_mask = text_to_mask(f"{level}", font_path, font_size, self.matrix_width, 10)
+            self.draw_mask(level_mask, center_x - self.matrix_width // 4, center_y - 12)
 
             # Loan text
-            loan_matrix = text_to_matrix(f"-${loan}", font_path, font_size, self.matrix_width, 10)
-            self.draw_matrix(loan_matrix, center_x - self.matrix_width // 2, center_y + 2)
+            loan_mask = text_to_mask(f"-${loan}", font_path, font_size, self.matrix_width, 10)
+            self.draw_mask(loan_mask, center_x - self.matrix_width // 2, center_y + 2)
 
 
     def draw_platformer_screen(self, tama_position, platforms, goal_position):
@@ -534,22 +551,22 @@ class Graphics:
             font_path = "assets/fonts/tamzen.ttf"
             font_size = 11
 
-            # Convert to matrix form
-            player_chance_matrix = text_to_matrix(
+            # Convert to mask form
+            player_chance_mask = text_to_mask(
                 player_chance_text, font_path, font_size, self.matrix_width, 10
             )
-            other_chance_matrix = text_to_matrix(
+            other_chance_mask = text_to_mask(
                 other_chance_text, font_path, font_size, self.matrix_width, 10
             )
 
             # Draw above the Tamas
-            self.draw_matrix(
-                player_chance_matrix,
+            self.draw_mask(
+                player_chance_mask,
                 player_tama_x - 5,
                 player_tama_y - 16  # a bit higher above the Tama
             )
-            self.draw_matrix(
-                other_chance_matrix,
+            self.draw_mask(
+                other_chance_mask,
                 other_tama_x - 8,
                 other_tama_y - 16
             )
@@ -567,13 +584,13 @@ class Graphics:
         locked = player_money < current_threshold
 
         if housing_state["current_home"]:
-            home_matrix = text_to_matrix("Home", "assets/fonts/tamzen.ttf", 10, self.matrix_width, self.matrix_height)
-            self.draw_matrix(home_matrix, self.matrix_width // 2 - len(home_matrix[0]) // 5, (self.matrix_height // 4) - 10)
+            home_mask = text_to_mask("Home", "assets/fonts/tamzen.ttf", 10, self.matrix_width, self.matrix_height)
+            self.draw_mask(home_mask, self.matrix_width // 2 - home_mask.shape[1] // 5, (self.matrix_height // 4) - 10)
             self.draw_sprite_at(self.matrix_width // 4 - 5, self.matrix_height // 4, current_house["sprite"], sprite_width=48, sprite_height=24)
         elif housing_state["pending"]:
             pending_text = "Pending..."
-            pending_matrix = text_to_matrix(pending_text, "assets/fonts/tamzen.ttf", 10, self.matrix_width, self.matrix_height)
-            self.draw_matrix(pending_matrix, self.matrix_width // 2 - len(pending_matrix[0]) // 2, self.matrix_height // 2 - 10)
+            pending_mask = text_to_mask(pending_text, "assets/fonts/tamzen.ttf", 10, self.matrix_width, self.matrix_height)
+            self.draw_mask(pending_mask, self.matrix_width // 2 - pending_mask.shape[1] // 2, self.matrix_height // 2 - 10)
             agent_x = self.matrix_width - 12
             agent_y = self.matrix_height - 12
             self.draw_sprite_at(agent_x, agent_y, housing_state["real_estate_agent"]["sprite"], sprite_width=10, sprite_height=10)
@@ -591,8 +608,8 @@ class Graphics:
 
             house_name = current_house["name"]
             text = f"{house_name}"
-            text_matrix = text_to_matrix(text, "assets/fonts/tamzen.ttf", 10, self.matrix_width, self.matrix_height)
-            self.draw_matrix(text_matrix, self.matrix_width // 2 - len(text_matrix[0]) // 2 + 2, -2)
+            text_mask = text_to_mask(text, "assets/fonts/tamzen.ttf", 10, self.matrix_width, self.matrix_height)
+            self.draw_mask(text_mask, self.matrix_width // 2 - text_mask.shape[1] // 2 + 2, -2)
 
 
     def draw_housing_reaction_game(self, housing_state, fps):
@@ -604,27 +621,27 @@ class Graphics:
         if housing_state["countdown_active"] or housing_state["random_timeout_active"]:
             # Display countdown timer.
             countdown_number = max(0, int(housing_state["countdown_timer"]))
-            countdown_matrix = text_to_matrix(
+            countdown_mask = text_to_mask(
                 str(countdown_number), "assets/fonts/tamzen.ttf", 20, self.matrix_width, self.matrix_height
             )
-            self.draw_matrix(countdown_matrix, self.matrix_width // 2 - 5, self.matrix_height // 2 - 10)
+            self.draw_mask(countdown_mask, self.matrix_width // 2 - 5, self.matrix_height // 2 - 10)
 
         elif housing_state["reaction_active"]:
             # Display "APPLY" prompt.
             reaction_text = "APPLY"
-            reaction_matrix = text_to_matrix(
+            reaction_mask = text_to_mask(
                 reaction_text, "assets/fonts/tamzen.ttf", 14, self.matrix_width, self.matrix_height
             )
-            self.draw_matrix(reaction_matrix, self.matrix_width // 4, self.matrix_height // 4)
+            self.draw_mask(reaction_mask, self.matrix_width // 4, self.matrix_height // 4)
 
         elif housing_state["reaction_result"] is not None:
             # Display Pass/Fail result.
-            print("reaction_result", housing_state["reaction_result"])
+            log.debug("reaction_result %s", housing_state["reaction_result"])
             result_text = "SUCCESS" if housing_state["reaction_result"] == "pass" else "FAILED"
-            result_matrix = text_to_matrix(
+            result_mask = text_to_mask(
                 result_text, "assets/fonts/tamzen.ttf", 14, self.matrix_width, self.matrix_height
             )
-            self.draw_matrix(result_matrix, self.matrix_width // 4 - 8, self.matrix_height // 4)
+            self.draw_mask(result_mask, self.matrix_width // 4 - 8, self.matrix_height // 4)
 
             # Handle animated tick/cross sprites.
             animation_frame = int(time.time() * 1000 / 200) % 5  # Loop: 0, 1, 2, 3, 4.
@@ -697,15 +714,15 @@ class Graphics:
         # Display only the score number at the top-left.
         score_text = str(hobby_state['score'])
         highscore_text = str(hobby_state['high_score'])
-        score_matrix = text_to_matrix(score_text, "assets/fonts/tamzen.ttf", 12, self.matrix_width, self.matrix_height)
-        highscore_matrix = text_to_matrix(highscore_text, "assets/fonts/tamzen.ttf", 12, self.matrix_width, self.matrix_height)
-        self.draw_matrix(score_matrix, 1, 0)
-        self.draw_matrix(highscore_matrix, 1, 9)
+        score_mask = text_to_mask(score_text, "assets/fonts/tamzen.ttf", 12, self.matrix_width, self.matrix_height)
+        highscore_mask = text_to_mask(highscore_text, "assets/fonts/tamzen.ttf", 12, self.matrix_width, self.matrix_height)
+        self.draw_mask(score_mask, 1, 0)
+        self.draw_mask(highscore_mask, 1, 9)
 
         # Draw "Game Over" if the player missed too many beats.
         if hobby_state["game_over"]:
-            game_over_matrix = text_to_matrix("Game Over", "assets/fonts/tamzen.ttf", 12, self.matrix_width, self.matrix_height)
-            self.draw_matrix(game_over_matrix, self.matrix_width // 6 - 5, self.matrix_height // 2 + 1)
+            game_over_mask = text_to_mask("Game Over", "assets/fonts/tamzen.ttf", 12, self.matrix_width, self.matrix_height)
+            self.draw_mask(game_over_mask, self.matrix_width // 6 - 5, self.matrix_height // 2 + 1)
 
 
     def draw_job_feedback(self, job_state):
@@ -776,76 +793,124 @@ class Graphics:
                 t = time.time() % 0.5
                 offset = int(math.sin(t * 2 * math.pi) * 2)  # Oscillates ±2 pixels
                 scale_factor = 1.0 + 0.1 * math.sin(t * 2 * math.pi)
-                animated_width = max(1, int(10 * scale_factor))
-                animated_height = max(1, int(10 * scale_factor))
+                animated_width, animated_height = scaled_size(10, 10, scale_factor, scale_factor)
                 animated_x = base_x - (animated_width - 10) // 2 + offset
                 animated_y = base_y - (animated_height - 10) // 2 + offset
                 item_path = job_state["items"][task]  # Use the sprite corresponding to this desk position
-                self.draw_sprite_at(animated_x, animated_y, item_path, sprite_width=animated_width, sprite_height=animated_height)
+                self.draw_sprite_at(animated_x, animated_y, item_path, scale_x=scale_factor, scale_y=scale_factor)
             else:
                 # Draw the static desk item.
                 item_path = job_state["items"][task]
                 self.draw_sprite_at(base_x, base_y, item_path, sprite_width=10, sprite_height=10)
 
-    def draw_button(self, label_matrix, x_pos, selected, button_y):
-        button_width = len(label_matrix[0])
-        button_height = len(label_matrix)
+    def draw_button(self, label_mask, x_pos, selected, button_y):
+        button_height, button_width = label_mask.shape
         screen_y = button_y
 
-        # Draw background
+        # Draw background (one pixel wider and taller than the label)
         bg_color = (255, 255, 255) if selected else (0, 0, 0)
-        self.draw.rectangle(
-            [x_pos, screen_y, x_pos + button_width, screen_y + button_height],
-            fill=bg_color
-        )
+        self.framebuffer.fill_rect(x_pos, screen_y, button_width + 1, button_height + 1, bg_color)
 
         # Draw text
         text_color = (0, 0, 0) if selected else (255, 255, 255)
-        for y, row in enumerate(label_matrix):
-            for x, pixel in enumerate(row):
-                if pixel != (0, 0, 0):
-                    self.draw.rectangle(
-                        [x_pos + x, screen_y + y, x_pos + x , screen_y + y],
-                        fill=text_color
-                    )
+        self.framebuffer.composite(label_mask, x_pos, screen_y, text_color)
 
     def start_end_animation(self, mode, cause=None, sprite_folder=None):
         self.end_mode = mode
-        self.end_start_time = time.time()
         self.death_cause = cause
         self.death_sprite_folder = sprite_folder
+        self.end_clip = None
+        self.end_start_time = time.time()
+        self.end_baker = threading.Thread(target=self.bake_end_animation, args=(mode, cause, sprite_folder),
+                                          name="end-clip", daemon=True)
+        self.end_baker.start()
+
+    def stop_end_animation(self):
+        """Leave the end screen and free its prerendered clip."""
+        if self.end_clip is not None:
+            log.debug("End animation (%s, %s): %s", self.end_mode, self.death_cause, self.end_clip.stats())
+        self.end_mode = None
+        self.end_start_time = None
+        self.death_cause = None
+        self.death_sprite_folder = None
+        self.end_clip = None
+        self.end_baker = None
 
-    def draw_end_animation(self):
-        elapsed = time.time() - self.end_start_time
+    def bake_end_animation(self, mode, cause, sprite_folder):
+        """
+        Prerender the end animation into a clip, on the end-clip thread.
+
+        The win and death animations depend only on elapsed time and the death
+        cause, so every tick is drawn once on an off-screen Graphics and
+        playback becomes a frame lookup instead of decoding, rescaling and
+        rasterizing text. Until the clip is ready, draw_end_animation() draws
+        the animation live. A clip finished after the end screen was left (or
+        restarted) is thrown away.
+        """
+        baker = threading.current_thread()
+        scratch = Graphics(NullMatrix(self.matrix_width, self.matrix_height),
+                           self.matrix_width, self.matrix_height, 1, platform=HEADLESS)
+        scratch.end_mode = mode
+        scratch.death_cause = cause
+        scratch.death_sprite_folder = sprite_folder
+        scratch.end_start_time = 0.0
+
+        def render(elapsed):
+            scratch.clear_screen()
+            scratch.render_end_animation(elapsed)
+
+        try:
+            clip = AnimationClip.bake(render, lambda: scratch.framebuffer.pixels,
+                                      END_ANIMATION_DURATION, END_ANIMATION_FPS)
+        except Exception as error:
+            log.warning("Could not prerender the end animation, drawing it live: %s", error)
+            return
+        if self.end_baker is baker:
+            self.end_clip = clip
+
+    def render_end_animation(self, elapsed):
         if self.end_mode == 'win':
-            self.play_win_animation()
+            self.play_win_animation(elapsed)
         elif self.end_mode == 'lose':
-            self.play_lose_animation(self.death_cause, self.death_sprite_folder)
+            self.play_lose_animation(self.death_cause, self.death_sprite_folder, elapsed)
+
+    def draw_end_animation(self):
+        elapsed = time.time() - self.end_start_time
+        clip = self.end_clip
+        if clip is None:
+            # Still being prerendered
+            self.render_end_animation(elapsed)
+            return
+        frame = clip.frame_at(elapsed)
+        if frame is not None:
+            self.framebuffer.restore(frame)
 
 
-    def play_win_animation(self):
+    def play_win_animation(self, elapsed=None):
         if self.end_start_time is None:
             self.end_start_time = time.time()
-        elapsed = time.time() - self.end_start_time
+        if elapsed is None:
+            elapsed = time.time() - self.end_start_time
         if int(elapsed * 5) % 2 == 0:  # Flash every ~0.2s
             flash_color = random.choice([
                 (255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0),
                 (255, 0, 255), (0, 255, 255)
             ])
-            self.draw.rectangle([0, 0, self.matrix_width, self.matrix_height], fill=flash_color)
+            self.framebuffer.clear(flash_color)
 
         self.draw_text_centered("YOU HAVE ASCENDED")
 
 
-    def play_lose_animation(self, cause, sprite_folder):
+    def play_lose_animation(self, cause, sprite_folder, elapsed=None):
         if self.end_start_time is None:
             self.end_start_time = time.time()
             self.death_cause = cause
             self.death_sprite_folder = sprite_folder
 
-        elapsed = time.time() - self.end_start_time
+        if elapsed is None:
+            elapsed = time.time() - self.end_start_time
 
-        if elapsed > 6:
+        if elapsed > END_ANIMATION_DURATION:
             self.in_death_animation = False
             return  # Stop drawing, exit animation
 
@@ -865,14 +930,14 @@ class Graphics:
 
     def draw_death_hunger(self, elapsed, sprite_path):
         scale = max(0.01, 1 - elapsed * 0.6)
-        self.draw_sprite_at(25, 10, sprite_path, sprite_width=max(1, int(14 * scale)), sprite_height=14)
+        self.draw_sprite_at(25, 10, sprite_path, sprite_width=14, sprite_height=14, scale_x=scale)
         if scale <= 0.02:
             self.clear_screen()
             self.draw_text_centered("YOU STARVED")
 
     def draw_death_rest(self, elapsed, sprite_path):
         scale = max(0.01, 1 - elapsed * 0.6)
-        self.draw_sprite_at(25, 10 + scale, sprite_path, sprite_width=14, sprite_height=max(1, int(14 * scale)))
+        self.draw_sprite_at(25, 10 + scale, sprite_path, sprite_width=14, sprite_height=14, scale_y=scale)
         if scale <= 0.02:
             self.clear_screen()
             self.draw_text_centered("YOU CAN SLEEP NOW")
@@ -906,4 +971,4 @@ class Graphics:
             self.draw_text_centered("YOU KILLED YOUSELF")
 
     def end_animation_done(self):
-        return time.time() - self.end_start_time > 6
+        return time.time() - self.end_start_time > END_ANIMATION_DURATION
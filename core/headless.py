@@ -0,0 +1,115 @@
+import random
+import time
+import numpy as np
+from core.buttons import ButtonEvent, PRESS, BUTTONS
+
+
+class NullMatrix:
+    """
+    In-memory stand-in for the LED matrix.
+
+    Accepts the same SetImage calls as rgbmatrix.RGBMatrix and keeps the
+    result in a numpy array, so frames can be rendered, presented and
+    inspected without any hardware or pygame window.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+        self.images_set = 0
+
+    def SetImage(self, image, offset_x=0, offset_y=0):
+        rows = np.asarray(image.convert("RGB"), dtype=np.uint8)
+        self.pixels[offset_y:offset_y + rows.shape[0], offset_x:offset_x + rows.shape[1]] = rows
+        self.images_set += 1
+
+    def Clear(self):
+        self.pixels[:] = 0
+
+
+class ScriptedControls:
+    """
+    Controls driven by a script instead of buttons.
+
+    Args:
+        script (callable): script(frame) returns the names of the buttons
+            ("left", "center", "right") pressed on that frame.
+    """
+
+    def __init__(self, script=None):
+        self.script = script or (lambda frame: ())
+        self.frame = 0
+        self.left_button = False
+        self.right_button = False
+        self.center_button = False
+
+    def handle_input(self):
+        pressed = self.script(self.frame)
+        self.left_button = "left" in pressed
+        self.right_button = "right" in pressed
+        self.center_button = "center" in pressed
+        self.frame += 1
+
+
+class SyntheticControls:
+    """
+    Random button presses with exact timestamps, for measuring input latency
+    without hardware.
+
+    Presses happen at random moments (exponentially distributed gaps) rather
+    than on frame boundaries, and are reported through `events` like
+    core.controls does, so the time spent waiting for the next poll is part
+    of the measurement.
+
+    Args:
+        mean_interval (float): Average seconds between presses.
+        buttons (tuple): Buttons to choose from.
+        seed: Seed for the press sequence.
+    """
+
+    def __init__(self, mean_interval=0.7, buttons=BUTTONS, seed=None):
+        self.mean_interval = mean_interval
+        self.buttons = buttons
+        self.random = random.Random(seed)
+        self.next_press_ns = time.monotonic_ns() + self._gap_ns()
+        self.events = []
+        self.left_button = False
+        self.right_button = False
+        self.center_button = False
+
+    def _gap_ns(self):
+        return int(self.random.expovariate(1.0 / self.mean_interval) * 1_000_000_000)
+
+    def handle_input(self):
+        now_ns = time.monotonic_ns()
+        self.events = []
+        while self.next_press_ns <= now_ns:
+            self.events.append(ButtonEvent(self.random.choice(self.buttons), PRESS, self.next_press_ns))
+            self.next_press_ns += self._gap_ns()
+        pressed = {event.button for event in self.events}
+        self.left_button = "left" in pressed
+        self.right_button = "right" in pressed
+        self.center_button = "center" in pressed
+
+    def pending(self):
+        return self.next_press_ns <= time.monotonic_ns()
+
+    def pressed_at(self, button):
+        for event in self.events:
+            if event.button == button:
+                return event.timestamp_ns
+        return None
+
+
+class NullAudio:
+    """Silent AudioManager that only counts the sounds it was asked to play."""
+
+    def __init__(self):
+        self.played = {}
+
+    def play_sound(self, sound_type):
+        self.played[sound_type] = self.played.get(sound_type, 0) + 1
+
+    def cleanup(self):
+        pass
@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+from core.buttons import BUTTONS, PRESS
+
+# One button press followed through the pipeline, all times in time.monotonic_ns().
+InputStamp = namedtuple("InputStamp", ["button", "screen", "input_ns", "polled_ns", "drawn_ns"])
+
+HISTOGRAM_BUCKETS_MS = [10, 20, 40, 60, 80, 100, 150, 200, 300, 500]
+MAX_CARRY_SECONDS = 1.0  # give up on presses that never change a pixel
+
+
+class ProbedControls:
+    """
+    Wraps a controls object so every press it reports is stamped for the probe.
+
+    Attribute access is forwarded, so game code keeps reading left_button etc.
+    """
+
+    def __init__(self, controls, probe, get_screen):
+        self._controls = controls
+        self._probe = probe
+        self._get_screen = get_screen
+
+    def __getattr__(self, name):
+        return getattr(self._controls, name)
+
+    def handle_input(self):
+        self._controls.handle_input()
+        self._probe.inputs_polled(self._controls, self._get_screen())
+
+
+class LatencyProbe:
+    """
+    Input-to-photon latency instrumentation.
+
+    Each press is stamped when it happened (the edge timestamp if the controls
+    record one, otherwise when it was polled), carried through the frame that
+    consumed it, and closed when the presenter hands the first frame that
+    actually changed to the panel. Presses whose frame did not change the
+    picture ride along to the next one, so the latency is to the matching
+    pixel change rather than to the next identical frame.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.frame_stamps = []   # Stamped on this frame's input poll
+        self.carried = []        # Presented without a visible change yet
+        self.samples = {}        # screen -> list of (total, queue, frame, present) ms
+        self.unseen = 0
+        self.last_pixels = None
+
+    def wrap(self, controls, get_screen):
+        return ProbedControls(controls, self, get_screen)
+
+    def inputs_polled(self, controls, screen):
+        polled_ns = time.monotonic_ns()
+        events = getattr(controls, "events", None)
+        if events is not None:
+            presses = [(event.button, event.timestamp_ns) for event in events if event.edge == PRESS]
+        else:
+            presses = [(button, polled_ns) for button in BUTTONS if getattr(controls, f"{button}_button", False)]
+        self.frame_stamps = [InputStamp(button, screen, input_ns, polled_ns, None) for button, input_ns in presses]
+
+    def end_frame(self):
+        """
+        Mark the frame as drawn.
+
+        Returns:
+            list: The token to hand to the presenter with this frame.
+        """
+        drawn_ns = time.monotonic_ns()
+        token = [stamp._replace(drawn_ns=drawn_ns) for stamp in self.frame_stamps]
+        self.frame_stamps = []
+        with self.lock:
+            if self.carried:
+                token = self.carried + token
+                self.carried = []
+        return token
+
+    def presented(self, token, changed, presented_ns=None):
+        """
+        Called by the presenter once a frame's token has been dealt with.
+
+        Args:
+            token (list): Stamps travelling with the frame.
+            changed (bool): Whether the frame changed anything on the panel.
+            presented_ns (int): When it reached the panel; defaults to now.
+        """
+        if not token:
+            return
+        if presented_ns is None:
+            presented_ns = time.monotonic_ns()
+        with self.lock:
+            if not changed:
+                cutoff = presented_ns - int(MAX_CARRY_SECONDS * 1_000_000_000)
+                for stamp in token:
+                    if stamp.input_ns < cutoff:
+                        self.unseen += 1
+                    else:
+                        self.carried.append(stamp)
+                return
+            for stamp in token:
+                self.samples.setdefault(stamp.screen, []).append((
+                    (presented_ns - stamp.input_ns) / 1e6,
+                    (stamp.polled_ns - stamp.input_ns) / 1e6,
+                    (stamp.drawn_ns - stamp.polled_ns) / 1e6,
+                    (presented_ns - stamp.drawn_ns) / 1e6,
+                ))
+
+    def frame_shown(self, token, pixels):
+        """
+        For backends without a presenter (pygame): the frame was just put on
+        screen, and changed if it differs from the previous one.
+        """
+        changed = self.last_pixels is None or not np.array_equal(self.last_pixels, pixels)
+        if changed:
+            self.last_pixels = pixels.copy()
+        self.presented(token, changed)
+
+    def report(self):
+        """
+        Latency percentiles and histogram per screen.
+
+        Returns:
+            dict: screen -> summary; "unseen" counts presses that never changed a pixel.
+        """
+        with self.lock:
+            samples = {screen: list(values) for screen, values in self.samples.items()}
+            unseen = self.unseen
+        summary = {}
+        for screen, values in sorted(samples.items()):
+            values = np.array(values)
+            total = values[:, 0]
+            counts = np.histogram(total, bins=[0] + HISTOGRAM_BUCKETS_MS + [np.inf])[0]
+            summary[screen] = {
+                "presses": len(total),
+                "p50_ms": round(float(np.percentile(total, 50)), 2),
+                "p95_ms": round(float(np.percentile(total, 95)), 2),
+                "p99_ms": round(float(np.percentile(total, 99)), 2),
+                "max_ms": round(float(total.max()), 2),
+                "mean_queue_ms": round(float(values[:, 1].mean()), 2),
+                "mean_frame_ms": round(float(values[:, 2].mean()), 2),
+                "mean_present_ms": round(float(values[:, 3].mean()), 2),
+                "histogram": counts.tolist(),
+            }
+        return {"screens": summary, "unseen": unseen}
+
+    def print_report(self):
+        report = self.report()
+        labels = [f"<{limit}" for limit in HISTOGRAM_BUCKETS_MS] + [f">={HISTOGRAM_BUCKETS_MS[-1]}"]
+        print("Input-to-photon latency (ms)")
+        for screen, summary in report["screens"].items():
+            print(f"  {screen}: {summary['presses']} presses, p50 {summary['p50_ms']} p95 {summary['p95_ms']} "
+                  f"p99 {summary['p99_ms']} max {summary['max_ms']} "
+                  f"(queue {summary['mean_queue_ms']} + frame {summary['mean_frame_ms']} "
+                  f"+ present {summary['mean_present_ms']})")
+            peak = max(summary["histogram"]) or 1
+            for label, count in zip(labels, summary["histogram"]):
+                if count:
+                    print(f"    {label:>6} {'#' * max(1, count * 40 // peak)} {count}")
+        print(f"  presses without a visible change: {report['unseen']}")
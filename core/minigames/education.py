@@ -1,5 +1,8 @@
 import random
-import pygame
+import time
+
+ANIMATION_FRAMES = 3            # suitcase animation frames (0, 1, 2)
+ANIMATION_FRAME_DURATION = 0.5  # seconds each frame is shown
 
 def handle_education_input(stats, states, controls, audio):
     """
@@ -21,21 +24,23 @@ def handle_education_input(stats, states, controls, audio):
         # Select a suitcase to start the animation
         if controls.center_button:
             states.animation_frame = 0
+            states.animation_start_time = time.time()
             selected = states.education_options[random.randint(0, len(states.education_options) - 1)]
             states.selected_level = selected.get("level", "DropOut")
             states.student_loan = selected.get("loan", random.choice([0, 1000]))
             audio.play_sound("suitcaseOpen")
 
     elif states.animation_frame <= 2:
-        # Advance animation frames
-        pygame.time.delay(500)
-        states.animation_frame += 1
+        # Advance animation frames from the time since the suitcase was picked, without blocking the loop
+        elapsed = time.time() - states.animation_start_time
+        states.animation_frame = min(ANIMATION_FRAMES, int(elapsed // ANIMATION_FRAME_DURATION))
 
     else:
         # Wait for button press to return home
         if controls.left_button:
             stats.update_education_stats(states.selected_level, states.student_loan)
             states.animation_frame = None
+            states.animation_start_time = None
             states.education_done = True
             states.transition_to_screen("home_screen")
 
@@ -1,22 +1,34 @@
 import time
 import random
+from core.buttons import PRESS
+from utils.constants import BEAT_POSITIONS, HIT_ZONE_Y, NOTE_WIDTH
+from utils.logger import get_logger
 
-# Define the keys where beats will fall
-BEAT_POSITIONS = [24, 32, 40]  # Left, Center, Right - Centered at 32
-DROP_SPEED = 1  # Slower movement
+log = get_logger("hobby")
+
+# Where beats fall and where they are hit: BEAT_POSITIONS and HIT_ZONE_Y in utils/constants.py
+BEAT_SPEED = 25  # Pixels per second a beat falls (1 pixel per frame at 25 FPS)
 INITIAL_BEAT_INTERVAL = 0.75  # Base frequency for beats
 MIN_BEAT_INTERVAL = 0.23  # Minimum time between notes (prevents excessive difficulty)
-HIT_ZONE_Y = 28  # Y coordinate of hit zone
-NOTE_WIDTH = 4  # Notes are 3 pixels wide
 MATRIX_HEIGHT = 32  # Height of the matrix
+BEAT_BUTTONS = {BEAT_POSITIONS[0]: "left", BEAT_POSITIONS[1]: "center", BEAT_POSITIONS[2]: "right"}
+
+# Hit windows in seconds either side of a beat's ideal crossing of the hit zone.
+# A press further away than "good" does not count.
+HIT_WINDOWS = {
+    "perfect": 0.04,
+    "good": 0.1,
+}
 
 def initialize_hobby(states):
     """
     Initializes the hobby minigame state.
     """
     return {
-        "beats": [],  # List of falling beats (each is a dict with x, y)
+        "beats": [],  # List of falling beats (each is a dict with x, y, spawn_time)
         "last_beat_time": time.time(),
+        "hit_windows": dict(HIT_WINDOWS),
+        "judgements": {"perfect": 0, "good": 0, "miss": 0},
         "score": 0,
         "missed": 0,
         "game_over": False,
@@ -34,26 +46,24 @@ def update_hobby(hobby_state, controls, stats, audio, states):
     # 🔥 Reduce beat interval over time (more notes appear as game progresses)
     beat_interval = max(INITIAL_BEAT_INTERVAL - (elapsed_time / 50), MIN_BEAT_INTERVAL)
 
-    # Generate a new beat at regular intervals
-    if current_time - hobby_state["last_beat_time"] >= beat_interval:
+    # Generate beats on schedule; a long frame spawns the ones it skipped with their real spawn time
+    while current_time - hobby_state["last_beat_time"] >= beat_interval:
+        spawn_time = hobby_state["last_beat_time"] + beat_interval
         x_position = random.choice(BEAT_POSITIONS)  # Pick from 3 zones
-        hobby_state["beats"].append({"x": x_position, "y": 0, "hit": False})  # Spawn new beat with hit status
-        hobby_state["last_beat_time"] = current_time
+        hobby_state["beats"].append({"x": x_position, "y": 0, "hit": False, "spawn_time": spawn_time})
+        hobby_state["last_beat_time"] = spawn_time
 
-    # Move beats down
+    # Position beats from the time since they spawned, not from the number of frames drawn
     for beat in hobby_state["beats"]:
-        beat["y"] += DROP_SPEED
-
-    # Check for hits
-    for beat in hobby_state["beats"][:]:  # Iterate over a copy to allow modification
-        if HIT_ZONE_Y - 1 <= beat["y"] <= HIT_ZONE_Y + 1:  # Allow a small grace period
-            if (
-                (beat["x"] == BEAT_POSITIONS[0] and controls.left_button) or
-                (beat["x"] == BEAT_POSITIONS[1] and controls.center_button) or
-                (beat["x"] == BEAT_POSITIONS[2] and controls.right_button)
-            ):
+        beat["y"] = int((current_time - beat["spawn_time"]) * BEAT_SPEED)
+
+    # Judge every press of this frame against the beats in its lane
+    for x_position, button in BEAT_BUTTONS.items():
+        for press_time in get_press_times(controls, button, current_time):
+            judgement = judge_press(hobby_state, x_position, press_time)
+            if judgement is not None:
                 hobby_state["score"] += 1
-                beat["hit"] = True  # Mark note as successfully hit
+                hobby_state["judgements"][judgement] += 1
                 audio.play_sound("noteHit")  # Play sound for hit
 
     # Count missed notes
@@ -61,6 +71,7 @@ def update_hobby(hobby_state, controls, stats, audio, states):
         if beat["y"] >= MATRIX_HEIGHT:  # If it falls past the bottom
             if not beat["hit"]:  # If it wasn't hit, count as a miss
                 hobby_state["missed"] += 1
+                hobby_state["judgements"]["miss"] += 1
                 audio.play_sound("noteMiss")  # Play sound for miss
             hobby_state["beats"].remove(beat)  # Remove note after it fully leaves the screen
 
@@ -70,6 +81,55 @@ def update_hobby(hobby_state, controls, stats, audio, states):
         apply_hobby_rewards(hobby_state, stats, audio, states)  # Apply stats after game over
 
 
+def crossing_time(beat):
+    """
+    Time at which a beat is exactly on the hit zone.
+    """
+    return beat["spawn_time"] + HIT_ZONE_Y / BEAT_SPEED
+
+
+def get_press_times(controls, button, current_time):
+    """
+    Times (in time.time() seconds) at which a button was pressed this frame.
+
+    Controls that record edge timestamps (core.controls) give the exact press
+    times; the others only tell us the button is down on this frame.
+    """
+    events = getattr(controls, "events", None)
+    if events is not None:
+        now_ns = time.monotonic_ns()
+        return [
+            current_time - (now_ns - event.timestamp_ns) / 1_000_000_000
+            for event in events
+            if event.button == button and event.edge == PRESS
+        ]
+    return [current_time] if getattr(controls, f"{button}_button") else []
+
+
+def judge_press(hobby_state, x_position, press_time):
+    """
+    Match a press against the closest unhit beat in its lane.
+
+    Returns:
+        str or None: "perfect" or "good" if a beat was hit, None if the press
+        was outside every hit window.
+    """
+    windows = hobby_state["hit_windows"]
+    closest, closest_offset = None, None
+    for beat in hobby_state["beats"]:
+        if beat["x"] != x_position or beat["hit"]:
+            continue
+        offset = abs(press_time - crossing_time(beat))
+        if closest_offset is None or offset < closest_offset:
+            closest, closest_offset = beat, offset
+
+    if closest is None or closest_offset > windows["good"]:
+        return None
+    closest["hit"] = True  # Mark note as successfully hit
+    closest["judgement"] = "perfect" if closest_offset <= windows["perfect"] else "good"
+    return closest["judgement"]
+
+
 def apply_hobby_rewards(hobby_state, stats, audio, states):
     """
     Adjusts player stats based on their performance in the hobby mini-game.
@@ -120,4 +180,4 @@ def apply_hobby_rewards(hobby_state, stats, audio, states):
         stats.modify_stat("rest", 0)
         stats.modify_stat("esteem", -10)
 
-    print(f"🎵 Hobby Complete! Score: {current_score}, High Score: {high_score}")
+    log.info("🎵 Hobby complete! Score: %s, high score: %s", current_score, high_score)
@@ -1,6 +1,9 @@
 import time
 import random
 from utils.housing_utlis import calculate_housing_acceptance
+from utils.logger import get_logger
+
+log = get_logger("housing")
 
 # Define thresholds for each house option (by index)
 HOUSE_MONEY_THRESHOLDS = [10, 25, 50, 75]
@@ -87,7 +90,7 @@ def handle_housing_input(housing_state, stats, controls, fps, states, audio):
                 stats.modify_stat("safe", selected_house["comfort"] // 2)
                 stats.modify_stat("money", -selected_house["cost"])
                 audio.play_sound("success")
-                print(f"✅ Moved into {selected_house['name']}.")
+                log.info("✅ Moved into %s.", selected_house['name'])
             else:
                 housing_state["pending"] = False
                 housing_state["reaction_result"] = None
@@ -127,9 +130,9 @@ def handle_housing_input(housing_state, stats, controls, fps, states, audio):
                 housing_state["house_selected"] = True
                 housing_state["countdown_active"] = True
                 housing_state["countdown_timer"] = 3
-                print(f"Selected house: {housing_state['housing_options'][housing_state['current_choice']]['name']}")
+                log.info("Selected house: %s", housing_state['housing_options'][housing_state['current_choice']]['name'])
             else:
-                print("Not enough money for this house!")
+                log.info("Not enough money for this house!")
                 # Optionally, you can add a visual lock/flash here.
     elif housing_state["countdown_active"]:
         if housing_state["countdown_timer"] > 0:
@@ -157,16 +160,16 @@ def handle_housing_input(housing_state, stats, controls, fps, states, audio):
             if reaction_time <= housing_state["reaction_threshold"]:
                 housing_state["reaction_result"] = "pass"
                 audio.play_sound("success")
-                print("Reaction success!")
+                log.info("Reaction success!")
             else:
                 housing_state["reaction_result"] = "fail"
                 audio.play_sound("failure")
-                print("Reaction too slow!")
+                log.info("Reaction too slow!")
             housing_state["reaction_active"] = False
             housing_state["reaction_result_display_time"] = time.time()
         elif reaction_time > housing_state["reaction_threshold"] + 0.5:
             if housing_state["reaction_result"] is None:
                 housing_state["reaction_result"] = "fail"
-                print("Reaction failed (timeout)!")
+                log.info("Reaction failed (timeout)!")
                 housing_state["reaction_active"] = False
                 housing_state["reaction_result_display_time"] = time.time()
@@ -1,5 +1,8 @@
 import random
 import time
+from utils.logger import get_logger
+
+log = get_logger("job")
 
 # --- Configuration based on education level ---
 EDUCATION_CONFIG = {
@@ -55,7 +58,7 @@ PRE_ANIMATION_DELAY = 0.3
 def generate_task_sequence(task_count):
     """Generate a random sequence of tasks (each a number: 0, 1, or 2)."""
     sequence = [random.choice([0, 1, 2]) for _ in range(task_count)]
-    print("Generated sequence:", sequence)
+    log.debug("Generated sequence: %s", sequence)
     return sequence
 
 def initialize_job(education_level):
@@ -117,7 +120,7 @@ def update_job(job_state, controls, audio):
     
     # Phase: Input
     elif job_state["phase"] == "input":
-        print(job_state['phase'])
+        log.debug("Phase: %s", job_state['phase'])
         # Map controls to a number if a button is pressed
         input_value = None
         if controls.left_button:
@@ -134,7 +137,7 @@ def update_job(job_state, controls, audio):
             job_state["phase_start_time"] = current_time
     
     elif job_state["phase"] == "input_animation":
-        print(job_state['phase'])
+        log.debug("Phase: %s", job_state['phase'])
         if current_time - job_state["phase_start_time"] >= (PRE_ANIMATION_DELAY + ITEM_DISPLAY_DURATION - 0.5):
             # Commit the input after animation
             input_value = job_state["last_input"]
@@ -157,7 +160,7 @@ def update_job(job_state, controls, audio):
         if not job_state.get("sound_played", False):
             audio.play_sound("success")  # Play success sound only once
             job_state["sound_played"] = True
-        print(job_state['phase'])
+        log.debug("Phase: %s", job_state['phase'])
         if current_time - job_state["phase_start_time"] >= FEEDBACK_DURATION:
             # Increase difficulty for next round
             job_state["current_round"] += 1
@@ -176,7 +179,7 @@ def update_job(job_state, controls, audio):
         if not job_state.get("sound_played", False):
             audio.play_sound("failure")  # Play failure sound only once
             job_state["sound_played"] = True
-        print(job_state['phase'])
+        log.debug("Phase: %s", job_state['phase'])
         if current_time - job_state["phase_start_time"] >= FEEDBACK_DURATION:
             if job_state["mistake_count"] >= 3:
                 job_state["completed"] = True
@@ -224,5 +227,5 @@ def apply_job_rewards(job_state, stats):
         stats.modify_stat("money", int(7 * multiplier))
         stats.modify_stat("esteem", int(5 * multiplier))
 
-    print(f"Job Complete! Score: {current_score}, High Score: {high_score}, Performance: {performance:.1f}%")
+    log.info("Job complete! Score: %s, high score: %s, performance: %.1f%%", current_score, high_score, performance)
 
@@ -1,6 +1,4 @@
 import random
-import pygame
-from utils.constants import RASPBERRYPI
 
 def initialize_platformer(money_stats):
     """
@@ -148,9 +146,8 @@ def check_goal_reached(game_state, stats, audio):
 
 def draw_platformer(self, game_state, sprite_folder):
     """
-    Render the platformer mini-game screen onto the LED matrix.
-    This version uses the canvas (self.canvas) and then calls render_to_matrix()
-    to push the image to the LED matrix.
+    Render the platformer mini-game screen into the frame buffer (self.framebuffer).
+    The main loop pushes the finished frame to the LED matrix.
     """
     
     tama_position = game_state["tama_position"]
@@ -162,7 +159,7 @@ def draw_platformer(self, game_state, sprite_folder):
     # Draw platforms as white rectangles
     for platform in platforms:
         platform_x, platform_y, platform_width = platform
-        # Calculate pixel coordinates on the canvas
+        # Calculate screen pixel coordinates
         x1 = platform_x * self.pixel_size
         y1 = platform_y * self.pixel_size
         x2 = (platform_x + platform_width) * self.pixel_size
@@ -183,7 +180,3 @@ def draw_platformer(self, game_state, sprite_folder):
     self.draw_sprite_at(tama_x, tama_y, sprite_path, sprite_width=7, sprite_height=7)
 
     # (Optional) You can add other UI elements here if needed.
-
-    # Finally, push the canvas to the LED matrix
-    if self.platform == RASPBERRYPI:
-        self.render_to_matrix()
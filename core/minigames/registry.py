@@ -0,0 +1,54 @@
+import importlib
+import time
+from utils.logger import get_logger
+
+log = get_logger("minigames")
+
+# Screen -> module implementing its minigame
+MINIGAME_MODULES = {
+    "food_screen": "core.minigames.platformer",
+    "education_screen": "core.minigames.education",
+    "socialize_screen": "core.minigames.social",
+    "hobby_screen": "core.minigames.hobby",
+    "job_screen": "core.minigames.job",
+    "housing_screen": "core.minigames.housing",
+}
+
+
+class MinigameRegistry:
+    """
+    Imports each minigame the first time its screen is entered.
+
+    Startup only pays for the games' code once someone plays them (or the
+    background warmup reaches them); after that get() is a dict lookup.
+    Python's import lock makes concurrent first calls from the game and the
+    warmup thread safe.
+
+    Args:
+        modules (dict): Screen name -> module path.
+    """
+
+    def __init__(self, modules=MINIGAME_MODULES):
+        self.modules = modules
+        self.loaded = {}
+
+    def get(self, screen):
+        """
+        The minigame module of a screen, imported on first use.
+
+        Args:
+            screen (str): A key of MINIGAME_MODULES, e.g. "food_screen".
+
+        Returns:
+            module: The minigame's module.
+        """
+        module = self.loaded.get(screen)
+        if module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self.modules[screen])
+            self.loaded[screen] = module
+            log.debug("Loaded %s for %s in %.1f ms", module.__name__, screen, (time.perf_counter() - started) * 1000)
+        return module
+
+
+minigames = MinigameRegistry()
@@ -0,0 +1,102 @@
+import time
+from utils.logger import get_logger
+
+log = get_logger("power")
+
+IDLE_TIMEOUT_SECONDS = 120  # without input before the panel is dimmed
+DIM_FPS = 1                 # tick rate while dimmed
+DIM_BRIGHTNESS = 8          # panel brightness while dimmed
+
+# Power states, as reported by PowerGovernor.stats()
+ACTIVE = "active"   # full rate and brightness
+STILL = "still"     # picture not changing, the scheduler is at its idle rate
+DIMMED = "dimmed"   # nobody has touched the buttons for a while
+
+
+class PowerGovernor:
+    """
+    Dims the panel and slows the loop down when nobody is playing.
+
+    After idle_timeout seconds without a button press the scheduler is capped
+    at dim_fps and the panel brightness drops to dim_brightness. The game
+    keeps running on wall-clock time (Stats.decay_stats and
+    States.update_life_stage work from time.time()), so nothing is lost by
+    ticking slowly. The next press restores the full rate and brightness;
+    since the scheduler polls the controls while sleeping, the press is
+    picked up immediately rather than on the next slow tick.
+
+    Args:
+        graphics (Graphics): Used to change the panel brightness.
+        scheduler (FrameScheduler): Its rate cap is lowered while dimmed.
+        brightness (int): Normal panel brightness.
+        idle_timeout (float): Seconds without input before dimming.
+        dim_fps (int): Tick rate while dimmed.
+        dim_brightness (int): Panel brightness while dimmed.
+    """
+
+    def __init__(self, graphics, scheduler, brightness, idle_timeout=IDLE_TIMEOUT_SECONDS,
+                 dim_fps=DIM_FPS, dim_brightness=DIM_BRIGHTNESS):
+        self.graphics = graphics
+        self.scheduler = scheduler
+        self.brightness = brightness
+        self.idle_timeout = idle_timeout
+        self.dim_fps = dim_fps
+        self.dim_brightness = dim_brightness
+
+        now = time.monotonic()
+        self.dimmed = False
+        self.last_input = now
+        self.last_update = now
+        self.seconds = {ACTIVE: 0.0, STILL: 0.0, DIMMED: 0.0}
+        self.dims = 0
+
+    @property
+    def state(self):
+        if self.dimmed:
+            return DIMMED
+        return STILL if self.scheduler.idle else ACTIVE
+
+    def update(self, active):
+        """
+        Called once per frame.
+
+        Args:
+            active (bool): True if a button was pressed this frame.
+        """
+        now = time.monotonic()
+        self.seconds[self.state] += now - self.last_update
+        self.last_update = now
+
+        if active:
+            self.last_input = now
+            if self.dimmed:
+                self.wake()
+        elif not self.dimmed and now - self.last_input >= self.idle_timeout:
+            self.dim()
+
+    def dim(self):
+        log.info("No input for %.0fs, dimming the panel", self.idle_timeout)
+        self.dimmed = True
+        self.dims += 1
+        self.scheduler.rate_cap = self.dim_fps
+        self.graphics.set_brightness(self.dim_brightness)
+
+    def wake(self):
+        log.info("Input received, restoring full rate and brightness")
+        self.dimmed = False
+        self.scheduler.rate_cap = None
+        self.graphics.set_brightness(self.brightness)
+
+    def stats(self):
+        """
+        Time spent in each power state.
+
+        Returns:
+            dict: Seconds per state, their share of the total, and how many times the panel was dimmed.
+        """
+        total = sum(self.seconds.values()) or 1.0
+        return {
+            "seconds": {state: round(seconds, 1) for state, seconds in self.seconds.items()},
+            "share": {state: round(seconds / total, 3) for state, seconds in self.seconds.items()},
+            "dims": self.dims,
+        }
@@ -0,0 +1,240 @@
+import threading
+import time
+from collections import deque
+import numpy as np
+from PIL import Image
+
+DEFAULT_QUEUE_SIZE = 2  # frames waiting for the presenter thread
+
+
+def dirty_row_ranges(previous, current, merge_gap=2):
+    """
+    Find the rows that differ between two frames.
+
+    Args:
+        previous (numpy.ndarray or None): Last frame pushed, or None if nothing was pushed yet.
+        current (numpy.ndarray): The new HxWx3 frame.
+        merge_gap (int): Ranges separated by this many clean rows or fewer are merged,
+            since one bigger push is cheaper than several tiny ones.
+
+    Returns:
+        list: (start_row, end_row) half-open ranges, empty if the frames are identical.
+    """
+    if previous is None or previous.shape != current.shape:
+        return [(0, current.shape[0])]
+
+    changed = np.flatnonzero((previous != current).any(axis=(1, 2)))
+    if changed.size == 0:
+        return []
+
+    ranges = []
+    start = end = int(changed[0])
+    for row in changed[1:]:
+        row = int(row)
+        if row - end - 1 <= merge_gap:
+            end = row
+        else:
+            ranges.append((start, end + 1))
+            start = end = row
+    ranges.append((start, end + 1))
+    return ranges
+
+
+class FramePresenter:
+    """
+    Pushes finished frames to the LED matrix, skipping frames that did not change.
+
+    Only the dirty row bands are sent with SetImage, and counters record how
+    many frames and rows actually went out to the panel.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.last_frame = None
+        self.frames_submitted = 0
+        self.frames_pushed = 0
+        self.frames_skipped = 0
+        self.rows_pushed = 0
+        self.last_dirty_rows = []
+        self.brightness = None   # Last brightness requested with set_brightness()
+        # Optional listener(token, changed, presented_ns), e.g. core.latency.LatencyProbe.presented.
+        self.listener = None
+
+    def invalidate(self):
+        """Force the next frame to be pushed in full (e.g. after the panel was cleared)."""
+        self.last_frame = None
+
+    def set_brightness(self, brightness):
+        """
+        Change the panel brightness (0-100).
+
+        rgbmatrix applies brightness while pixels are written, so the panel is
+        invalidated and the next frame is pushed again in full.
+        """
+        self.brightness = brightness
+        self.matrix.brightness = brightness
+        self.invalidate()
+
+    def present(self, pixels, token=None):
+        """
+        Push a frame if it differs from the last one.
+
+        Args:
+            pixels (numpy.ndarray): HxWx3 uint8 frame.
+            token: Passed to the listener once the frame was dealt with.
+
+        Returns:
+            bool: True if anything was sent to the matrix.
+        """
+        self.frames_submitted += 1
+        if self.last_frame is not None and np.array_equal(self.last_frame, pixels):
+            self.frames_skipped += 1
+            self.last_dirty_rows = []
+            self._notify(token, False)
+            return False
+
+        self._write(self.matrix, self.last_frame, pixels)
+        if self.last_frame is None or self.last_frame.shape != pixels.shape:
+            self.last_frame = pixels.copy()
+        else:
+            self.last_frame[:] = pixels
+        self.frames_pushed += 1
+        self._notify(token, True)
+        return True
+
+    def _notify(self, token, changed):
+        if token and self.listener is not None:
+            self.listener(token, changed, time.monotonic_ns())
+
+    def _write(self, canvas, canvas_frame, pixels):
+        """
+        Bring a canvas that currently shows canvas_frame up to date with pixels.
+        """
+        height, width = pixels.shape[:2]
+        if (width, height) != (self.matrix.width, self.matrix.height):
+            # Frame and panel disagree on size: rescale and push everything.
+            image = Image.fromarray(pixels, "RGB").resize((self.matrix.width, self.matrix.height), Image.NEAREST)
+            canvas.SetImage(image)
+            dirty = [(0, height)]
+        else:
+            dirty = dirty_row_ranges(canvas_frame, pixels)
+            for start, end in dirty:
+                canvas.SetImage(Image.fromarray(pixels[start:end], "RGB"), 0, start)
+        self.rows_pushed += sum(end - start for start, end in dirty)
+        self.last_dirty_rows = dirty
+
+    def stop(self):
+        """Release the presenter; nothing to do for synchronous pushes."""
+
+    def stats(self):
+        """
+        Snapshot of the presentation counters.
+        """
+        return {
+            "submitted": self.frames_submitted,
+            "pushed": self.frames_pushed,
+            "skipped": self.frames_skipped,
+            "rows_pushed": self.rows_pushed,
+            "push_ratio": self.frames_pushed / self.frames_submitted if self.frames_submitted else 0.0,
+        }
+
+
+class ThreadedPresenter(FramePresenter):
+    """
+    Double-buffered presentation on a dedicated thread.
+
+    The game loop hands finished frames over through a small bounded queue and
+    returns immediately. The presenter thread writes the dirty rows into the
+    back FrameCanvas and swaps it in with SwapOnVSync, so panel I/O overlaps
+    with the next frame's logic and drawing. When the queue is full the oldest
+    waiting frame is dropped, so a slow panel never blocks input handling.
+    """
+
+    def __init__(self, matrix, queue_size=DEFAULT_QUEUE_SIZE):
+        super().__init__(matrix)
+        self.back_canvas = matrix.CreateFrameCanvas()
+        self.back_frame = None   # What back_canvas currently holds
+        self.generation = 0      # Bumped by invalidate(); a push started before it must not publish its frames
+        self.frames_dropped = 0
+        self.queue = deque(maxlen=queue_size)
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="presenter", daemon=True)
+        self.thread.start()
+
+    def invalidate(self):
+        """
+        Force the next frames to be pushed in full.
+
+        A push already in flight on the presenter thread (e.g. one still using
+        the old brightness) sees the bumped generation and leaves both
+        canvases marked unknown instead of recording what it wrote.
+        """
+        with self.condition:
+            self.generation += 1
+            self.last_frame = None
+            self.back_frame = None
+
+    def present(self, pixels, token=None):
+        """
+        Queue a frame for the presenter thread.
+
+        Returns:
+            bool: False if a waiting frame had to be dropped to make room.
+        """
+        frame = pixels.copy()
+        with self.condition:
+            self.frames_submitted += 1
+            dropped = len(self.queue) == self.queue.maxlen
+            if dropped:
+                self.frames_dropped += 1
+                # The dropped frame's token rides on with the newer frame.
+                _, dropped_token = self.queue[0]
+                if dropped_token:
+                    token = dropped_token + (token or [])
+            self.queue.append((frame, token))  # deque(maxlen) discards the oldest entry
+            self.condition.notify()
+        return not dropped
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                frame, token = self.queue.popleft()
+                front_frame, back_frame = self.last_frame, self.back_frame
+                generation = self.generation
+
+            if front_frame is not None and np.array_equal(front_frame, frame):
+                self.frames_skipped += 1
+                self.last_dirty_rows = []
+                self._notify(token, False)
+                continue
+
+            if self.brightness is not None and self.back_canvas.brightness != self.brightness:
+                self.back_canvas.brightness = self.brightness
+            self._write(self.back_canvas, back_frame, frame)
+            self.back_canvas = self.matrix.SwapOnVSync(self.back_canvas)
+            with self.condition:
+                if self.generation == generation:
+                    # The canvas we get back is the one that was showing front_frame.
+                    self.back_frame = front_frame
+                    self.last_frame = frame
+            self.frames_pushed += 1
+            self._notify(token, True)
+
+    def stop(self):
+        """Stop the presenter thread; queued frames are discarded."""
+        with self.condition:
+            self.running = False
+            self.queue.clear()
+            self.condition.notify()
+        self.thread.join(timeout=1.0)
+
+    def stats(self):
+        stats = super().stats()
+        stats["dropped"] = self.frames_dropped
+        stats["queued"] = len(self.queue)
+        return stats
@@ -0,0 +1,149 @@
+import json
+import os
+import signal
+import time
+
+import numpy as np
+from utils.logger import get_logger
+
+log = get_logger("profiler")
+
+WINDOW = 512                  # most recent frames kept per screen and phase
+DEFAULT_PATH = "frame_profile.json"
+
+# Phases of a frame, in the order run_frame goes through them
+PHASES = ("input", "life_stage", "stats", "update", "draw", "present")
+
+
+class FrameProfiler:
+    """
+    Always-on timing of the phases of each frame.
+
+    The frame is split with mark(phase) calls: each one charges the time since
+    the previous mark to that phase, read from time.perf_counter_ns (monotonic,
+    no float conversion). Per frame this costs a handful of clock reads and
+    list writes, so it can stay enabled on the Pi. For every screen and phase
+    the last `window` samples are kept in a ring, and p50/p95/p99 are only
+    computed when a summary is asked for.
+
+    The summary is written as JSON on exit and whenever the process receives
+    SIGUSR1 (`kill -USR1 <pid>`); the signal only sets a flag, and the dump
+    happens at the end of the current frame.
+
+    Args:
+        path (str): Where dump() writes the JSON summary.
+        window (int): Samples kept per screen and phase.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, window=WINDOW):
+        self.path = path
+        self.window = window
+        self.rings = {}           # screen -> {phase: [samples, count]}
+        self.screen = None
+        self.frame_phases = {}    # phase -> ns charged on the current frame
+        self.frame_start = 0
+        self.last_mark = 0
+        self.dump_requested = False
+
+    def install_signal(self):
+        """Dump the profile on SIGUSR1, where the platform has it."""
+        signum = getattr(signal, "SIGUSR1", None)
+        if signum is not None:
+            signal.signal(signum, self._on_signal)
+
+    def _on_signal(self, signum, frame):
+        self.dump_requested = True
+
+    def begin(self, screen):
+        """Start timing a frame of the given screen."""
+        self.screen = screen
+        self.frame_phases = {}
+        self.frame_start = self.last_mark = time.perf_counter_ns()
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to phase."""
+        now = time.perf_counter_ns()
+        self.frame_phases[phase] = self.frame_phases.get(phase, 0) + now - self.last_mark
+        self.last_mark = now
+
+    def end(self):
+        """
+        Close the frame: store its phase times and total, and dump if SIGUSR1 arrived.
+        """
+        self.frame_phases["frame"] = time.perf_counter_ns() - self.frame_start
+        rings = self.rings.get(self.screen)
+        if rings is None:
+            rings = self.rings[self.screen] = {}
+        for phase, elapsed in self.frame_phases.items():
+            ring = rings.get(phase)
+            if ring is None:
+                ring = rings[phase] = [[], 0]
+            samples, count = ring
+            if count < self.window:
+                samples.append(elapsed)
+            else:
+                samples[count % self.window] = elapsed
+            ring[1] = count + 1
+        if self.dump_requested:
+            self.dump_requested = False
+            self.dump()
+
+    def summary(self):
+        """
+        Rolling percentiles per screen and phase, in microseconds.
+
+        Returns:
+            dict: screen -> phase -> {frames, p50_us, p95_us, p99_us, max_us}; "frames"
+                counts every frame seen, the percentiles cover the last `window`.
+        """
+        summary = {}
+        for screen, rings in self.rings.items():
+            phases = {}
+            for phase in PHASES + ("frame",):
+                if phase not in rings:
+                    continue
+                samples, count = rings[phase]
+                values = np.array(samples) / 1000.0
+                p50, p95, p99 = np.percentile(values, (50, 95, 99))
+                phases[phase] = {
+                    "frames": count,
+                    "p50_us": round(float(p50), 1),
+                    "p95_us": round(float(p95), 1),
+                    "p99_us": round(float(p99), 1),
+                    "max_us": round(float(values.max()), 1),
+                }
+            summary[str(screen)] = phases
+        return summary
+
+    def dump(self, path=None):
+        """
+        Write the summary as JSON, replacing the previous dump in one step.
+        """
+        path = path or self.path
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "pid": os.getpid(),
+                "time": time.time(),
+                "window": self.window,
+                "screens": self.summary(),
+            }, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+        log.info("Frame profile written to %s", path)
+
+
+class NullProfiler:
+    """Stands in for FrameProfiler when nothing is being timed."""
+
+    def begin(self, screen):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,164 @@
+import time
+import numpy as np
+
+DEFAULT_FPS = 25
+IDLE_FPS = 2               # rate while nothing on the panel changes
+IDLE_AFTER_SECONDS = 1.0   # how long the picture must stay still before idling
+WAKE_POLL_SECONDS = 0.005  # slice long sleeps so a press ends them early
+
+# Target rate of each screen; screens not listed run at the default rate.
+SCREEN_FPS = {
+    "hobby_screen": 60,     # beats are positioned from time, more frames = smoother scrolling
+    "food_screen": 25,      # platformer physics advance one step per frame
+    "socialize_screen": 25,
+    "stats_screen": 5,
+    "education_screen": 10,
+}
+
+# Screens whose game logic counts frames, so they must never slow down to the idle rate.
+FRAME_COUNTED_SCREENS = ("food_screen", "socialize_screen")
+
+
+class FrameScheduler:
+    """
+    Paces the main loop against absolute deadlines on the monotonic clock.
+
+    Every frame is due one period after the previous one was due, so the time
+    spent updating and drawing is part of the period instead of being added
+    on top of it. A frame that finishes after the next deadline is counted as
+    an overrun and the schedule restarts from now rather than rushing to
+    catch up. Each screen runs at its own rate from SCREEN_FPS, and once the
+    picture has not changed for IDLE_AFTER_SECONDS without any input, the
+    loop drops to IDLE_FPS until something changes again.
+
+    Args:
+        default_fps (int): Rate of screens missing from screen_fps.
+        screen_fps (dict): Screen name -> target frames per second.
+        idle_fps (int): Rate while the picture is still.
+        idle_after (float): Seconds without change before idling.
+    """
+
+    def __init__(self, default_fps=DEFAULT_FPS, screen_fps=None, idle_fps=IDLE_FPS, idle_after=IDLE_AFTER_SECONDS):
+        self.default_fps = default_fps
+        self.screen_fps = SCREEN_FPS if screen_fps is None else screen_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+
+        self.deadline = None      # When the current frame was due
+        self.screen = None
+        self.fps = default_fps    # Rate of the current frame
+        self.idle = False
+        self.still_since = None
+        self.last_pixels = None
+        self.rate_cap = None      # Upper bound on the rate, e.g. set by core.power.PowerGovernor
+
+        self.frames = 0
+        self.idle_frames = 0
+        self.overruns = 0
+        self.late_seconds = 0.0
+        self.max_late_seconds = 0.0
+        self.slept_seconds = 0.0
+        self.wakes = 0
+        self.per_screen = {}      # screen -> [frames, overruns]
+
+    def frame_rate(self, screen):
+        """
+        Start a frame on a screen and choose the rate it runs at.
+
+        Args:
+            screen (str): Current screen.
+
+        Returns:
+            int: Frames per second of this frame, for logic that counts frames.
+        """
+        now = time.monotonic()
+        if self.deadline is None:
+            self.deadline = now
+        if screen != self.screen:
+            self.screen = screen
+            self._wake(now)
+        target = self.screen_fps.get(screen, self.default_fps)
+        if screen not in FRAME_COUNTED_SCREENS:
+            if self.idle:
+                target = min(target, self.idle_fps)
+            if self.rate_cap:
+                target = min(target, self.rate_cap)
+        self.fps = target
+        return target
+
+    def wait(self, pixels=None, active=False, wake=None):
+        """
+        Sleep until the next frame is due.
+
+        Args:
+            pixels (numpy.ndarray): The frame just drawn, to detect a still picture.
+            active (bool): True if there was input this frame.
+            wake (callable): Optional wake() -> bool, polled while sleeping;
+                returning True (e.g. a button is waiting) starts the next frame now.
+        """
+        now = time.monotonic()
+        if self.deadline is None:
+            self.deadline = now
+
+        changed = pixels is not None and (self.last_pixels is None or not np.array_equal(self.last_pixels, pixels))
+        if changed:
+            self.last_pixels = pixels.copy()
+        if changed or active or pixels is None:
+            self.still_since = now
+            self.idle = False
+        elif now - self.still_since >= self.idle_after:
+            self.idle = True
+
+        counts = self.per_screen.setdefault(self.screen, [0, 0])
+        counts[0] += 1
+        self.frames += 1
+        if self.fps < self.screen_fps.get(self.screen, self.default_fps):
+            self.idle_frames += 1
+
+        next_deadline = self.deadline + 1.0 / self.fps
+        late = now - next_deadline
+        if late > 0:
+            self.overruns += 1
+            counts[1] += 1
+            self.late_seconds += late
+            self.max_late_seconds = max(self.max_late_seconds, late)
+            self.deadline = now
+            return
+
+        sleep_start = now
+        if wake is None:
+            time.sleep(next_deadline - now)
+        else:
+            while now < next_deadline:
+                if wake():
+                    # Input is waiting: start the next frame now, at the screen's full rate.
+                    self.wakes += 1
+                    self._wake(now)
+                    next_deadline = now
+                    break
+                time.sleep(min(WAKE_POLL_SECONDS, next_deadline - now))
+                now = time.monotonic()
+        self.slept_seconds += time.monotonic() - sleep_start
+        self.deadline = next_deadline
+
+    def _wake(self, now):
+        self.idle = False
+        self.still_since = now
+
+    def stats(self):
+        """
+        Pacing counters since the scheduler was created.
+
+        Returns:
+            dict: Frames, idle frames, overruns with their lateness, and per-screen (frames, overruns).
+        """
+        return {
+            "frames": self.frames,
+            "idle_frames": self.idle_frames,
+            "overruns": self.overruns,
+            "mean_late_ms": round(self.late_seconds * 1000 / self.overruns, 2) if self.overruns else 0.0,
+            "max_late_ms": round(self.max_late_seconds * 1000, 2),
+            "wakes": self.wakes,
+            "slept_s": round(self.slept_seconds, 2),
+            "screens": {screen: tuple(counts) for screen, counts in self.per_screen.items()},
+        }
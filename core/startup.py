@@ -0,0 +1,234 @@
+import threading
+import time
+
+from core.minigames.registry import minigames
+from utils.logger import get_logger
+from utils.sprite_sets import sprite_sets
+
+log = get_logger("startup")
+
+LIFE_STAGES = ("egg", "small", "adult", "dead")  # warmed in the order a pet reaches them
+WARM_PAUSE_SECONDS = 0.002  # between warmup jobs, so the game thread gets the GIL back
+
+
+class StartupTimeline:
+    """
+    Records how long each startup step took, and on which thread.
+
+    Steps can run concurrently with run_parallel(); report() shows them on a
+    shared time axis starting when the timeline was created.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.steps = []   # (name, thread, start, end), seconds since self.start
+        self.lock = threading.Lock()
+
+    def step(self, name, function, *args):
+        """
+        Run function(*args) as a named step.
+
+        Returns:
+            The function's result.
+        """
+        started = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            ended = time.perf_counter()
+            with self.lock:
+                self.steps.append((name, threading.current_thread().name,
+                                   started - self.start, ended - self.start))
+
+    def mark(self, name, since=None):
+        """
+        Record an instant, e.g. when the first frame was shown.
+
+        Args:
+            since (float): If given, record a span from this time (seconds on the timeline) to now instead.
+        """
+        now = time.perf_counter() - self.start
+        with self.lock:
+            self.steps.append((name, threading.current_thread().name, now if since is None else since, now))
+
+    def run_parallel(self, tasks, inline=()):
+        """
+        Run several steps at once, one thread each, and wait for all of them.
+
+        Args:
+            tasks (dict): Step name -> callable taking no arguments.
+            inline (tuple): Names to run on the calling thread instead (e.g. pygame display setup).
+
+        Returns:
+            dict: Step name -> result. The first exception raised by a step is re-raised.
+        """
+        results = {}
+        errors = []
+
+        def run(name, function):
+            try:
+                results[name] = self.step(name, function)
+            except BaseException as error:
+                errors.append(error)
+
+        threads = []
+        for name, function in tasks.items():
+            if name in inline:
+                continue
+            thread = threading.Thread(target=run, args=(name, function), name=f"startup-{name}", daemon=True)
+            thread.start()
+            threads.append(thread)
+        for name in inline:
+            run(name, tasks[name])
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def report(self, width=40):
+        """
+        Startup steps as text lines, with a bar showing when each one ran.
+        """
+        with self.lock:
+            steps = sorted(self.steps, key=lambda step: step[2])
+        total = max((end for _, _, _, end in steps), default=0.0) or 1.0
+        lines = [f"Startup timeline ({total * 1000:.0f} ms)"]
+        for name, thread, start, end in steps:
+            first = int(start / total * width)
+            bar = " " * first + "#" * max(1, int(end / total * width) - first)
+            lines.append(f"  {name:<22} {start * 1000:7.1f} +{(end - start) * 1000:7.1f} ms  "
+                         f"|{bar:<{width}}| {thread}")
+        return lines
+
+    def log_report(self):
+        # One record: the logger would rate-limit a run of identical "%s" lines.
+        log.info("%s", "\n".join(self.report()))
+
+
+class AssetWarmer:
+    """
+    Fills the sprite and text caches in the background after startup.
+
+    Jobs run in priority order on one daemon thread: the pet's sprites for
+    every life stage first, then each screen in the order players usually
+    reach them. A screen is warmed by drawing it once on an off-screen
+    headless Graphics, so exactly the (sprite, size, font, text) entries the
+    real draw calls will ask for end up in the shared caches, and the first
+    visit does not decode PNGs or load fonts. Failures are logged and
+    skipped; warmup never stops the game.
+
+    Args:
+        graphics (Graphics): The game's Graphics; the off-screen one is made the same size.
+        character (str): Character whose sprites are warmed.
+        timeline (StartupTimeline): Where each job's timing is recorded.
+    """
+
+    def __init__(self, graphics, character, timeline=None):
+        self.graphics = graphics
+        self.character = character
+        self.timeline = timeline or StartupTimeline()
+        self.thread = None
+        self.done = threading.Event()
+
+    def jobs(self):
+        """
+        (name, callable) pairs, most urgent first.
+        """
+        stages = sprite_sets.stages(self.character)
+        jobs = [(f"sprites {stage}", self._stage_loader(stage)) for stage in LIFE_STAGES if stage in stages]
+        jobs += [
+            ("screen home", self._warm_home),
+            ("screen stats", self._warm_stats),
+            ("screen food", self._warm_food),
+            ("screen education", self._warm_education),
+            ("screen hobby", self._warm_hobby),
+            ("screen socialize", self._warm_social),
+            ("screen job", self._warm_job),
+            ("screen housing", self._warm_housing),
+        ]
+        return jobs
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        started = time.perf_counter()
+        # Imported here rather than at the top: core.graphics is heavy and only this thread needs it.
+        from core.graphics import Graphics
+        from core.headless import NullMatrix
+        from utils.constants import HEADLESS
+
+        self.scratch = Graphics(NullMatrix(self.graphics.matrix_width, self.graphics.matrix_height),
+                                self.graphics.matrix_width, self.graphics.matrix_height, 1, platform=HEADLESS)
+        failed = 0
+        for name, job in self.jobs():
+            try:
+                self.timeline.step(f"warm {name}", job)
+            except Exception as error:
+                failed += 1
+                log.warning("Warmup of %s failed: %s", name, error)
+            time.sleep(WARM_PAUSE_SECONDS)
+        log.info("Asset warmup finished in %.0f ms (%d jobs failed)", (time.perf_counter() - started) * 1000, failed)
+        self.timeline.log_report()
+        self.done.set()
+
+    def _folder(self, stage):
+        return f"assets/sprites/{self.character}/{stage}"
+
+    def _stage_loader(self, stage):
+        return lambda: sprite_sets.get(self.character, stage)
+
+    def _new_states(self):
+        from core.states import States
+        states = States()
+        states.character = self.character
+        states.stage_of_life = "adult"
+        return states
+
+    def _warm_home(self):
+        states = self._new_states()
+        self.scratch.set_sprites(sprite_sets.get(self.character, "adult"))
+        for index in range(len(states.point_screens)):
+            self.scratch.draw_home_screen(index, states)
+
+    def _warm_stats(self):
+        from core.stats import Stats
+        self.scratch.clear_screen()
+        Stats().render_stats_screen(self.scratch)
+
+    def _warm_food(self):
+        states = self._new_states()
+        states.start_platformer(0)
+        minigames.get("food_screen").draw_platformer(self.scratch, states.platformer_state, self._folder("adult"))
+
+    def _warm_education(self):
+        minigames.get("education_screen")
+        states = self._new_states()
+        for suitcase in (0, 1):
+            self.scratch.draw_education_screen(suitcase)
+        option = states.education_options[0]
+        for frame in range(3):
+            self.scratch.draw_education_animation(0, frame, option["level"], option["loan"])
+
+    def _warm_hobby(self):
+        self.scratch.draw_hobby_screen(minigames.get("hobby_screen").initialize_hobby(self._new_states()))
+
+    def _warm_social(self):
+        self.scratch.set_sprites(sprite_sets.get(self.character, "adult"))
+        social_state = minigames.get("socialize_screen").initialize_socializing(self.scratch)
+        self.scratch.draw_social_screen(self.scratch.sprites, social_state["other_tama_sprite"], social_state)
+
+    def _warm_job(self):
+        job = minigames.get("job_screen")
+        for education_level in job.EDUCATION_CONFIG:
+            self.scratch.draw_job_screen(job.initialize_job(education_level))
+
+    def _warm_housing(self):
+        from core.stats import Stats
+        stats = Stats()
+        housing_state = minigames.get("housing_screen").initialize_housing()
+        for choice in range(len(housing_state["housing_options"])):
+            housing_state["current_choice"] = choice
+            self.scratch.draw_housing_screen(housing_state, stats)
@@ -1,7 +1,13 @@
 import time
-from core.minigames.platformer import initialize_platformer
-from core.minigames.hobby import initialize_hobby  # Import Hobby Minigame
-from core.minigames.job import initialize_job  # Placeholder for Job Minigame
+import random
+from core.minigames.registry import minigames
+from utils.logger import get_logger
+
+log = get_logger("states")
+
+# Seconds on the home screen between random events, drawn once per cooldown. The old check rolled
+# randint(50, 200) every frame, which at 25 fps almost always fired 50-56 s in; this keeps that cadence.
+RANDOM_EVENT_COOLDOWN = (50, 56)
 
 RANDOM_EVENTS = [
     {
@@ -107,6 +113,7 @@ class States:
             "prompt": "",
             "outcome": None,
             "cooldown_timer": time.time(),
+            "cooldown": random.randint(*RANDOM_EVENT_COOLDOWN),
             "selection": "yes"  # or "no"
         }
 
@@ -145,13 +152,13 @@ class States:
         """
         self.education_level = level
         self.student_loan = loan
-        print(f"Education Level: {level}, Student Loan: ${loan}")
+        log.info("Education level: %s, student loan: $%s", level, loan)
 
     def transition_to_life_stage(self, new_stage):
         """
         Transition to a new life stage.
         """
-        print(f"Transitioning from {self.stage_of_life} to {new_stage}")
+        log.info("Transitioning from %s to %s", self.stage_of_life, new_stage)
         self.stage_of_life = new_stage
         self.start_time = time.time()  # Reset timer for the new stage
 
@@ -159,7 +166,7 @@ class States:
         """
         Transition to a new screen.
         """
-        print(f"Transitioning to {new_screen}")
+        log.info("Transitioning to %s", new_screen)
         self.current_screen = new_screen
 
     def cycle_point(self):
@@ -184,7 +191,7 @@ class States:
         """
         Initialize the platformer minigame state.
         """
-        self.platformer_state = initialize_platformer(money_stats)
+        self.platformer_state = minigames.get("food_screen").initialize_platformer(money_stats)
 
     def reset_platformer(self):
         """
@@ -196,7 +203,7 @@ class States:
         """
         Initialize the hobby rhythm-based minigame.
         """
-        self.hobby_state = initialize_hobby(self)
+        self.hobby_state = minigames.get("hobby_screen").initialize_hobby(self)
 
     def reset_hobby(self):
         """
@@ -210,14 +217,14 @@ class States:
         """
         if score > self.hobby_high_score:
             self.hobby_high_score = score
-            print(f"New Hobby High Score: {self.hobby_high_score}")
+            log.info("New hobby high score: %s", self.hobby_high_score)
 
     def start_job(self):
         """
         Initialize the job mini-game (to be implemented).
         """
         if self.stage_of_life == "adult":
-            self.job_state = initialize_job()
+            self.job_state = minigames.get("job_screen").initialize_job()
 
     def reset_job(self):
         """
@@ -225,6 +232,16 @@ class States:
         """
         self.job_state = None
 
+    def start_random_event_cooldown(self):
+        """
+        Close the current random event and pick how long until the next one.
+        """
+        self.random_event.update({
+            "active": False,
+            "cooldown_timer": time.time(),
+            "cooldown": random.randint(*RANDOM_EVENT_COOLDOWN),
+        })
+
     def get_available_screens(self):
         """
         Get the list of available screens based on the life stage.
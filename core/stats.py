@@ -1,5 +1,8 @@
 import time
-from utils.text_utils import text_to_matrix, draw_money_signal
+from utils.text_utils import text_to_mask, draw_money_signal
+from utils.logger import get_logger
+
+log = get_logger("stats")
 
 class Stats:
     def __init__(self):
@@ -25,16 +28,22 @@ class Stats:
         self.font_size = 11
 
     def decay_stats(self):
+        """
+        Apply every decay interval that has elapsed since the last update, so
+        stats decay at the same pace however rarely this is called (e.g. while
+        the loop runs at a low idle rate).
+        """
         current_time = time.time()
-        if current_time - self.last_update_time >= self.decay_interval:
+        intervals = int((current_time - self.last_update_time) // self.decay_interval)
+        if intervals > 0:
             for stat in self.decay_rates:
-                self.stats[stat] = max(0, self.stats[stat] - self.decay_rates[stat])
-            self.last_update_time = current_time
+                self.stats[stat] = max(0, self.stats[stat] - self.decay_rates[stat] * intervals)
+            self.last_update_time += intervals * self.decay_interval
 
     def modify_stat(self, stat, amount):
         if stat in self.stats:
             self.stats[stat] = max(0, min(120, self.stats[stat] + amount))  # Keep within 0-100
-            print(f"Updated {stat}: {self.stats[stat]}")
+            log.debug("Updated %s: %s", stat, self.stats[stat])
 
     def update_education_stats(self, education_level, student_loan = 0):
         """
@@ -48,7 +57,7 @@ class Stats:
         money = max(-20, self.stats["money"] - student_loan / 1000)  # Deduct loan, ensuring non-negative money
         # Ensure money is integer
         self.stats["money"] = int(money) if isinstance(money, float) else money
-        print('[Stats] Updating money to:', self.stats['money'])
+        log.debug("Updating money to: %s", self.stats['money'])
 
     def render_stats_screen(self, graphics):
         stats_left_keys = ["food", "rest", "safe"]
@@ -69,7 +78,7 @@ class Stats:
         for row_index, stat_key in enumerate(stats_left_keys):
             stat_value = max(0, min(100, self.stats[stat_key]))
             row_text = f"{stat_key[0].upper() if stat_key != 'safe' else 'S'}:{stat_value}"
-            text_matrix = text_to_matrix(
+            text_mask = text_to_mask(
                 row_text,
                 self.font_path,
                 self.font_size,
@@ -77,21 +86,13 @@ class Stats:
                 row_height,
             )
             color = get_color(stat_value)
-            for y, row_pixels in enumerate(text_matrix):
-                for x, pixel in enumerate(row_pixels):
-                    if pixel != (0, 0, 0):
-                        screen_x = x * graphics.pixel_size
-                        screen_y = (row_index * row_height + y) * graphics.pixel_size
-                        graphics.draw.rectangle(
-                            [screen_x, screen_y, screen_x + graphics.pixel_size - 1, screen_y + graphics.pixel_size - 1],
-                            fill=color
-                        )
+            graphics.framebuffer.composite(text_mask, 0, row_index * row_height, color)
 
         # Draw right stats
         for row_index, stat_key in enumerate(stats_right_keys):
             stat_value = max(0, min(100, self.stats[stat_key]))
             row_text = f"{stat_key[:2].capitalize()}:\u200A{stat_value}"
-            text_matrix = text_to_matrix(
+            text_mask = text_to_mask(
                 row_text,
                 self.font_path,
                 self.font_size,
@@ -99,34 +100,21 @@ class Stats:
                 row_height,
             )
             color = get_color(stat_value)
-            for y, row_pixels in enumerate(text_matrix):
-                for x, pixel in enumerate(row_pixels):
-                    if pixel != (0, 0, 0):
-                        screen_x = (graphics.matrix_width // 2 + x + 1) * graphics.pixel_size
-                        screen_y = (row_index * row_height + y) * graphics.pixel_size
-                        graphics.draw.rectangle(
-                            [screen_x, screen_y, screen_x + graphics.pixel_size - 1, screen_y + graphics.pixel_size - 1],
-                            fill=color
-                        )
+            graphics.framebuffer.composite(text_mask, graphics.matrix_width // 2 + 1, row_index * row_height, color)
 
                 # Draw money symbol in top-right corner
         money = self.stats["money"]
-        money_matrix = text_to_matrix(
+        money_mask = text_to_mask(
             "$",
             self.font_path,
             self.font_size,
             graphics.matrix_width // 2,
             row_height,
         )
-        for y, row_pixels in enumerate(money_matrix):
-            for x, pixel in enumerate(row_pixels):
-                if pixel != (0, 0, 0):
-                    screen_x = (graphics.matrix_width - graphics.pixel_size * (len(row_pixels) - x))
-                    screen_y = y * graphics.pixel_size + 21
-                    graphics.draw.rectangle(
-                        [screen_x, screen_y, screen_x + graphics.pixel_size, screen_y + graphics.pixel_size - 1],
-                        fill='white'
-                    )
+        money_x = graphics.matrix_width - money_mask.shape[1]
+        # The dollar sign is drawn two pixels wide for a bolder look.
+        graphics.framebuffer.composite(money_mask, money_x, 21, 'white')
+        graphics.framebuffer.composite(money_mask, money_x + 1, 21, 'white')
         draw_money_signal(
             graphics.draw,
             x=graphics.matrix_width // 2 + 6,
@@ -1,48 +1,69 @@
+import time
 import pygame
-import threading
 import numpy as np
+from utils.constants import SOUND_MAP
+from utils.logger import get_logger
+
+log = get_logger("audio")
+
+NOTE_DURATION = 0.2     # seconds each note rings
+NOTE_SPACING = 0.14     # seconds between note starts, so consecutive notes overlap slightly
+VOLUME = 0.5
+CHANNELS = 4            # mixer channels reserved for game sounds
+
 
 class AudioManager:
+    """
+    Debug-build audio through pygame's mixer.
+
+    Every sequence in SOUND_MAP is rendered once at startup into a single
+    Sound (notes mixed at their offsets), and play_sound() just starts it
+    on one of CHANNELS reserved mixer channels: no synthesis, no allocation
+    and no thread per call. A free channel is used if there is one;
+    otherwise the sound started longest ago is cut off.
+    """
+
     def __init__(self, sample_rate=44100):
         self.sample_rate = sample_rate
-        self.lock = threading.Lock()
         pygame.mixer.init(frequency=sample_rate, size=-16, channels=1)
-    
-    def _generate_tone(self, frequency, duration=0.2, volume=0.5):
+        # The device may not give us exactly what we asked for.
+        self.sample_rate, _, self.output_channels = pygame.mixer.get_init()
+
+        pygame.mixer.set_num_channels(max(CHANNELS, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(CHANNELS)]
+        self.started = [0.0] * CHANNELS   # time.monotonic() each channel last started playing
+
+        self.sounds = {sound_type: self._render(frequencies) for sound_type, frequencies in SOUND_MAP.items()}
+
+    def _generate_tone(self, frequency, duration=NOTE_DURATION, volume=VOLUME):
         t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        wave = 0.5 * np.sin(2 * np.pi * frequency * t)
-        audio = (volume * wave * (2**15 - 1)).astype(np.int16)  # 16-bit audio
-        sound = pygame.sndarray.make_sound(audio)
-        return sound
-
-    def _play_notes(self, frequencies, duration=0.2):
-        with self.lock:
-            for freq in frequencies:
-                sound = self._generate_tone(freq, duration)
-                sound.play()
-                pygame.time.delay(int(duration * 700))  # delay in ms
+        return volume * 0.5 * np.sin(2 * np.pi * frequency * t)
+
+    def _render(self, frequencies):
+        """
+        Mix a note sequence into one Sound, each note starting NOTE_SPACING after the previous one.
+        """
+        spacing = int(self.sample_rate * NOTE_SPACING)
+        tones = [self._generate_tone(freq) for freq in frequencies]
+        wave = np.zeros(spacing * (len(tones) - 1) + len(tones[-1]))
+        for i, tone in enumerate(tones):
+            wave[i * spacing:i * spacing + len(tone)] += tone
+        audio = (np.clip(wave, -1.0, 1.0) * (2**15 - 1)).astype(np.int16)  # 16-bit audio
+        if self.output_channels > 1:
+            audio = np.ascontiguousarray(np.repeat(audio[:, None], self.output_channels, axis=1))
+        return pygame.sndarray.make_sound(audio)
 
     def play_sound(self, sound_type):
-        sound_map = {
-            'click': [600],
-            'noteHit': [800],
-            'noteMiss': [400],
-            'jump': [400, 700],
-            'workElement': [300, 500],
-            'statLow': [330, 250],
-            'success': [600, 800, 1000],
-            'failure': [400, 300, 200],
-            'gameWin': [523, 587, 659, 784],
-            'gameLose': [659, 587, 523, 400],
-            'suitcaseOpen': [300, 600, 300, 600],
-            'happy': [523, 659, 784],
-            'sad': [784, 659, 523]
-        }
-
-        if sound_type in sound_map:
-            threading.Thread(target=self._play_notes, args=(sound_map[sound_type],)).start()
-        else:
-            print(f"Unknown sound type: {sound_type}")
+        sound = self.sounds.get(sound_type)
+        if sound is None:
+            log.warning("Unknown sound type: %s", sound_type)
+            return
+        free = [i for i, channel in enumerate(self.channels) if not channel.get_busy()]
+        candidates = free or range(CHANNELS)
+        index = min(candidates, key=self.started.__getitem__)
+        self.channels[index].play(sound)
+        self.started[index] = time.monotonic()
 
     def cleanup(self):
         pygame.mixer.quit()
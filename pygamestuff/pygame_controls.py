@@ -33,3 +33,7 @@ class Controls:
             self.last_press = current_time
         else:
             self.center_button = False
+
+    def pending(self):
+        """Whether a key went down since the window events were last read."""
+        return pygame.event.peek(pygame.KEYDOWN)
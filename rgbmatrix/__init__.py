@@ -1,7 +1,16 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
+import os
+
 __version__ = "0.0.1"
 __author__ = "Christoph Friedrich <christoph.friedrich@vonaffenfels.de>"
 
-from .core import RGBMatrix, FrameCanvas, RGBMatrixOptions
+# The pure-Python emulator is only used when RGBMATRIX_EMULATOR=1 asks for it
+# (script.py emulator=true, benchmarks); otherwise a missing or broken build of
+# the compiled bindings is an error, not a dark panel.
+EMULATED = bool(os.environ.get("RGBMATRIX_EMULATOR"))
+if EMULATED:
+    from .emulator import RGBMatrix, FrameCanvas, RGBMatrixOptions
+else:
+    from .core import RGBMatrix, FrameCanvas, RGBMatrixOptions
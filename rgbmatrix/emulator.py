@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Pure-Python emulator of the rgbmatrix bindings.
+
+Implements the parts of RGBMatrix, RGBMatrixOptions and FrameCanvas the game
+uses, so the production presentation path (get_matrix() -> Graphics ->
+render_to_matrix) runs on machines without a Pi or the C library. Frames
+that reach the panel are recorded in a memory-bounded ring, after the
+pixel mapper and brightness have been applied, and every push is timed.
+"""
+from __future__ import absolute_import
+
+import threading
+import time
+from collections import deque
+
+import numpy as np
+from utils.logger import get_logger
+
+log = get_logger("emulator")
+
+DEFAULT_HISTORY_BYTES = 4 * 1024 * 1024  # panel frames kept for inspection
+
+
+class RGBMatrixOptions(object):
+    """Same option names and defaults as the C++ RGBMatrix::Options."""
+
+    def __init__(self):
+        self.hardware_mapping = "regular"
+        self.rows = 32
+        self.cols = 32
+        self.chain_length = 1
+        self.parallel = 1
+        self.pwm_bits = 11
+        self.pwm_lsb_nanoseconds = 130
+        self.brightness = 100
+        self.scan_mode = 0
+        self.multiplexing = 0
+        self.row_address_type = 0
+        self.disable_hardware_pulsing = False
+        self.show_refresh_rate = False
+        self.inverse_colors = False
+        self.led_rgb_sequence = "RGB"
+        self.pixel_mapper_config = ""
+        self.panel_type = ""
+        self.pwm_dither_bits = 0
+        self.limit_refresh_rate_hz = 0
+        self.gpio_slowdown = 1
+        self.daemon = 0
+        self.drop_privileges = 1
+        self.drop_priv_user = ""
+        self.drop_priv_group = ""
+
+
+def parse_pixel_mapper(config):
+    """
+    Turn a pixel_mapper_config string such as "Rotate:180;Mirror:H" into
+    a list of (name, parameter) steps. Unsupported mappers are skipped.
+    """
+    steps = []
+    for entry in (config or "").split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, parameter = entry.partition(":")
+        if name == "Rotate" and parameter in ("0", "90", "180", "270"):
+            steps.append((name, int(parameter)))
+        elif name == "Mirror" and parameter.upper() in ("H", "V"):
+            steps.append((name, parameter.upper()))
+        else:
+            log.warning("Ignoring unsupported pixel mapper '%s'", entry)
+    return steps
+
+
+def map_to_panel(frame, steps):
+    """
+    Apply pixel mapper steps to a logical HxWx3 frame, giving what the panel shows.
+    """
+    for name, parameter in steps:
+        if name == "Rotate":
+            frame = np.rot90(frame, -(parameter // 90))  # clockwise, like the C++ mapper
+        elif parameter == "H":
+            frame = frame[:, ::-1]
+        else:
+            frame = frame[::-1]
+    return frame
+
+
+class Canvas(object):
+    """A logical-coordinate pixel buffer with the rgbmatrix drawing calls."""
+
+    def __init__(self, width, height, brightness=100):
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+        self._brightness = brightness
+        self.pwmBits = 11
+
+    @property
+    def width(self):
+        return self.pixels.shape[1]
+
+    @property
+    def height(self):
+        return self.pixels.shape[0]
+
+    @property
+    def brightness(self):
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value):
+        self._brightness = max(0, min(100, int(value)))
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        if image.mode != "RGB":
+            raise Exception("Currently, only RGB mode is supported for SetImage(). Please create images with "
+                            "mode 'RGB' or convert first with image = image.convert('RGB').")
+        start = time.perf_counter()
+        src = np.asarray(image, dtype=np.uint8)
+        img_height, img_width = src.shape[:2]
+        x0, y0 = max(0, offset_x), max(0, offset_y)
+        x1, y1 = min(self.width, offset_x + img_width), min(self.height, offset_y + img_height)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = src[y0 - offset_y:y1 - offset_y, x0 - offset_x:x1 - offset_x]
+        self._changed((x1 - x0) * (y1 - y0) if x0 < x1 and y0 < y1 else 0, start)
+
+    def SetPixel(self, x, y, red, green, blue):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            start = time.perf_counter()
+            self.pixels[y, x] = (red, green, blue)
+            self._changed(1, start)
+
+    def Fill(self, red, green, blue):
+        start = time.perf_counter()
+        self.pixels[:] = (red, green, blue)
+        self._changed(self.width * self.height, start)
+
+    def Clear(self):
+        start = time.perf_counter()
+        self.pixels[:] = 0
+        self._changed(self.width * self.height, start)
+
+    def _changed(self, pixels_written, start):
+        """Hook for the matrix to notice writes to the canvas it is displaying."""
+
+
+class FrameCanvas(Canvas):
+    """Off-screen canvas from RGBMatrix.CreateFrameCanvas(), shown with SwapOnVSync."""
+
+    def __init__(self, width, height, brightness=100, matrix=None):
+        super(FrameCanvas, self).__init__(width, height, brightness)
+        self._matrix = matrix
+
+    def _changed(self, pixels_written, start):
+        if self._matrix is not None:
+            self._matrix._canvas_written(self, pixels_written, start)
+
+
+class RGBMatrix(Canvas):
+    """
+    Emulated LED matrix.
+
+    Like the real library, drawing directly on the matrix updates the panel
+    immediately, while FrameCanvas drawing only shows after SwapOnVSync.
+    Each update is timed and the resulting panel image is appended to
+    `frames`, a ring of (timestamp, HxWx3 array) bounded by history_bytes.
+    """
+
+    def __init__(self, rows=0, chains=0, parallel=0, options=None, history_bytes=DEFAULT_HISTORY_BYTES):
+        if options is None:
+            options = RGBMatrixOptions()
+        if rows > 0:
+            options.rows = rows
+        if chains > 0:
+            options.chain_length = chains
+        if parallel > 0:
+            options.parallel = parallel
+        self.options = options
+
+        self.mapper = parse_pixel_mapper(options.pixel_mapper_config)
+        # Canvas size as the application sees it: a quarter turn swaps the panel's sides.
+        width = options.cols * options.chain_length
+        height = options.rows * options.parallel
+        quarter_turns = sum(parameter // 90 for name, parameter in self.mapper if name == "Rotate")
+        if quarter_turns % 2:
+            width, height = height, width
+        super(RGBMatrix, self).__init__(width, height, options.brightness)
+        self.luminanceCorrect = True
+
+        frame_bytes = width * height * 3
+        self.frames = deque(maxlen=max(1, history_bytes // frame_bytes))
+        self.front = self  # Canvas currently on the panel
+        self.refresh_interval = 1.0 / options.limit_refresh_rate_hz if options.limit_refresh_rate_hz else 0.0
+        self.last_vsync = 0.0
+        self.lock = threading.Lock()
+
+        self.pushes = 0
+        self.swaps = 0
+        self.pixels_written = 0
+        self.push_seconds = 0.0
+        self.first_push = None
+        self.last_push = None
+
+    def CreateFrameCanvas(self):
+        return FrameCanvas(self.width, self.height, self.brightness, matrix=self)
+
+    def SwapOnVSync(self, new_frame, framerate_fraction=1):
+        """
+        Show new_frame and hand back the canvas it replaced, waiting for the
+        next refresh when limit_refresh_rate_hz is set.
+        """
+        start = time.perf_counter()
+        if self.refresh_interval:
+            next_vsync = self.last_vsync + self.refresh_interval * framerate_fraction
+            delay = next_vsync - start
+            if delay > 0:
+                time.sleep(delay)
+            self.last_vsync = time.perf_counter()
+        with self.lock:
+            previous = self.front
+            self.front = new_frame
+            self.swaps += 1
+            self._record(new_frame, start, new_frame.width * new_frame.height)
+        if previous is self:
+            # The matrix's own buffer is not a FrameCanvas; give back a fresh one.
+            previous = self.CreateFrameCanvas()
+        return previous
+
+    def _changed(self, pixels_written, start):
+        with self.lock:
+            if self.front is self:
+                self._record(self, start, pixels_written)
+
+    def _canvas_written(self, canvas, pixels_written, start):
+        # Drawing on the FrameCanvas being displayed shows up immediately, as on hardware.
+        with self.lock:
+            if canvas is self.front:
+                self._record(canvas, start, pixels_written)
+
+    def _record(self, canvas, start, pixels_written):
+        panel = map_to_panel(canvas.pixels, self.mapper)
+        if self._brightness < 100:
+            panel = (panel.astype(np.uint16) * self._brightness // 100).astype(np.uint8)
+        else:
+            panel = panel.copy()
+        now = time.perf_counter()
+        self.frames.append((now, panel))
+        self.pushes += 1
+        self.pixels_written += pixels_written
+        self.push_seconds += now - start
+        if self.first_push is None:
+            self.first_push = now
+        self.last_push = now
+
+    def last_frame(self):
+        """The most recent panel image, or None if nothing was shown yet."""
+        with self.lock:
+            return self.frames[-1][1] if self.frames else None
+
+    def stats(self):
+        """
+        Throughput counters for everything that reached the emulated panel.
+        """
+        with self.lock:
+            span = (self.last_push - self.first_push) if self.pushes > 1 else 0.0
+            return {
+                "pushes": self.pushes,
+                "swaps": self.swaps,
+                "pixels_written": self.pixels_written,
+                "mean_push_ms": self.push_seconds * 1000 / self.pushes if self.pushes else 0.0,
+                "pushes_per_second": (self.pushes - 1) / span if span else 0.0,
+                "frames_kept": len(self.frames),
+            }
@@ -1,23 +1,36 @@
+import os
 import sys
 import time
 import random
+import signal
 from core.graphics import Graphics
 from core.states import States
 from core.stats import Stats
-from core.minigames.platformer import update_platforms, check_goal_reached, handle_input, calculate_jump_curve, draw_platformer
-from core.minigames.education import handle_education_input, render_education_screen
-from core.minigames.social import handle_social_input, initialize_socializing
-from core.minigames.housing import initialize_housing, handle_housing_input, assign_real_estate_agent
-from core.minigames.hobby import initialize_hobby, update_hobby
-from core.minigames.job import initialize_job, update_job, apply_job_rewards
+from core.scheduler import FrameScheduler
+from core.power import PowerGovernor, IDLE_TIMEOUT_SECONDS
+from core.profiler import FrameProfiler, NULL_PROFILER
+from core.startup import StartupTimeline, AssetWarmer
+from core.minigames.registry import minigames
 from core.states import RANDOM_EVENTS
-from utils.text_utils import text_to_matrix, split_text_to_lines
+from utils.text_utils import text_to_mask, split_text_to_lines
+from utils.constants import HEADLESS, RASPBERRYPI
+from utils.logger import logger, get_logger, level_from_name
 import subprocess
 
+log = get_logger("main")
+
 # def init_controls_safely():
 #     subprocess.run(["/home/terence/tamagotchi/venv/bin/python3", "init_gpio_once.py"])
 #     print("GPIO pre-initialized safely")
 
+def get_arg(name, default=None):
+    """Value of a name=value command line argument, or default if it is absent."""
+    for arg in sys.argv[1:]:
+        key, _, value = arg.partition("=")
+        if key.lower() == name:
+            return value
+    return default
+
 def get_matrix():
     from rgbmatrix import RGBMatrix, RGBMatrixOptions
 
@@ -40,297 +53,473 @@ MATRIX_WIDTH = 64
 MATRIX_HEIGHT = 32
 FPS = 25
 BRIGHTNESS = 45
-INIT = False
+GPIO_SETTLE_SECONDS = 0.5
+
+def run_frame(graphics, states, stats, controls, audio, fps=FPS, profiler=NULL_PROFILER):
+    """
+    Advance the game by one frame: read input, update state and stats, and draw
+    the current screen into the frame buffer. Presenting the frame is left to
+    the caller.
+
+    Args:
+        fps (int): Rate this frame runs at, for logic that counts frames.
+        profiler (FrameProfiler): Charged with the time of each phase of the frame.
+
+    Returns:
+        str or None: "dead" once the end screen has finished, otherwise None.
+    """
+    # Handle input using your updated Controls module (likely now reading GPIO inputs)
+    controls.handle_input()
+    profiler.mark("input")
+
+    # Update game state and stats
+    old_stage = states.stage_of_life
+    states.update_life_stage()
+    if old_stage != states.stage_of_life:
+        graphics.update_sprites(states)  # Reload sprites on stage change
+    profiler.mark("life_stage")
+
+    stats.decay_stats()  # Decay stats over time
+
+    if stats.check_win_condition() and states.stage_of_life != "dead":
+        states.transition_to_screen("end_screen")
+        states.transition_to_life_stage("dead")
+        graphics.start_end_animation('win', None, states.get_sprite_folder())
+        audio.play_sound("gameWin")
+
+    death_cause = stats.check_lose_condition()
+    if death_cause and states.stage_of_life != "dead":
+        states.transition_to_screen("end_screen")
+        graphics.start_end_animation('lose', death_cause, states.get_sprite_folder())
+        audio.play_sound("gameLose")
+        states.transition_to_life_stage("dead")
+        graphics.update_sprites(states)
+    profiler.mark("stats")
+
+    # Render based on the current screen/state
+    if states.current_screen == "home_screen":
+        if states.random_event["active"]:
+            graphics.clear_screen()
+
+            # Split the prompt
+            lines = split_text_to_lines(states.random_event["prompt"], max_chars_per_line=8)
+            total_height = len(lines) * 7
+            for i, line in enumerate(lines):
+                line_mask = text_to_mask(
+                    line, "assets/fonts/tamzen.ttf", 11, MATRIX_WIDTH, MATRIX_HEIGHT
+                )
+                y_offset = MATRIX_HEIGHT // 12 + i * 6
+                graphics.draw_mask(line_mask, MATRIX_WIDTH // 5, y_offset)
+            profiler.mark("draw")
+
+            # Handle navigation
+            if controls.left_button:
+                states.random_event["selection"] = "yes"
+                audio.play_sound("click")
+            elif controls.right_button:
+                states.random_event["selection"] = "no"
+                audio.play_sound("click")
+            elif controls.center_button:
+                # Apply the selected outcome
+                if states.random_event["selection"] == "yes":
+                    states.random_event["outcome"]["yes"](stats)
+                    audio.play_sound("success")
+                else:
+                    states.random_event["outcome"]["no"](stats)
+                    audio.play_sound("failure")
+                states.start_random_event_cooldown()
+                states.random_event["selection"] = "yes"
+            profiler.mark("update")
+
+            # Draw Yes/No buttons
+            button_font_size = 10
+            yes_mask = text_to_mask("Yes", "assets/fonts/tamzen.ttf", button_font_size, 20, 10)
+            no_mask = text_to_mask("No", "assets/fonts/tamzen.ttf", button_font_size, 20, 10)
+
+            button_y = MATRIX_HEIGHT - 10
+
+            graphics.draw_button(yes_mask, MATRIX_WIDTH // 4 - 8, states.random_event["selection"] == "yes", button_y)
+            graphics.draw_button(no_mask, MATRIX_WIDTH // 2 + 8, states.random_event["selection"] == "no", button_y)
+            profiler.mark("draw")
+
+        else:
+            # The threshold is drawn once per cooldown, so the frame rate does not change when events fire.
+            if time.time() - states.random_event["cooldown_timer"] > states.random_event["cooldown"]:
+                event = random.choice(RANDOM_EVENTS)
+                states.random_event.update({
+                    "active": True,
+                    "prompt": event["prompt"],
+                    "outcome": event,
+                    "selection": "yes"
+                })
+            profiler.mark("update")
+
+            graphics.draw_home_screen(states.selected_point_index, states)
+            profiler.mark("draw")
+            if controls.right_button:
+                states.cycle_point()
+                audio.play_sound("click")
+            elif controls.center_button:
+                selected_screen = states.get_current_screen_from_point()
+                if states.is_screen_available(selected_screen):
+                    states.transition_to_screen(selected_screen)
+                    audio.play_sound("click")
+                else:
+                    log.info("Cannot access %s at this stage!", selected_screen)
+            elif controls.left_button:
+                states.transition_to_screen("stats_screen")
+                audio.play_sound("click")
+            profiler.mark("update")
+
+
+    elif states.current_screen == "end_screen":
+        graphics.clear_screen()
+        graphics.draw_end_animation()
+        profiler.mark("draw")
+
+        # Wait a few seconds, then return to home
+        if graphics.end_animation_done():
+            states.transition_to_screen("home_screen")
+            graphics.stop_end_animation()
+            return "dead"
+
+    elif states.current_screen == "stats_screen":
+        graphics.clear_screen()
+        stats.render_stats_screen(graphics)
+        profiler.mark("draw")
+        if controls.left_button:
+            states.transition_to_screen("home_screen")
+
+    elif states.current_screen == "education_screen":
+        education = minigames.get("education_screen")
+        education.handle_education_input(stats, states, controls, audio)
+        profiler.mark("update")
+        education.render_education_screen(graphics, states)
+        profiler.mark("draw")
+
+    elif states.current_screen == "socialize_screen":
+        social = minigames.get("socialize_screen")
+        if not states.social_state:
+            states.social_state = social.initialize_socializing(graphics)
+        social.handle_social_input(states, states.social_state, controls, stats, audio)
+        profiler.mark("update")
+        if states.social_state:
+            graphics.draw_social_screen(
+                player_sprites=graphics.sprites,
+                other_tama_sprite=states.social_state["other_tama_sprite"],
+                social_state=states.social_state,
+            )
+            profiler.mark("draw")
+            if states.social_state["interaction_done"] and states.social_state["current_round"] > states.social_state["max_rounds"]:
+                states.transition_to_screen("home_screen")
+                states.social_state = None
+
+    elif states.current_screen == "food_screen":
+        platformer = minigames.get("food_screen")
+        if not states.platformer_state:
+            states.start_platformer(stats.stats["money"])
+
+        if not states.platformer_state["minigame_ended"]:
+            # Generate jump curve and update platforms/minigame logic
+            jump_curve = platformer.calculate_jump_curve(duration=12, peak_height=2)
+            platformer.update_platforms(states.platformer_state, jump_curve)
+            platformer.handle_input(states.platformer_state, controls, states, jump_curve, audio)
+            platformer.check_goal_reached(states.platformer_state, stats, audio)
+        profiler.mark("update")
+
+        platformer.draw_platformer(graphics, states.platformer_state, states.get_sprite_folder())
+        profiler.mark("draw")
+        if states.platformer_state["minigame_ended"]:
+            states.reset_platformer()
+            states.transition_to_screen("home_screen")
+
+    elif states.current_screen == "hobby_screen":
+        hobby = minigames.get("hobby_screen")
+        if not states.hobby_state:
+            states.start_hobby()
+        if not states.hobby_state["game_over"]:
+            hobby.update_hobby(states.hobby_state, controls, stats, audio, states)
+        profiler.mark("update")
+        graphics.draw_hobby_screen(states.hobby_state)
+        profiler.mark("draw")
+        if states.hobby_state["game_over"]:
+            if controls.left_button:  # Exit the game on failure
+                states.transition_to_screen("home_screen")
+                states.hobby_state = None
+
+    elif states.current_screen == "job_screen":
+        job = minigames.get("job_screen")
+        if not states.job_state:
+            # Choose education level; default to "HS" if not set
+            education_level = stats.stats.get("education", "HS")
+            states.job_state = job.initialize_job(education_level)
+        if not states.job_state["completed"]:
+            job.update_job(states.job_state, controls, audio)
+        profiler.mark("update")
+        graphics.draw_job_screen(states.job_state)
+        profiler.mark("draw")
+        if states.job_state["completed"]:
+            job.apply_job_rewards(states.job_state, stats)
+            states.transition_to_screen("home_screen")
+            states.job_state = None
+
+    elif states.current_screen == "housing_screen":
+        housing = minigames.get("housing_screen")
+        if not states.housing_state:
+            states.housing_state = housing.initialize_housing()
+
+        if (states.housing_state["countdown_active"] or states.housing_state["random_timeout_active"]) and controls.center_button:
+            log.info("Game failed due to early button press!")
+            states.housing_state["reaction_result"] = "fail"
+            states.housing_state["countdown_active"] = False
+            states.housing_state["random_timeout_active"] = False
+            states.housing_state["reaction_active"] = False
+            log.info("Game failed due to early button press!")
+
+        housing.handle_housing_input(states.housing_state, stats, controls, fps, states, audio)
+        profiler.mark("update")
+        if (states.housing_state["countdown_active"] or 
+            states.housing_state["random_timeout_active"] or 
+            states.housing_state["reaction_active"] or 
+            states.housing_state["reaction_result"] is not None):
+            graphics.draw_housing_reaction_game(states.housing_state, fps)
+            if states.housing_state["real_estate_agent"] is None:
+                housing.assign_real_estate_agent(states.housing_state)
+        else:
+            graphics.draw_housing_screen(states.housing_state, stats)
+        profiler.mark("draw")
+
+        if states.housing_state["reaction_result"] is not None and not states.housing_state["reaction_active"]:
+            if controls.left_button:
+                log.info("Reaction result: %s", states.housing_state['reaction_result'])
+                states.transition_to_screen("home_screen")
+                states.housing_state = None
+
+    elif states.current_screen in states.point_screens:
+        graphics.clear_screen()
+        graphics.render_individual_screen(states.current_screen)
+        profiler.mark("draw")
+        if controls.left_button:
+            states.transition_to_screen("home_screen")
+    return None
+
+def new_life(graphics):
+    """
+    Start a new game on the hardware and caches that are already set up:
+    only States and Stats are created afresh, and Graphics forgets the
+    previous pet.
+
+    Returns:
+        tuple: (states, stats) of the new life.
+    """
+    states = States()
+    stats = Stats()
+    graphics.reset()
+    graphics.update_sprites(states)
+    return states, stats
+
+def exit_on_signal(signum, frame):
+    """Turn a termination signal into SystemExit, so try/finally cleanup runs."""
+    raise SystemExit(128 + signum)
 
 def main():
     # usage: python3 script.py debug=true
     debug = any("debug=true" in arg.lower() for arg in sys.argv)
     fake = any("fake=true" in arg.lower() for arg in sys.argv)
+    headless = any("headless=true" in arg.lower() for arg in sys.argv)
+    emulator = any("emulator=true" in arg.lower() for arg in sys.argv)
+    # latency=true measures input-to-photon latency (synthetic presses unless on real hardware)
+    latency = any("latency=true" in arg.lower() for arg in sys.argv)
+    max_frames = int(get_arg("frames", 0))
+    # log=debug|info|warning|error sets what reaches the console (the in-memory ring keeps everything)
+    logger.set_level(level_from_name(get_arg("log", "info")))
+    # idle_timeout=N dims the panel and slows the loop after N seconds without input
+    idle_timeout = float(get_arg("idle_timeout", IDLE_TIMEOUT_SECONDS))
+    # profile=path is where per-phase frame timings are dumped, on exit and on SIGUSR1
+    profile_path = get_arg("profile", "frame_profile.json")
+
+    # Hardware, audio and input come up concurrently; see core/startup.py
+    timeline = StartupTimeline()
+    inline = ()
+    if latency and (headless or emulator or debug):
+        from core.headless import SyntheticControls as Controls
+
+    if headless:
+        # headless mode, renders into memory with random button presses, no hardware or window
+        from core.headless import NullMatrix, NullAudio
+        if not latency:
+            from core.fakecontrols import FakeControls as Controls
 
-    if debug:
+        debug = False
+        tasks = {
+            "display": lambda: Graphics(NullMatrix(MATRIX_WIDTH, MATRIX_HEIGHT), MATRIX_WIDTH, MATRIX_HEIGHT, 1,
+                                        platform=HEADLESS),
+            "audio": NullAudio,
+            "controls": Controls,
+        }
+
+    elif emulator:
+        # emulator mode, the hardware presentation path into the pure-Python rgbmatrix emulator, no GPIO
+        os.environ["RGBMATRIX_EMULATOR"] = "1"
+        from core.headless import NullAudio
+        if not latency:
+            from core.fakecontrols import FakeControls as Controls
+
+        debug = False
+        tasks = {
+            "display": lambda: Graphics(get_matrix(), MATRIX_WIDTH, MATRIX_HEIGHT, 1, platform=RASPBERRYPI),
+            "audio": NullAudio,
+            "controls": Controls,
+        }
+
+    elif debug:
         # debug mode, will play on pygame window, no hardware imports
         import pygame
-        from pygamestuff.pygame_controls import Controls
+        if not latency:
+            from pygamestuff.pygame_controls import Controls
         from pygamestuff.pygame_audio import AudioManager
 
-        matrix = None
-        audio = AudioManager()
-        pygame.init()
-        screen_width = MATRIX_WIDTH * PIXEL_SIZE
-        screen_height = MATRIX_HEIGHT * PIXEL_SIZE
-        screen = pygame.display.set_mode((screen_width, screen_height))
-        pygame.display.set_caption("Tamagotchi")
-        graphics = Graphics(screen, MATRIX_WIDTH, MATRIX_HEIGHT, PIXEL_SIZE)
-        clock = pygame.time.Clock()
+        def open_window():
+            pygame.init()
+            screen = pygame.display.set_mode((MATRIX_WIDTH * PIXEL_SIZE, MATRIX_HEIGHT * PIXEL_SIZE))
+            pygame.display.set_caption("Tamagotchi")
+            return Graphics(screen, MATRIX_WIDTH, MATRIX_HEIGHT, PIXEL_SIZE)
+
+        # SDL wants its subsystems set up from the main thread, one at a time
+        tasks = {"audio": AudioManager, "display": open_window, "controls": Controls}
+        inline = tuple(tasks)
 
     else:
         # not debug mode, game running on hardware, import hardware-specific libraries and initialize GPIO
-        import RPi.GPIO as GPIO
         from core.audioManager import AudioManager
         if fake:
             from core.fakecontrols import FakeControls as Controls
         else:
             from core.controls import Controls
 
-        global INIT
-        if INIT == False:
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(19, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            GPIO.setup(24, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            GPIO.setup(25, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            print('init')
-            INIT = True
-        matrix = get_matrix()
-        audio = AudioManager()
-        print("Audio initialized fine")
-        graphics = Graphics(matrix, MATRIX_WIDTH, MATRIX_HEIGHT, 1)  # Adjusted constructor; PIXEL_SIZE is now implicit
-        print("Graphics initialized fine")
+        def init_gpio():
+            # Controls starts with GPIO.cleanup(), so it has to run before the buzzer pin is set up
+            controls = Controls()
+            audio = AudioManager()
+            log.info("Audio initialized fine")
+            if not fake:
+                time.sleep(GPIO_SETTLE_SECONDS)  # let the pull-ups settle while the panel starts
+            return controls, audio
 
+        tasks = {
+            "display": lambda: Graphics(get_matrix(), MATRIX_WIDTH, MATRIX_HEIGHT, 1),
+            "gpio": init_gpio,
+        }
 
     # Let's go
-    print(f"Running in {'debug' if debug else 'raspberry'} mode")
-    print("Creating controls")
-    controls = Controls()
-    time.sleep(0.5) # Allow time for GPIO setup
-    states = States()
-    stats = Stats()
-    
-    graphics.set_sprites(graphics.load_sprites(states.get_sprite_folder()))
-
+    mode = 'headless' if headless else 'emulator' if emulator else 'debug' if debug else 'raspberry'
+    log.info("Running in %s mode", mode)
+    timeline.mark("imports", since=0.0)
+    ready = timeline.run_parallel(tasks, inline=inline)
+    graphics = ready["display"]
+    if "gpio" in ready:
+        controls, audio = ready["gpio"]
+    else:
+        controls, audio = ready["controls"], ready["audio"]
+    log.info("Graphics initialized fine")
+
+    states, stats = timeline.step("first life", new_life, graphics)
+    warmer = AssetWarmer(graphics, states.character, timeline)
+    warmer.start()
+    input_controls = controls  # the latency probe may wrap it below; shutdown needs the real one
+    probe = None
+    if latency:
+        from core.latency import LatencyProbe
+        probe = LatencyProbe()
+        controls = probe.wrap(controls, lambda: states.current_screen)
+        if graphics.presenter:
+            graphics.presenter.listener = probe.presented
+
+    # Sleeps until each frame's deadline, at the current screen's rate
+    scheduler = FrameScheduler(default_fps=FPS)
+    wake = getattr(controls, "pending", None)
+    governor = PowerGovernor(graphics, scheduler, BRIGHTNESS, idle_timeout=idle_timeout)
+    profiler = FrameProfiler(profile_path)
+    profiler.install_signal()
+
+    frame_count = 0
+    lives = 1
+    restart_start = None
     running = True
-    while running:
-        if debug:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    running = False
-
-        # Handle input using your updated Controls module (likely now reading GPIO inputs)
-        controls.handle_input()
-
-        # Update game state and stats
-        old_stage = states.stage_of_life
-        states.update_life_stage()
-        if old_stage != states.stage_of_life:
-            graphics.update_sprites(states)  # Reload sprites on stage change
-
-        stats.decay_stats()  # Decay stats over time
-
-        if stats.check_win_condition() and states.stage_of_life != "dead":
-            states.transition_to_screen("end_screen")
-            states.transition_to_life_stage("dead")
-            graphics.start_end_animation('win', None, states.get_sprite_folder())
-            audio.play_sound("gameWin")
-
-        death_cause = stats.check_lose_condition()
-        if death_cause and states.stage_of_life != "dead":
-            states.transition_to_screen("end_screen")
-            graphics.start_end_animation('lose', death_cause, states.get_sprite_folder())
-            audio.play_sound("gameLose")
-            states.transition_to_life_stage("dead")
-            graphics.update_sprites(states)
-
-        # Render based on the current screen/state
-        if states.current_screen == "home_screen":
-            if states.random_event["active"]:
-                graphics.clear_screen()
-
-                # Split the prompt
-                lines = split_text_to_lines(states.random_event["prompt"], max_chars_per_line=8)
-                total_height = len(lines) * 7
-                for i, line in enumerate(lines):
-                    line_matrix = text_to_matrix(
-                        line, "assets/fonts/tamzen.ttf", 11, MATRIX_WIDTH, MATRIX_HEIGHT
-                    )
-                    y_offset = MATRIX_HEIGHT // 12 + i * 6
-                    graphics.draw_matrix(line_matrix, MATRIX_WIDTH // 5, y_offset)
-
-                # Handle navigation
-                if controls.left_button:
-                    states.random_event["selection"] = "yes"
-                    audio.play_sound("click")
-                elif controls.right_button:
-                    states.random_event["selection"] = "no"
-                    audio.play_sound("click")
-                elif controls.center_button:
-                    # Apply the selected outcome
-                    if states.random_event["selection"] == "yes":
-                        states.random_event["outcome"]["yes"](stats)
-                        audio.play_sound("success")
-                    else:
-                        states.random_event["outcome"]["no"](stats)
-                        audio.play_sound("failure")
-                    states.random_event.update({"active": False, "cooldown_timer": time.time()})
-                    states.random_event["selection"] = "yes"
-
-                # Draw Yes/No buttons
-                button_font_size = 10
-                yes_matrix = text_to_matrix("Yes", "assets/fonts/tamzen.ttf", button_font_size, 20, 10)
-                no_matrix = text_to_matrix("No", "assets/fonts/tamzen.ttf", button_font_size, 20, 10)
-
-                button_y = MATRIX_HEIGHT - 10
-
-                graphics.draw_button(yes_matrix, MATRIX_WIDTH // 4 - 8, states.random_event["selection"] == "yes", button_y)
-                graphics.draw_button(no_matrix, MATRIX_WIDTH // 2 + 8, states.random_event["selection"] == "no", button_y)
-
+    # systemd and kill stop the game with SIGTERM: unwind like Ctrl-C so the shutdown below still runs
+    signal.signal(signal.SIGTERM, exit_on_signal)
+    try:
+        while running:
+            if debug:
+                events = pygame.event.get()
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        running = False
+
+            fps = scheduler.frame_rate(states.current_screen)
+            profiler.begin(states.current_screen)
+            result = run_frame(graphics, states, stats, controls, audio, fps, profiler)
+            token = probe.end_frame() if probe else None
+            if result == "dead":
+                profiler.end()
+                profiler.dump()
+                if graphics.presenter:
+                    log.info("Frames pushed: %s", graphics.presenter.stats())
+                log.info("Frame pacing: %s", scheduler.stats())
+                log.info("Power states: %s", governor.stats())
+                if hasattr(audio, "stats"):
+                    log.info("Audio: %s", audio.stats())
+                if probe:
+                    logger.flush()
+                    probe.print_report()
+                # Warm restart: the matrix, presenter, GPIO, audio and decoded assets stay as they are
+                log.info("Player died, restarting game...")
+                restart_start = time.perf_counter()
+                states, stats = new_life(graphics)
+                lives += 1
+                continue
+
+            if debug:
+                graphics.render_to_screen()
+                pygame.display.flip()
+                if probe:
+                    probe.frame_shown(token, graphics.framebuffer.pixels)
             else:
-                if time.time() - states.random_event["cooldown_timer"] > random.randint(50, 200):
-                    event = random.choice(RANDOM_EVENTS)
-                    states.random_event.update({
-                        "active": True,
-                        "prompt": event["prompt"],
-                        "outcome": event,
-                        "selection": "yes"
-                    })
-
-                graphics.draw_home_screen(states.selected_point_index, states)
-                if controls.right_button:
-                    states.cycle_point()
-                    audio.play_sound("click")
-                elif controls.center_button:
-                    selected_screen = states.get_current_screen_from_point()
-                    if states.is_screen_available(selected_screen):
-                        states.transition_to_screen(selected_screen)
-                        audio.play_sound("click")
-                    else:
-                        print(f"Cannot access {selected_screen} at this stage!")
-                elif controls.left_button:
-                    states.transition_to_screen("stats_screen")
-                    audio.play_sound("click")
-
+            # Instead of pygame.display.flip(), we swap the canvas on the LED matrix.
+            # Here we assume your Graphics module manages a 'canvas' attribute for drawing.
+                graphics.render_to_matrix(token)
+            profiler.mark("present")
+            profiler.end()
+            if frame_count == 0:
+                timeline.mark("first frame")
+                timeline.log_report()
+            if restart_start is not None:
+                log.info("Life %d started in %.1f ms", lives, (time.perf_counter() - restart_start) * 1000)
+                restart_start = None
+
+            pressed = controls.left_button or controls.center_button or controls.right_button
+            governor.update(pressed)
+            scheduler.wait(graphics.framebuffer.pixels, active=pressed, wake=wake)
+
+            frame_count += 1
+            if max_frames and frame_count >= max_frames:
+                running = False
+    finally:
+        log.info("Frame pacing: %s", scheduler.stats())
+        log.info("Power states: %s", governor.stats())
+        if hasattr(audio, "stats"):
+            log.info("Audio: %s", audio.stats())
+        profiler.dump()
+        if hasattr(input_controls, "cleanup"):
+            input_controls.cleanup()  # edge detection off before audio.cleanup() runs GPIO.cleanup()
+        audio.cleanup()
+        graphics.shutdown()
+        if probe:
+            logger.flush()
+            probe.print_report()
+        if debug: 
+            pygame.quit()
 
-        elif states.current_screen == "end_screen":
-            graphics.clear_screen()
-            graphics.draw_end_animation()
-
-            # Wait a few seconds, then return to home
-            if graphics.end_animation_done():
-                states.transition_to_screen("home_screen")
-                graphics.end_mode = None
-                graphics.end_start_time = None
-                graphics.death_cause = None
-                graphics.death_sprite_folder = None
-                return "dead"
-
-        elif states.current_screen == "stats_screen":
-            graphics.clear_screen()
-            stats.render_stats_screen(graphics)
-            if controls.left_button:
-                states.transition_to_screen("home_screen")
-
-        elif states.current_screen == "education_screen":
-            handle_education_input(stats, states, controls, audio)
-            render_education_screen(graphics, states)
-
-        elif states.current_screen == "socialize_screen":
-            if not states.social_state:
-                states.social_state = initialize_socializing(graphics)
-            handle_social_input(states, states.social_state, controls, stats, audio)
-            if states.social_state:
-                graphics.draw_social_screen(
-                    player_sprites=graphics.sprites,
-                    other_tama_sprite=states.social_state["other_tama_sprite"],
-                    social_state=states.social_state,
-                )
-                if states.social_state["interaction_done"] and states.social_state["current_round"] > states.social_state["max_rounds"]:
-                    states.transition_to_screen("home_screen")
-                    states.social_state = None
-
-        elif states.current_screen == "food_screen":
-            if not states.platformer_state:
-                states.start_platformer(stats.stats["money"])
-
-            if not states.platformer_state["minigame_ended"]:
-                # Generate jump curve and update platforms/minigame logic
-                jump_curve = calculate_jump_curve(duration=12, peak_height=2)
-                update_platforms(states.platformer_state, jump_curve)
-                handle_input(states.platformer_state, controls, states, jump_curve, audio)
-                check_goal_reached(states.platformer_state, stats, audio)
-
-            draw_platformer(graphics, states.platformer_state, states.get_sprite_folder())
-            if states.platformer_state["minigame_ended"]:
-                states.reset_platformer()
-                states.transition_to_screen("home_screen")
-
-        elif states.current_screen == "hobby_screen":
-            if not states.hobby_state:
-                states.start_hobby()
-            if not states.hobby_state["game_over"]:
-                update_hobby(states.hobby_state, controls, stats, audio, states)
-            graphics.draw_hobby_screen(states.hobby_state)
-            if states.hobby_state["game_over"]:
-                if controls.left_button:  # Exit the game on failure
-                    states.transition_to_screen("home_screen")
-                    states.hobby_state = None
-
-        elif states.current_screen == "job_screen":
-            if not states.job_state:
-                # Choose education level; default to "HS" if not set
-                education_level = stats.stats.get("education", "HS")
-                states.job_state = initialize_job(education_level)
-            if not states.job_state["completed"]:
-                update_job(states.job_state, controls, audio)
-            graphics.draw_job_screen(states.job_state)
-            if states.job_state["completed"]:
-                apply_job_rewards(states.job_state, stats)
-                states.transition_to_screen("home_screen")
-                states.job_state = None
-
-        elif states.current_screen == "housing_screen":
-            if not states.housing_state:
-                states.housing_state = initialize_housing()
-
-            if (states.housing_state["countdown_active"] or states.housing_state["random_timeout_active"]) and controls.center_button:
-                print("Game failed due to early button press!")
-                states.housing_state["reaction_result"] = "fail"
-                states.housing_state["countdown_active"] = False
-                states.housing_state["random_timeout_active"] = False
-                states.housing_state["reaction_active"] = False
-                print("Game failed due to early button press!")
-
-            handle_housing_input(states.housing_state, stats, controls, FPS, states, audio)
-            if (states.housing_state["countdown_active"] or 
-                states.housing_state["random_timeout_active"] or 
-                states.housing_state["reaction_active"] or 
-                states.housing_state["reaction_result"] is not None):
-                graphics.draw_housing_reaction_game(states.housing_state, FPS)
-                if states.housing_state["real_estate_agent"] is None:
-                    assign_real_estate_agent(states.housing_state)
-            else:
-                graphics.draw_housing_screen(states.housing_state, stats)
-
-            if states.housing_state["reaction_result"] is not None and not states.housing_state["reaction_active"]:
-                if controls.left_button:
-                    print(f"Reaction result: {states.housing_state['reaction_result']}")
-                    states.transition_to_screen("home_screen")
-                    states.housing_state = None
-
-        elif states.current_screen in states.point_screens:
-            graphics.clear_screen()
-            graphics.render_individual_screen(states.current_screen)
-            if controls.left_button:
-                states.transition_to_screen("home_screen")
-        
-        if debug:
-            pygame.display.flip()
-            clock.tick(FPS)
-        else:
-        # Instead of pygame.display.flip(), we swap the canvas on the LED matrix.
-        # Here we assume your Graphics module manages a 'canvas' attribute for drawing.
-            graphics.render_to_matrix()
-            time.sleep(1.0 / FPS)
-    
-    if debug: 
-        pygame.quit()
-    
 
 if __name__ == "__main__":
-    while True:
-        result = main()
-        print(result)
-        if result == "dead":
-            print("Player died, restarting game...")
-            time.sleep(1)  # Optional delay before restart
-            continue  # Restart game
-        else:
-            break  # Exit loop if needed
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,16 +1,19 @@
 from PIL import Image
+from utils.rgb_image import RGBImage
 
 def calculate_average_color(input_data):
     """
     Calculate the average RGB color of an image or sprite matrix.
 
     Args:
-        input_data (str or list): Path to an image file or a matrix of RGB values.
+        input_data (str, RGBImage or list): Path to an image file, an RGBImage or a matrix of RGB values.
 
     Returns:
         tuple: Average RGB color.
     """
     try:
+        if isinstance(input_data, RGBImage):  # Summed in NumPy, same result as the loop below
+            return input_data.average_color()
         if isinstance(input_data, str):  # Handle file path
             with Image.open(input_data).convert("RGB") as img:
                 pixels = list(img.getdata())
@@ -1,4 +1,27 @@
 # constants
 
 PYGAME = 'pygame'
-RASPBERRYPI = 'raspberrypi'
\ No newline at end of file
+RASPBERRYPI = 'raspberrypi'
+HEADLESS = 'headless'
+
+# Hobby minigame layout, shared by its game logic and the renderer
+BEAT_POSITIONS = [24, 32, 40]  # Left, Center, Right - Centered at 32
+HIT_ZONE_Y = 28  # Y coordinate of hit zone
+NOTE_WIDTH = 4  # Notes are 3 pixels wide
+
+# Note frequencies (Hz) of every game sound, played by both audio backends
+SOUND_MAP = {
+    'click': [600],
+    'noteHit': [800],
+    'noteMiss': [400],
+    'jump': [400, 700],
+    'workElement': [300, 500],
+    'statLow': [330, 250],
+    'success': [600, 800, 1000],
+    'failure': [400, 300, 200],
+    'gameWin': [523, 587, 659, 784],
+    'gameLose': [659, 587, 523, 400],
+    'suitcaseOpen': [300, 600, 300, 600],
+    'happy': [523, 659, 784],
+    'sad': [784, 659, 523]
+}
@@ -0,0 +1,229 @@
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+RING_SIZE = 2048            # most recent records kept in memory, at every level
+PENDING_SIZE = 1024         # console lines waiting for the flusher; older ones are dropped
+FLUSH_INTERVAL = 0.25       # seconds between console writes
+RATE_LIMIT_SECONDS = 5.0    # window in which repeats of one message are counted
+RATE_LIMIT_BURST = 5        # lines of the same message let through per window
+
+
+def level_from_name(name, default=INFO):
+    """
+    Parse a level name such as "debug" or "warning".
+
+    Returns:
+        int: The level, or default if the name is unknown.
+    """
+    for level, level_name in LEVEL_NAMES.items():
+        if level_name.lower() == str(name).lower():
+            return level
+    return default
+
+
+class Logger:
+    """
+    Leveled logging that never blocks the frame loop on console I/O.
+
+    Every record, at any level, goes into an in-memory ring (recent() reads
+    it back) as a (time, level, channel, text) tuple. The message is
+    formatted when it is logged, so the ring never holds on to the args or
+    shows objects that changed after the call. Records at or above
+    `level` are also queued for the console: a background thread joins
+    whatever is pending every FLUSH_INTERVAL and writes it in one call, so a
+    slow journald or serial console only ever stalls that thread. When the
+    queue overflows, the oldest lines are dropped and counted.
+
+    Repeats of the same message (same channel and format string) are
+    rate-limited on the console: RATE_LIMIT_BURST lines per
+    RATE_LIMIT_SECONDS, then a single "repeated N more times" line. That line
+    is written by the flusher as soon as the window runs out, so a burst that
+    stops is still accounted for without waiting for the message to recur.
+
+    Args:
+        level (int): Minimum level written to the console.
+        stream: File to write to; defaults to sys.stdout at write time.
+        ring_size (int): Records kept in memory.
+    """
+
+    def __init__(self, level=INFO, stream=None, ring_size=RING_SIZE):
+        self.level = level
+        self.stream = stream
+        self.ring = deque(maxlen=ring_size)
+        self.pending = deque()
+        self.dropped = 0
+        self.suppressed = 0
+        self.limits = {}          # (channel, format) -> [window_start, lines, suppressed, level, last text]
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def set_level(self, level):
+        self.level = level
+
+    def log(self, level, channel, message, *args):
+        """
+        Record a message, %-formatting args into it.
+        """
+        now = time.time()
+        record = (now, level, channel, format_message(message, args))
+        self.ring.append(record)
+        if level < self.level:
+            return
+        with self.lock:
+            line = self._rate_limit(record, message)
+            if line is None:
+                return
+            if len(self.pending) >= PENDING_SIZE:
+                self.pending.popleft()
+                self.dropped += 1
+            self.pending.append(line)
+            if self.thread is None:
+                self._start()
+
+    def _rate_limit(self, record, message):
+        now, level, channel, text = record
+        key = (channel, message)
+        limit = self.limits.get(key)
+        if limit is None or now - limit[0] >= RATE_LIMIT_SECONDS:
+            # New window; report how many repeats the previous one swallowed,
+            # in case the flusher has not done so yet.
+            if limit and limit[2]:
+                self._report_repeats(channel, limit)
+            self.limits[key] = [now, 1, 0, level, text]
+            return record
+        if limit[1] < RATE_LIMIT_BURST:
+            limit[1] += 1
+            return record
+        limit[2] += 1
+        limit[4] = text
+        self.suppressed += 1
+        return None
+
+    def _report_repeats(self, channel, limit):
+        level, repeated, text = limit[3], limit[2], limit[4]
+        self.pending.append((time.time(), level, channel, f"(repeated {repeated} more times, last: {text})"))
+        limit[2] = 0
+
+    def _expire_limits(self, everything=False):
+        """
+        Drop rate-limit windows that ran out, reporting what they suppressed.
+
+        Args:
+            everything (bool): Report and drop every window, e.g. at exit.
+        """
+        now = time.time()
+        for key, limit in list(self.limits.items()):
+            if everything or now - limit[0] >= RATE_LIMIT_SECONDS:
+                if limit[2]:
+                    self._report_repeats(key[0], limit)
+                del self.limits[key]
+
+    def _start(self):
+        self.thread = threading.Thread(target=self._run, name="logger", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self, final=False):
+        """
+        Write everything pending to the console now.
+
+        Args:
+            final (bool): Also report repeats still being counted in open rate-limit windows.
+        """
+        with self.lock:
+            self._expire_limits(final)
+            lines = list(self.pending)
+            self.pending.clear()
+            dropped, self.dropped = self.dropped, 0
+        if not lines and not dropped:
+            return
+        text = []
+        if dropped:
+            text.append(f"WARNING [log] {dropped} lines dropped, console too slow\n")
+        for now, level, channel, message in lines:
+            text.append(f"{LEVEL_NAMES.get(level, level)} [{channel}] {message}\n")
+        stream = self.stream or sys.stdout
+        try:
+            stream.write("".join(text))
+            stream.flush()
+        except (OSError, ValueError):
+            pass  # console gone (closed pipe or file); the ring still has everything
+
+    def recent(self, count=None, level=DEBUG):
+        """
+        Most recent records from the ring, formatted.
+
+        Args:
+            count (int): How many to return; all of them if None.
+            level (int): Skip records below this level.
+
+        Returns:
+            list: "HH:MM:SS.mmm LEVEL [channel] message" strings, oldest first.
+        """
+        records = [record for record in list(self.ring) if record[1] >= level]
+        if count is not None:
+            records = records[-count:]
+        lines = []
+        for now, record_level, channel, message in records:
+            stamp = time.strftime("%H:%M:%S", time.localtime(now)) + f".{int(now * 1000) % 1000:03d}"
+            lines.append(f"{stamp} {LEVEL_NAMES.get(record_level, record_level)} [{channel}] {message}")
+        return lines
+
+
+def format_message(message, args):
+    if not args:
+        return str(message)
+    try:
+        return message % args
+    except (TypeError, ValueError):
+        return " ".join([str(message)] + [str(arg) for arg in args])
+
+
+class Channel:
+    """A named source of log records, e.g. get_logger("stats")."""
+
+    def __init__(self, logger, name):
+        self.logger = logger
+        self.name = name
+
+    def debug(self, message, *args):
+        self.logger.log(DEBUG, self.name, message, *args)
+
+    def info(self, message, *args):
+        self.logger.log(INFO, self.name, message, *args)
+
+    def warning(self, message, *args):
+        self.logger.log(WARNING, self.name, message, *args)
+
+    def error(self, message, *args):
+        self.logger.log(ERROR, self.name, message, *args)
+
+
+logger = Logger()
+atexit.register(logger.flush, True)
+
+
+def get_logger(name):
+    """
+    Channel of the shared logger.
+
+    Args:
+        name (str): Shown in brackets before every message.
+
+    Returns:
+        Channel: With debug/info/warning/error(message, *args) methods.
+    """
+    return Channel(logger, name)
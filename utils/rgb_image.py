@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class RGBImage:
+    """
+    Small RGB image held as one contiguous HxWx3 uint8 array.
+
+    Replaces the nested lists of (r, g, b) tuples that sprites and text used
+    to be: 3 bytes per pixel instead of a tuple object each, and the mask of
+    non-black pixels is computed once instead of on every blit. Both arrays
+    are read-only, since images are shared through the caches.
+
+    It still reads like the old matrix for existing callers: len() is the
+    number of rows, image[y] is a row as a list of (r, g, b) tuples and
+    iterating yields the rows, so image[y][x] and `for row in image` work
+    unchanged. Those rows are built on each access; hot paths use .pixels
+    and .mask directly.
+
+    Args:
+        pixels (array-like): HxWx3 RGB values, or a nested list of (r, g, b) tuples.
+    """
+
+    __slots__ = ("pixels", "mask")
+
+    def __init__(self, pixels):
+        pixels = np.array(pixels, dtype=np.uint8)
+        if pixels.ndim != 3:
+            pixels = pixels.reshape((len(pixels), 0, 3))
+        mask = pixels.any(axis=2)  # Pure black pixels are transparent
+        pixels.flags.writeable = False
+        mask.flags.writeable = False
+        self.pixels = pixels
+        self.mask = mask
+
+    @classmethod
+    def from_pil(cls, img):
+        """Build an image from a PIL image, converting it to RGB."""
+        return cls(np.asarray(img.convert("RGB"), dtype=np.uint8))
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Build a grey-level image from an HxW uint8 coverage mask (see utils.text_utils.text_to_mask)."""
+        return cls(np.repeat(np.asarray(mask, dtype=np.uint8)[:, :, None], 3, axis=2))
+
+    @property
+    def width(self):
+        return self.pixels.shape[1]
+
+    @property
+    def height(self):
+        return self.pixels.shape[0]
+
+    @property
+    def nbytes(self):
+        return self.pixels.nbytes + self.mask.nbytes
+
+    def __len__(self):
+        return self.pixels.shape[0]
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            return [self[row] for row in range(*y.indices(len(self)))]
+        return list(map(tuple, self.pixels[y].tolist()))
+
+    def __iter__(self):
+        for y in range(len(self)):
+            yield self[y]
+
+    def tolist(self):
+        """The image as the old nested list of (r, g, b) tuples."""
+        return [list(map(tuple, row)) for row in self.pixels.tolist()]
+
+    def average_color(self):
+        """Integer mean of every pixel, black ones included."""
+        count = self.pixels.shape[0] * self.pixels.shape[1]
+        return tuple(int(total) // count for total in self.pixels.reshape(-1, 3).sum(axis=0, dtype=np.int64))
+
+    def __repr__(self):
+        return f"RGBImage({self.width}x{self.height})"
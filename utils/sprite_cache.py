@@ -0,0 +1,126 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from PIL import Image
+
+DEFAULT_BUDGET_BYTES = 1024 * 1024  # 1 MiB of decoded sprite data
+
+
+def decode_sprite(sprite_path, sprite_width, sprite_height, opacity=1.0):
+    """
+    Decode a sprite from disk into arrays ready to blit onto a FrameBuffer.
+
+    Args:
+        sprite_path (str): Path to the sprite file.
+        sprite_width (int): Width to resize the sprite to.
+        sprite_height (int): Height to resize the sprite to.
+        opacity (float): Opacity multiplier (1.0 = full opacity, 0.0 = fully dark).
+
+    Returns:
+        tuple: (HxWx3 uint8 pixels, HxW bool mask of non-black pixels).
+    """
+    # Open the image with alpha channel
+    img = Image.open(sprite_path).convert("RGBA")
+    img = img.resize((sprite_width, sprite_height))
+
+    # If opacity is less than 1.0, blend with a black image.
+    if opacity < 1.0:
+        black_img = Image.new("RGBA", img.size, (0, 0, 0, 255))
+        img = Image.blend(black_img, img, opacity)
+
+    pixels = np.asarray(img.convert("RGB"), dtype=np.uint8)
+    mask = pixels.any(axis=2)  # Pure black pixels are transparent
+    return pixels, mask
+
+
+def _estimate_size(sprite):
+    """Number of bytes held by a decoded sprite entry."""
+    pixels, mask = sprite
+    return pixels.nbytes + mask.nbytes
+
+
+class SpriteCache:
+    """
+    Process-wide LRU cache of decoded sprites.
+
+    Entries are keyed on (path, width, height, opacity) and hold the pixels
+    ready to blit, so once a sprite is warm drawing it never touches the PNG
+    on disk. The least recently used entries are evicted when the decoded
+    data outgrows the byte budget.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, sprite_path, sprite_width, sprite_height, opacity=1.0):
+        """
+        Return the decoded (pixels, mask) for a sprite, decoding it on a miss.
+        """
+        key = (sprite_path, sprite_width, sprite_height, opacity)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        sprite = decode_sprite(sprite_path, sprite_width, sprite_height, opacity)
+        self._store(key, sprite)
+        return sprite
+
+    def _store(self, key, sprite):
+        size = _estimate_size(sprite)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self.entries[key] = (sprite, size)
+            self.current_bytes += size
+            self._evict()
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds the budget.
+        while self.current_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def set_budget(self, max_bytes):
+        """
+        Change the memory budget, evicting immediately if it shrank.
+        """
+        with self.lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        Snapshot of the cache counters.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared by every Graphics instance in the process.
+sprite_cache = SpriteCache()
@@ -0,0 +1,130 @@
+import os
+import threading
+from PIL import Image
+from utils.rgb_image import RGBImage
+
+SPRITE_ROOT = "assets/sprites"
+SPRITE_SIZE = 10  # Pet sprites are drawn at 10x10
+
+
+def decode_sprite_set(folder_path, size=SPRITE_SIZE):
+    """
+    Decode every PNG of a folder, in name order, into RGBImages.
+
+    Args:
+        folder_path (str): Folder holding one animation frame per PNG.
+        size (int): Width and height the frames are resized to.
+
+    Returns:
+        list: One RGBImage per frame.
+    """
+    sprites = []
+    for filename in sorted(os.listdir(folder_path)):
+        if filename.endswith(".png"):
+            img = Image.open(os.path.join(folder_path, filename)).convert("RGB")
+            sprites.append(RGBImage.from_pil(img.resize((size, size))))
+    if not sprites:
+        raise ValueError(f"No sprites found in {folder_path}")
+    return sprites
+
+
+class SpriteSetStore:
+    """
+    Process-wide store of the pets' animation frames, per character and stage.
+
+    The first lookup indexes SPRITE_ROOT once: every folder whose
+    subfolders hold PNGs is a character (assets/sprites/<character>/<stage>).
+    A stage's frames are decoded the first time they are asked for and stay
+    resident, so a life-stage change or a new life is a lookup returning the
+    same list, with no directory listing or PNG decode. Decoding happens
+    outside the lock; if two threads race on one folder, the first result
+    stored wins.
+
+    Args:
+        root (str): Folder holding one subfolder per character.
+    """
+
+    def __init__(self, root=SPRITE_ROOT):
+        self.root = root
+        self.index = None   # character -> {stage: folder}
+        self.sets = {}      # folder -> decoded frames
+        self.loads = 0
+        self.hits = 0
+        self.lock = threading.Lock()
+
+    def _build_index(self):
+        index = {}
+        for character in sorted(os.listdir(self.root)):
+            character_path = os.path.join(self.root, character)
+            if not os.path.isdir(character_path):
+                continue
+            stages = {}
+            for stage in sorted(os.listdir(character_path)):
+                stage_path = os.path.join(character_path, stage)
+                if os.path.isdir(stage_path) and any(name.endswith(".png") for name in os.listdir(stage_path)):
+                    stages[stage] = stage_path
+            if stages:
+                index[character] = stages
+        return index
+
+    def _get_index(self):
+        if self.index is None:
+            index = self._build_index()
+            with self.lock:
+                if self.index is None:
+                    self.index = index
+        return self.index
+
+    def characters(self):
+        return list(self._get_index())
+
+    def stages(self, character):
+        """Stages the character has sprites for, e.g. ["adult", "dead", "egg", "small"]."""
+        return list(self._get_index().get(character, {}))
+
+    def get(self, character, stage):
+        """
+        The frames of a character at a life stage, decoded on first use.
+
+        Returns:
+            list: RGBImage frames; the same list object on every call.
+        """
+        folder = self._get_index().get(character, {}).get(stage)
+        if folder is None:
+            raise ValueError(f"No sprites found for {character} at stage {stage}")
+        return self.load(folder)
+
+    def load(self, folder_path):
+        """
+        The frames of any sprite folder, decoded on first use and kept.
+        """
+        folder_path = os.path.normpath(folder_path)
+        with self.lock:
+            sprites = self.sets.get(folder_path)
+            if sprites is not None:
+                self.hits += 1
+                return sprites
+
+        sprites = decode_sprite_set(folder_path)
+        with self.lock:
+            self.loads += 1
+            return self.sets.setdefault(folder_path, sprites)
+
+    def preload(self, character):
+        """Decode every stage of a character, e.g. from a background thread."""
+        for stage in self.stages(character):
+            self.get(character, stage)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "characters": len(self.index) if self.index is not None else 0,
+                "resident_sets": len(self.sets),
+                "bytes": sum(sprite.nbytes for sprites in self.sets.values() for sprite in sprites),
+                "loads": self.loads,
+                "hits": self.hits,
+            }
+
+
+# Shared by every Graphics instance in the process.
+sprite_sets = SpriteSetStore()
@@ -0,0 +1,163 @@
+import numpy as np
+from PIL import Image
+from utils.sprite_cache import SpriteCache
+
+SCALE_STEPS = 16   # scale factors snap to multiples of 1/16
+FADE_STEPS = 10    # opacities snap to multiples of 0.1
+DEFAULT_VARIANT_BUDGET_BYTES = 512 * 1024
+
+
+def quantize(value, steps, minimum=None):
+    """
+    Snap a continuous value to the nearest of `steps` steps per unit.
+
+    Args:
+        value (float): Value to snap.
+        steps (int): Number of steps per 1.0.
+        minimum (float): Smallest value to return, defaults to one step.
+
+    Returns:
+        float: The snapped value.
+    """
+    if minimum is None:
+        minimum = 1.0 / steps
+    return max(minimum, round(value * steps) / steps)
+
+
+def scaled_size(sprite_width, sprite_height, scale_x=1.0, scale_y=1.0):
+    """
+    Size in pixels of a sprite variant once its scale factors are quantized.
+
+    Returns:
+        tuple: (width, height), each at least one pixel.
+    """
+    width = max(1, int(sprite_width * quantize(scale_x, SCALE_STEPS)))
+    height = max(1, int(sprite_height * quantize(scale_y, SCALE_STEPS)))
+    return width, height
+
+
+def fade(pixels, opacity):
+    """
+    Blend pixels towards black, exactly like decode_sprite's Image.blend.
+    """
+    img = Image.fromarray(pixels, "RGB")
+    black_img = Image.new("RGB", img.size, (0, 0, 0))
+    return np.asarray(Image.blend(black_img, img, opacity), dtype=np.uint8)
+
+
+def tint(pixels, color):
+    """
+    Multiply every channel by a tint colour (white leaves the sprite unchanged).
+    """
+    factors = np.array(color[:3], dtype=np.uint16)
+    return ((pixels.astype(np.uint16) * factors + 127) // 255).astype(np.uint8)
+
+
+class SpriteVariantStore(SpriteCache):
+    """
+    LRU store of transformed sprites: scaled, flipped, tinted and faded variants.
+
+    Animations that shrink, wiggle or fade a sprite ask for a slightly
+    different variant every frame. Scale and opacity are snapped to a small
+    set of steps, so those requests collapse onto a handful of variants that
+    are built once and then reused, instead of resampling and blending the
+    image live. Each PNG is decoded once, at its native size, and every
+    variant is derived from that array; the disk is never read again.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_VARIANT_BUDGET_BYTES):
+        super().__init__(max_bytes)
+        self.sources = {}  # path -> native-size HxWx4 RGBA array, see _source
+
+    def get(self, sprite_path, sprite_width, sprite_height, scale_x=1.0, scale_y=1.0,
+            opacity=1.0, flip_x=False, flip_y=False, tint_color=None):
+        """
+        Return (pixels, mask) for the nearest precomputed variant of a sprite.
+
+        Args:
+            sprite_path (str): Path to the sprite file.
+            sprite_width (int): Width of the untransformed sprite.
+            sprite_height (int): Height of the untransformed sprite.
+            scale_x (float): Horizontal scale factor.
+            scale_y (float): Vertical scale factor.
+            opacity (float): Opacity multiplier (1.0 = full opacity, 0.0 = fully dark).
+            flip_x (bool): Mirror left to right.
+            flip_y (bool): Mirror top to bottom.
+            tint_color (tuple): RGB colour to multiply the sprite by, or None.
+
+        Returns:
+            tuple: (HxWx3 uint8 pixels, HxW bool mask of non-black pixels).
+        """
+        width, height = scaled_size(sprite_width, sprite_height, scale_x, scale_y)
+        opacity = quantize(opacity, FADE_STEPS, minimum=0.0)
+        tint_color = tuple(tint_color[:3]) if tint_color is not None else None
+        key = (sprite_path, width, height, opacity, bool(flip_x), bool(flip_y), tint_color)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        sprite = self._build(sprite_path, width, height, opacity, flip_x, flip_y, tint_color)
+        self._store(key, sprite)
+        return sprite
+
+    def _source(self, sprite_path):
+        with self.lock:
+            source = self.sources.get(sprite_path)
+        if source is None:
+            source = np.asarray(Image.open(sprite_path).convert("RGBA"), dtype=np.uint8)
+            with self.lock:
+                source = self.sources.setdefault(sprite_path, source)
+        return source
+
+    def _build(self, sprite_path, width, height, opacity, flip_x, flip_y, tint_color):
+        # Resampled the same way decode_sprite does it from the file.
+        img = Image.fromarray(self._source(sprite_path), "RGBA").resize((width, height))
+        pixels = np.asarray(img.convert("RGB"), dtype=np.uint8)
+        if flip_x:
+            pixels = pixels[:, ::-1]
+        if flip_y:
+            pixels = pixels[::-1]
+        if tint_color is not None:
+            pixels = tint(pixels, tint_color)
+        if opacity < 1.0:
+            pixels = fade(pixels, opacity)
+        pixels = np.ascontiguousarray(pixels)
+        mask = pixels.any(axis=2)  # Pure black pixels are transparent
+        return pixels, mask
+
+    def clear(self):
+        super().clear()
+        with self.lock:
+            self.sources.clear()
+
+    def stats(self):
+        """
+        Snapshot of the cache counters, plus the decoded source images.
+        """
+        stats = super().stats()
+        with self.lock:
+            stats["sources"] = len(self.sources)
+            stats["source_bytes"] = sum(source.nbytes for source in self.sources.values())
+        return stats
+
+    def warm(self, sprite_path, sprite_width, sprite_height, scales=(), opacities=(), **transform):
+        """
+        Build a family of variants ahead of time, e.g. every step of a shrink animation.
+
+        Args:
+            scales (iterable): (scale_x, scale_y) pairs to precompute.
+            opacities (iterable): Opacities to precompute at full scale.
+            **transform: Flip/tint arguments applied to every variant.
+        """
+        for scale_x, scale_y in scales:
+            self.get(sprite_path, sprite_width, sprite_height, scale_x, scale_y, **transform)
+        for opacity in opacities:
+            self.get(sprite_path, sprite_width, sprite_height, opacity=opacity, **transform)
+
+
+# Shared by every Graphics instance in the process.
+sprite_variants = SpriteVariantStore()
@@ -0,0 +1,128 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+DEFAULT_STRING_CACHE_SIZE = 256  # rendered strings kept resident
+
+
+class GlyphAtlas:
+    """
+    Rasterized glyphs for one (font, size).
+
+    Each glyph is rendered once into a coverage mask together with its
+    bearing offset and advance, and strings are then assembled by placing
+    glyph masks along the pen position instead of going through FreeType.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.glyphs = {}
+
+    def glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            mask, offset = self.font.getmask2(char, mode="L")
+            width, height = mask.size
+            coverage = np.asarray(mask, dtype=np.uint8).reshape(height, width)
+            glyph = (coverage, offset, self.font.getlength(char))
+            self.glyphs[char] = glyph
+        return glyph
+
+    def render(self, text, width, height):
+        """
+        Render a single line of text into a width x height coverage mask.
+        """
+        out = np.zeros((height, width), dtype=np.uint8)
+        pen_x = 0.0
+        for char in text:
+            coverage, (offset_x, offset_y), advance = self.glyph(char)
+            x = int(pen_x) + offset_x
+            y = offset_y
+            glyph_height, glyph_width = coverage.shape
+            x0, y0 = max(x, 0), max(y, 0)
+            x1, y1 = min(x + glyph_width, width), min(y + glyph_height, height)
+            if x0 < x1 and y0 < y1:
+                target = out[y0:y1, x0:x1]
+                source = coverage[y0 - y:y1 - y, x0 - x:x1 - x]
+                target[:] = _over(target, source)
+            pen_x += advance
+        return out
+
+
+def _over(target, source):
+    """
+    Composite overlapping glyph coverage the way FreeType/PIL does.
+    """
+    target = target.astype(np.uint32)
+    source = source.astype(np.uint32)
+    return (source + (target * (255 - source) + 127) // 255).astype(np.uint8)
+
+
+class TextEngine:
+    """
+    Loads each (font, size) once and caches rendered strings as coverage masks.
+
+    Masks are HxW uint8 arrays (0 = background, 255 = fully lit) and are
+    shared between callers, so they are returned read-only.
+    """
+
+    def __init__(self, max_strings=DEFAULT_STRING_CACHE_SIZE):
+        self.max_strings = max_strings
+        self.fonts = {}
+        self.atlases = {}
+        self.strings = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_font(self, font_path, font_size):
+        key = (font_path, font_size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = ImageFont.truetype(font_path, font_size)
+            self.fonts[key] = font
+            self.atlases[key] = GlyphAtlas(font)
+        return font
+
+    def render(self, text, font_path, font_size, width, height):
+        """
+        Return the coverage mask for text drawn at (0, 0) in a width x height box.
+        """
+        key = (text, font_path, font_size, width, height)
+        with self.lock:
+            mask = self.strings.get(key)
+            if mask is not None:
+                self.strings.move_to_end(key)
+                self.hits += 1
+                return mask
+            self.misses += 1
+
+            font = self.get_font(font_path, font_size)
+            if "\n" in text:
+                # Multiline layout (line spacing, alignment) is left to PIL.
+                img = Image.new("L", (width, height), 0)
+                ImageDraw.Draw(img).text((0, 0), text, font=font, fill=255)
+                mask = np.asarray(img, dtype=np.uint8)
+            else:
+                mask = self.atlases[(font_path, font_size)].render(text, width, height)
+            mask.flags.writeable = False
+
+            self.strings[key] = mask
+            while len(self.strings) > self.max_strings:
+                self.strings.popitem(last=False)
+            return mask
+
+    def stats(self):
+        with self.lock:
+            return {
+                "fonts": len(self.fonts),
+                "glyphs": sum(len(atlas.glyphs) for atlas in self.atlases.values()),
+                "strings": len(self.strings),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared by every caller in the process.
+text_engine = TextEngine()
@@ -1,8 +1,28 @@
-from PIL import Image, ImageDraw, ImageFont
+from utils.text_engine import text_engine
+from utils.rgb_image import RGBImage
+
+def text_to_mask(text, font_path, font_size, width, height):
+    """
+    Render text into a coverage mask using the shared text engine.
+
+    Args:
+        text (str): The text to render.
+        font_path (str): Path to the font file.
+        font_size (int): Font size to use for rendering.
+        width (int): The width of the output mask.
+        height (int): The height of the output mask.
+
+    Returns:
+        numpy.ndarray: Read-only HxW uint8 mask, 0 where nothing is drawn.
+    """
+    return text_engine.render(text, font_path, font_size, width, height)
 
 def text_to_matrix(text, font_path, font_size, width, height, color = "white"):
     """
-    Convert text into an RGB matrix.
+    Convert text into a grey-level RGB image.
+
+    Kept for callers that index it like the old nested lists (image[y][x]);
+    new code should use text_to_mask.
 
     Args:
         text (str): The text to render.
@@ -12,19 +32,9 @@ def text_to_matrix(text, font_path, font_size, width, height, color = "white"):
         height (int): The height of the output matrix.
 
     Returns:
-        list: An RGB matrix representing the text.
+        RGBImage: The text, white on black.
     """
-    font = ImageFont.truetype(font_path, font_size)
-    img = Image.new("RGB", (width, height), "black")
-    draw = ImageDraw.Draw(img)
-    draw.text((0, 0), text, font=font, fill="white")
-
-    # Convert image to matrix
-    matrix = [
-        [img.getpixel((x, y)) for x in range(width)]
-        for y in range(height)
-    ]
-    return matrix
+    return RGBImage.from_mask(text_to_mask(text, font_path, font_size, width, height))
 
 def split_text_to_lines(text, max_chars_per_line=8):
     """